@@ -3,13 +3,13 @@
 Transfer vertex colors from dense point cloud to mesh
 """
 
+import logging
 import sys
 import numpy as np
 from pathlib import Path
 from scipy.spatial import cKDTree
 
-backend_path = Path(__file__).parent
-sys.path.insert(0, str(backend_path))
+logger = logging.getLogger(__name__)
 
 def transfer_colors_to_mesh(mesh_path, point_cloud_path, output_path):
     """
@@ -24,12 +24,12 @@ def transfer_colors_to_mesh(mesh_path, point_cloud_path, output_path):
         from plyfile import PlyData
         import trimesh
 
-        print(f"📥 Loading mesh: {mesh_path.name}")
+        logger.info(f"📥 Loading mesh: {mesh_path.name}")
         mesh = trimesh.load(str(mesh_path))
-        print(f"   Vertices: {len(mesh.vertices):,}")
-        print(f"   Faces: {len(mesh.faces):,}")
+        logger.info(f"   Vertices: {len(mesh.vertices):,}")
+        logger.info(f"   Faces: {len(mesh.faces):,}")
 
-        print(f"\n📥 Loading dense point cloud: {point_cloud_path.name}")
+        logger.info(f"📥 Loading dense point cloud: {point_cloud_path.name}")
         plydata = PlyData.read(str(point_cloud_path))
         vertex = plydata['vertex']
 
@@ -37,16 +37,16 @@ def transfer_colors_to_mesh(mesh_path, point_cloud_path, output_path):
         pc_positions = np.vstack([vertex['x'], vertex['y'], vertex['z']]).T
         pc_colors = np.vstack([vertex['red'], vertex['green'], vertex['blue']]).T
 
-        print(f"   Points: {len(pc_positions):,}")
-        print(f"   Has colors: {pc_colors.shape}")
+        logger.info(f"   Points: {len(pc_positions):,}")
+        logger.info(f"   Has colors: {pc_colors.shape}")
 
         # Build KD-tree for nearest neighbor search
-        print(f"\n🔍 Building KD-tree for color transfer...")
+        logger.info("🔍 Building KD-tree for color transfer...")
         tree = cKDTree(pc_positions)
 
         # Find nearest point cloud point for each mesh vertex
-        print(f"🎨 Transferring colors to mesh vertices...")
-        distances, indices = tree.query(mesh.vertices, k=1)
+        logger.info("🎨 Transferring colors to mesh vertices...")
+        distances, indices = tree.query(mesh.vertices, k=1, workers=-1)
 
         # Transfer colors
         vertex_colors = pc_colors[indices]
@@ -60,25 +60,26 @@ def transfer_colors_to_mesh(mesh_path, point_cloud_path, output_path):
         # Assign to mesh
         mesh.visual.vertex_colors = vertex_colors_rgba
 
-        print(f"\n💾 Saving colored mesh: {output_path.name}")
+        logger.info(f"💾 Saving colored mesh: {output_path.name}")
         mesh.export(str(output_path))
 
-        print(f"✅ Success! Mesh now has vertex colors")
-        print(f"   Average transfer distance: {np.mean(distances):.4f}")
-        print(f"   Max transfer distance: {np.max(distances):.4f}")
+        logger.info("✅ Success! Mesh now has vertex colors")
+        logger.info(f"   Average transfer distance: {np.mean(distances):.4f}")
+        logger.info(f"   Max transfer distance: {np.max(distances):.4f}")
 
         return True
 
     except Exception as e:
-        print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"❌ Color transfer failed: {e}")
         return False
 
 
 if __name__ == "__main__":
     import argparse
 
+    sys.path.insert(0, str(Path(__file__).parent))
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     parser = argparse.ArgumentParser(description="Transfer vertex colors from dense point cloud to mesh")
     parser.add_argument("mesh_path", help="Input mesh PLY file (without colors)")
     parser.add_argument("point_cloud_path", help="Dense point cloud PLY file (with colors)")
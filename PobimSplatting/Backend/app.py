@@ -40,6 +40,7 @@ except ModuleNotFoundError as exc:  # pragma: no cover - guidance for misconfigu
 
 from PobimSplatting.Backend.core import config as app_config
 from PobimSplatting.Backend.core.config import create_flask_app, ensure_runtime_directories
+from PobimSplatting.Backend.core.files import purge_staged_deletions
 from PobimSplatting.Backend.core.projects import (
     emit_log_message,
     emit_stage_progress,
@@ -64,6 +65,9 @@ app = create_flask_app()
 CORS(app, resources=app_config.CORS_RESOURCES)
 
 ensure_runtime_directories()
+purge_staged_deletions(
+    (app_config.UPLOAD_FOLDER, app_config.FRAMES_FOLDER, app_config.RESULTS_FOLDER)
+)
 load_projects_db()
 
 socketio = init_socketio(app)
@@ -5,13 +5,41 @@ Utility helpers for launching subprocesses with streaming logs.
 from __future__ import annotations
 
 import os
+import re
 import subprocess
 import threading
 from pathlib import Path
-from typing import Callable, Iterable, Optional
+from typing import Callable, Iterable, Iterator, Optional
 
 from .projects import append_log_line, register_process, unregister_process
 
+# Read child output in large chunks and split lines ourselves instead of
+# paying a text-decoder round trip for every line of chatty native tools.
+STDOUT_READ_CHUNK_SIZE = 64 * 1024
+_LINE_BREAK_RE = re.compile(rb"\r\n|\r|\n")
+
+
+def _iter_output_lines(fd: int) -> Iterator[str]:
+    """Yield decoded lines from a raw pipe, honouring \\n, \\r\\n and bare \\r."""
+    pending = b""
+    while True:
+        chunk = os.read(fd, STDOUT_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        data = pending + chunk
+        # Hold back a trailing CR so a CRLF split across reads stays one break.
+        held = b""
+        if data.endswith(b"\r"):
+            data, held = data[:-1], b"\r"
+        *lines, tail = _LINE_BREAK_RE.split(data)
+        pending = tail + held
+        for raw_line in lines:
+            yield raw_line.decode("utf-8", "replace")
+
+    pending = pending.rstrip(b"\r")
+    if pending:
+        yield pending.decode("utf-8", "replace")
+
 
 def run_command_with_logs(
     project_id: str,
@@ -46,8 +74,7 @@ def run_command_with_logs(
         list(cmd),
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1,
+        bufsize=0,
         cwd=str(cwd) if cwd else None,
         env=env,
     )
@@ -73,9 +100,7 @@ def run_command_with_logs(
     assert process.stdout is not None
 
     try:
-        for raw_line in process.stdout:
-            line = raw_line.rstrip("\n")
-
+        for line in _iter_output_lines(process.stdout.fileno()):
             if line_handler:
                 try:
                     line_handler(line)
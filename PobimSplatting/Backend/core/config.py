@@ -15,6 +15,12 @@ from pathlib import Path
 from typing import Dict, Iterable
 
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -37,6 +43,18 @@ NEXT_PUBLIC_DIR: Path = FRONTEND_ROOT / "public"
 
 DEFAULT_SECRET_KEY = "pobim-splats-secret-key"
 MAX_CONTENT_LENGTH = 5 * 1024 * 1024 * 1024  # 5GB
+# Pipelines beyond this limit wait for a free slot instead of competing for the GPU.
+MAX_CONCURRENT_PIPELINES = max(
+    1, int(os.getenv("MAX_CONCURRENT_PIPELINES", max(1, (os.cpu_count() or 2) // 2)))
+)
+# Textured mesh exports run dense COLMAP; extra requests queue behind these slots.
+MAX_CONCURRENT_MESH_EXPORTS = max(1, int(os.getenv("MAX_CONCURRENT_MESH_EXPORTS", 1)))
+# Per-project mesh export cache; least recently used entries are pruned past this size.
+MESH_CACHE_MAX_BYTES = max(0, int(os.getenv("MESH_CACHE_MAX_BYTES", 1 << 30)))
+# When enabled, result PLYs are handed to the reverse proxy via X-Accel-Redirect.
+# nginx must map X_ACCEL_RESULTS_PREFIX to RESULTS_FOLDER as an `internal;` location.
+USE_X_SENDFILE = os.getenv("USE_X_SENDFILE", "").strip().lower() in {"1", "true", "yes", "on"}
+X_ACCEL_RESULTS_PREFIX = os.getenv("X_ACCEL_RESULTS_PREFIX", "/internal/results").rstrip("/")
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +77,45 @@ def _resolve_env_path(env_value: str | None) -> Path | None:
     return Path(env_value).expanduser().resolve()
 
 
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that skips key sorting and encodes with orjson when installed."""
+
+    sort_keys = False
+
+    def __init__(self, app: Flask) -> None:
+        super().__init__(app)
+        # Our own reference, so response() does not depend on Flask's private _app
+        self.flask_app = app
+
+    def _orjson_dumps(self, obj) -> bytes:
+        # Datetimes go through self.default so they keep Flask's HTTP-date format.
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Explicit json.dumps options keep the stdlib path.
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._orjson_dumps(obj).decode("utf-8")
+
+    def response(self, *args, **kwargs):
+        pretty = (self.compact is None and self.flask_app.debug) or self.compact is False
+        if orjson is None or pretty:
+            return super().response(*args, **kwargs)
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        if not args and not kwargs:
+            obj = None
+        else:
+            obj = args[0] if len(args) == 1 else args or kwargs
+        return self.flask_app.response_class(
+            self._orjson_dumps(obj) + b"\n", mimetype=self.mimetype
+        )
+
+
 def create_flask_app() -> Flask:
     """
     Create the Flask application instance with static configuration applied.
@@ -78,6 +135,7 @@ def create_flask_app() -> Flask:
             NEXT_STATIC_DIR,
         )
 
+    app.json = FastJSONProvider(app)
     app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", DEFAULT_SECRET_KEY)
     app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH
     return app
@@ -107,6 +165,8 @@ VOCAB_TREE_FOLDER: Path = BACKEND_ROOT / "vocab_trees"
 VOCAB_TREE_CACHE_FOLDER: Path = VOCAB_TREE_FOLDER / "cache"
 PROJECTS_DB_FILE: Path = BACKEND_ROOT / "projects_db.json"
 AUTO_TUNING_DIR: Path = RUNTIME_ROOT / "auto_tuning"
+# Lives inside each project's results directory, so deleting the project drops it.
+MESH_CACHE_DIRNAME = ".mesh_cache"
 ORDERED_VIDEO_EVIDENCE_FILE: Path = AUTO_TUNING_DIR / "ordered_video_evidence.json"
 ORDERED_VIDEO_TUNED_SNAPSHOT_FILE: Path = AUTO_TUNING_DIR / "ordered_video_tuned_snapshot.json"
 ORDERED_VIDEO_STABLE_SNAPSHOT_FILE: Path = AUTO_TUNING_DIR / "ordered_video_stable_snapshot.json"
@@ -4,15 +4,26 @@ File and directory helper utilities.
 
 from __future__ import annotations
 
+import logging
 import os
+import queue
 import re
+import shutil
+import threading
+import time
 import unicodedata
 import uuid
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Iterable, Optional
 
 from . import config
 
+logger = logging.getLogger(__name__)
+
+# Werkzeug's FileStorage.save() copies in 16 KiB pieces; multi-GB videos
+# stream far faster in 1 MiB chunks.
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 def allowed_file(filename: str) -> bool:
     """Check if file extension is allowed."""
@@ -73,3 +84,72 @@ def setup_project_directories(project_id: str) -> Dict[str, Path]:
             path.mkdir(parents=True, exist_ok=True)
 
     return paths
+
+
+def save_upload(file_storage: Any, destination: Path) -> None:
+    """Stream an uploaded file to ``destination`` in large chunks."""
+    with open(destination, "wb") as handle:
+        shutil.copyfileobj(file_storage.stream, handle, UPLOAD_COPY_CHUNK_SIZE)
+
+
+# ---------------------------------------------------------------------------
+# Background deletion
+# ---------------------------------------------------------------------------
+
+# Directories renamed aside for deletion carry this marker in their name.
+STAGED_DELETION_MARKER = ".deleted."
+
+_pending_deletions: "queue.Queue[Path]" = queue.Queue()
+_deletion_worker_lock = threading.Lock()
+_deletion_worker: Optional[threading.Thread] = None
+
+
+def _deletion_worker_loop() -> None:
+    while True:
+        path = _pending_deletions.get()
+        shutil.rmtree(path, ignore_errors=True)
+        if path.exists():
+            logger.warning("Could not fully delete staged directory %s", path)
+
+
+def _queue_deletion(path: Path) -> None:
+    global _deletion_worker
+    if _deletion_worker is None:
+        with _deletion_worker_lock:
+            if _deletion_worker is None:
+                _deletion_worker = threading.Thread(
+                    target=_deletion_worker_loop,
+                    name="project-deleter",
+                    daemon=True,
+                )
+                _deletion_worker.start()
+    _pending_deletions.put(path)
+
+
+def remove_tree_in_background(path: Path) -> None:
+    """Rename ``path`` aside immediately and delete it on a worker thread."""
+    staged = path.with_name(f"{path.name}{STAGED_DELETION_MARKER}{time.time_ns()}")
+    try:
+        path.rename(staged)
+    except FileNotFoundError:
+        return
+    _queue_deletion(staged)
+
+
+def purge_staged_deletions(roots: Iterable[Path]) -> int:
+    """Queue directories left staged by an interrupted run; returns the count."""
+    queued = 0
+    for root in roots:
+        try:
+            with os.scandir(root) as entries:
+                staged = [
+                    Path(entry.path)
+                    for entry in entries
+                    if STAGED_DELETION_MARKER in entry.name and entry.is_dir(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            continue
+        for path in staged:
+            _queue_deletion(path)
+            queued += 1
+    return queued
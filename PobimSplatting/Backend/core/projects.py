@@ -8,11 +8,18 @@ remains usable even when WebSocket support is unavailable.
 
 from __future__ import annotations
 
+import atexit
+import bisect
+import hashlib
 import json
 import logging
+import os
+import queue
 import threading
+import time
 from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, Optional
 
@@ -27,6 +34,9 @@ logger = logging.getLogger(__name__)
 processing_status: Dict[str, Dict[str, Any]] = {}
 status_lock = threading.RLock()
 
+# (start_time, project_id) pairs kept in ascending order; newest projects last
+_project_recency_index: list[tuple[str, str]] = []
+
 # Store active process handles for cancellation
 active_processes: Dict[str, Any] = {}
 
@@ -78,17 +88,101 @@ def load_projects_db() -> None:
             processing_status = {}
     else:
         processing_status = {}
+    _rebuild_project_recency_index()
+
+
+_projects_db_write_lock = threading.Lock()
+# Digest of the last payload written, so unchanged snapshots skip the disk.
+_last_saved_digest: Optional[bytes] = None
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, deque):
+        return list(value)
+    return str(value)
+
+
+def _serialize_projects_snapshot() -> str:
+    """Serialise the project database under ``status_lock``."""
+    with status_lock:
+        return json.dumps(processing_status, indent=2, default=_json_default)
+
+
+def _write_projects_snapshot(payload: str) -> None:
+    """Atomically replace the on-disk database; no lock is held here."""
+    database_path = config.PROJECTS_DB_FILE
+    temp_path = database_path.with_name(f"{database_path.name}.tmp")
+    with temp_path.open("w", encoding="utf-8") as handle:
+        handle.write(payload)
+    os.replace(temp_path, database_path)
 
 
 def save_projects_db() -> None:
-    """Persist the in-memory project database to disk."""
+    """Persist the in-memory project database to disk.
+
+    Only serialisation happens under ``status_lock``; callers should mutate
+    state inside the lock and call this after releasing it.
+    """
+    global _last_saved_digest
     try:
-        with config.PROJECTS_DB_FILE.open("w", encoding="utf-8") as handle:
-            json.dump(processing_status, handle, indent=2, default=str)
+        # Serialise and write as one step so an older snapshot can never
+        # replace a newer one; status_lock is only held while serialising.
+        with _projects_db_write_lock:
+            payload = _serialize_projects_snapshot()
+            digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
+            if digest == _last_saved_digest:
+                return
+            _write_projects_snapshot(payload)
+            _last_saved_digest = digest
     except Exception as exc:
         logger.error("Failed to save projects database: %s", exc)
 
 
+PROJECTS_DB_SAVE_DELAY = 0.5
+
+# A single pending slot: save requests made while one is queued collapse into it.
+_save_requests: "queue.Queue[bool]" = queue.Queue(maxsize=1)
+_save_writer_lock = threading.Lock()
+_save_writer: Optional[threading.Thread] = None
+
+
+def _projects_db_writer_loop() -> None:
+    """Drain coalesced save requests, writing at most once per delay window."""
+    while True:
+        _save_requests.get()
+        time.sleep(PROJECTS_DB_SAVE_DELAY)
+        try:
+            _save_requests.get_nowait()
+        except queue.Empty:
+            pass
+        save_projects_db()
+
+
+def request_projects_db_save() -> None:
+    """Schedule a background save of the project database without blocking."""
+    global _save_writer
+    if _save_writer is None:
+        with _save_writer_lock:
+            if _save_writer is None:
+                _save_writer = threading.Thread(
+                    target=_projects_db_writer_loop,
+                    name="projects-db-writer",
+                    daemon=True,
+                )
+                _save_writer.start()
+    try:
+        _save_requests.put_nowait(True)
+    except queue.Full:
+        pass
+
+
+@atexit.register
+def _flush_projects_db_on_exit() -> None:
+    """Write any pending state synchronously before the interpreter exits."""
+    if _save_writer is not None:
+        save_projects_db()
+
+
 # ----------------------------------------------------------------------------
 # State helpers
 # ----------------------------------------------------------------------------
@@ -147,7 +241,7 @@ def update_reconstruction_framework(project_id: str, updates: Dict[str, Any]) ->
         framework = project.setdefault("reconstruction_framework", {})
         framework.update(updates)
         touch_project_updated(project_id)
-        save_projects_db()
+    request_projects_db_save()
 
 
 def update_resource_coordination(project_id: str, updates: Dict[str, Any]) -> None:
@@ -160,7 +254,7 @@ def update_resource_coordination(project_id: str, updates: Dict[str, Any]) -> No
         coordination = project.setdefault("resource_coordination", {})
         coordination.update(updates)
         touch_project_updated(project_id)
-        save_projects_db()
+    request_projects_db_save()
 
 
 def get_active_projects_snapshot(*, exclude_project_id: Optional[str] = None) -> list[Dict[str, Any]]:
@@ -191,6 +285,30 @@ def get_active_projects_snapshot(*, exclude_project_id: Optional[str] = None) ->
         return snapshot
 
 
+def get_project_snapshot(
+    project_id: str, *, exclude: Iterable[str] = ()
+) -> Optional[Dict[str, Any]]:
+    """Return a copy of one project entry that is safe to serialise unlocked.
+
+    Top-level containers are copied too, so appends from the pipeline thread
+    cannot change them while the caller is emitting the snapshot.  Keys in
+    ``exclude`` are skipped without being copied.
+    """
+    with status_lock:
+        project = processing_status.get(project_id)
+        if project is None:
+            return None
+        return {
+            key: (
+                value.copy()
+                if isinstance(value, (dict, list))
+                else list(value) if isinstance(value, deque) else value
+            )
+            for key, value in project.items()
+            if key not in exclude
+        }
+
+
 def update_state(
     project_id: str,
     key: str,
@@ -220,6 +338,11 @@ def update_state(
         _emit_stage_progress(project_id, key, progress, details)
 
 
+def new_log_tail(entries: Iterable[Any] = ()) -> deque:
+    """Return the bounded in-memory log tail stored on each project entry."""
+    return deque(entries, maxlen=config.MAX_LOG_LINES_IN_RESPONSE)
+
+
 def append_log_line(project_id: str, message: str) -> None:
     """Append a log line to the on-disk log and keep a short in-memory tail."""
     timestamp = datetime.now().isoformat()
@@ -231,11 +354,13 @@ def append_log_line(project_id: str, message: str) -> None:
             return
         log_path = Path(status["log_file"])
 
-        log_tail = status.setdefault("log_tail", [])
+        log_tail = status.get("log_tail")
+        if not isinstance(log_tail, deque):
+            # Entries loaded from projects_db.json carry a plain list.
+            log_tail = status["log_tail"] = new_log_tail(log_tail or ())
+        previous_count = status.get("log_line_count", len(log_tail))
         log_tail.append({"time": timestamp, "message": message})
-        status["log_line_count"] = int(status.get("log_line_count", len(log_tail) - 1)) + 1
-        if len(log_tail) > config.MAX_LOG_LINES_IN_RESPONSE:
-            del log_tail[:-config.MAX_LOG_LINES_IN_RESPONSE]
+        status["log_line_count"] = int(previous_count) + 1
 
     try:
         with log_path.open("a", encoding="utf-8") as log_file:
@@ -258,13 +383,15 @@ def get_recent_log_lines(
         if not status:
             return [], 0
         log_path = Path(status["log_file"])
-        log_tail = list(status.get("log_tail", []))
-        total_count = int(status.get("log_line_count", len(log_tail)))
+        stored_tail = status.get("log_tail") or ()
+        total_count = int(status.get("log_line_count", len(stored_tail)))
+        # Copy only the newest max_lines entries rather than the whole tail.
+        log_tail = list(islice(reversed(stored_tail), max_lines))
+        log_tail.reverse()
 
     if log_tail:
-        visible_tail = log_tail[-max_lines:]
         lines = []
-        for entry in visible_tail:
+        for entry in log_tail:
             if isinstance(entry, str):
                 lines.append(entry)
                 continue
@@ -327,7 +454,7 @@ def initialize_project_entry(
         "metadata": metadata,
         "progress_states": list(make_progress_states()),
         "log_file": str(log_file),
-        "log_tail": [],
+        "log_tail": new_log_tail(),
         "log_line_count": 0,
         "input_type": input_type,
         "stage_details": {},
@@ -336,6 +463,56 @@ def initialize_project_entry(
     }
 
 
+def _project_recency_key(project_id: str, project: Dict[str, Any]) -> tuple[str, str]:
+    return (project.get("start_time") or "", project_id)
+
+
+def _rebuild_project_recency_index() -> None:
+    with status_lock:
+        _project_recency_index[:] = sorted(
+            _project_recency_key(pid, data) for pid, data in processing_status.items()
+        )
+
+
+def add_project(project_id: str, entry: Dict[str, Any]) -> None:
+    """Register a new project entry and index it by creation time."""
+    with status_lock:
+        previous = processing_status.get(project_id)
+        if previous is not None:
+            _discard_from_recency_index(project_id, previous)
+        processing_status[project_id] = entry
+        bisect.insort(_project_recency_index, _project_recency_key(project_id, entry))
+
+
+def remove_project(project_id: str) -> Optional[Dict[str, Any]]:
+    """Drop a project entry and its index slot; returns the removed entry."""
+    with status_lock:
+        entry = processing_status.pop(project_id, None)
+        if entry is not None:
+            _discard_from_recency_index(project_id, entry)
+        return entry
+
+
+def _discard_from_recency_index(project_id: str, entry: Dict[str, Any]) -> None:
+    key = _project_recency_key(project_id, entry)
+    position = bisect.bisect_left(_project_recency_index, key)
+    if position < len(_project_recency_index) and _project_recency_index[position] == key:
+        del _project_recency_index[position]
+    else:
+        _rebuild_project_recency_index()
+
+
+def get_project_ids_by_recency(limit: Optional[int] = None) -> list[str]:
+    """Return project ids newest first, optionally truncated to ``limit``."""
+    with status_lock:
+        if len(_project_recency_index) != len(processing_status):
+            _rebuild_project_recency_index()
+        newest_first = reversed(_project_recency_index)
+        if limit is not None:
+            newest_first = islice(newest_first, limit)
+        return [project_id for _, project_id in newest_first]
+
+
 def touch_project_updated(project_id: str) -> None:
     """Update the metadata timestamp for last modification."""
     processing_status[project_id]["metadata"]["updated_at"] = datetime.now().isoformat()
@@ -404,7 +581,7 @@ def _mark_project_cancelled(project_id: str, *, reason: Optional[str] = None) ->
                 state["status"] = "cancelled"
                 state["completed_at"] = timestamp
 
-        save_projects_db()
+    save_projects_db()
 
     append_log_line(project_id, message)
     return True
@@ -420,6 +597,9 @@ def cancel_processing(project_id: str) -> bool:
         project_state = processing_status.get(project_id)
 
     if not process:
+        if project_state and project_state.get("status") == "queued":
+            return _mark_project_cancelled(project_id, reason="before it started")
+
         if project_state and project_state.get("status") == "processing":
             logger.warning(
                 "No active process found for project %s; falling back to stale state reset",
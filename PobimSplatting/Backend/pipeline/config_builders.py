@@ -18,6 +18,7 @@ from .orbit_policy import (
     sync_reconstruction_framework,
 )
 from .runtime_support import (
+    count_image_files,
     estimate_gpu_safe_match_limit,
     get_gpu_total_vram_mb,
     get_vocab_tree_matcher_params,
@@ -1402,6 +1403,24 @@ def get_colmap_config(
     }
 
 
+# Custom-mode training overrides accepted from the request, with their types.
+OPENSPLAT_CUSTOM_PARAM_TYPES = (
+    ("iterations", int),
+    ("densify_grad_threshold", float),
+    ("refine_every", int),
+    ("warmup_length", int),
+    ("ssim_weight", float),
+    ("learning_rate", float),
+    ("position_lr_init", float),
+    ("position_lr_final", float),
+    ("feature_lr", float),
+    ("opacity_lr", float),
+    ("scaling_lr", float),
+    ("rotation_lr", float),
+    ("percent_dense", float),
+)
+
+
 def get_opensplat_config(quality_mode="balanced", num_images=100, custom_params=None):
     """Get OpenSplat training configuration based on quality requirements and dataset size."""
 
@@ -1497,55 +1516,13 @@ def get_opensplat_config(quality_mode="balanced", num_images=100, custom_params=
         )
 
     if custom_params and quality_mode == "custom":
-        if "iterations" in custom_params and custom_params["iterations"] is not None:
-            base_config["iterations"] = int(custom_params["iterations"])
-        if (
-            "densify_grad_threshold" in custom_params
-            and custom_params["densify_grad_threshold"] is not None
-        ):
-            base_config["densify_grad_threshold"] = float(
-                custom_params["densify_grad_threshold"]
-            )
-        if (
-            "refine_every" in custom_params
-            and custom_params["refine_every"] is not None
-        ):
-            base_config["refine_every"] = int(custom_params["refine_every"])
-        if (
-            "warmup_length" in custom_params
-            and custom_params["warmup_length"] is not None
-        ):
-            base_config["warmup_length"] = int(custom_params["warmup_length"])
-        if "ssim_weight" in custom_params and custom_params["ssim_weight"] is not None:
-            base_config["ssim_weight"] = float(custom_params["ssim_weight"])
-        if (
-            "learning_rate" in custom_params
-            and custom_params["learning_rate"] is not None
-        ):
-            base_config["learning_rate"] = float(custom_params["learning_rate"])
-        if (
-            "position_lr_init" in custom_params
-            and custom_params["position_lr_init"] is not None
-        ):
-            base_config["position_lr_init"] = float(custom_params["position_lr_init"])
-        if (
-            "position_lr_final" in custom_params
-            and custom_params["position_lr_final"] is not None
-        ):
-            base_config["position_lr_final"] = float(custom_params["position_lr_final"])
-        if "feature_lr" in custom_params and custom_params["feature_lr"] is not None:
-            base_config["feature_lr"] = float(custom_params["feature_lr"])
-        if "opacity_lr" in custom_params and custom_params["opacity_lr"] is not None:
-            base_config["opacity_lr"] = float(custom_params["opacity_lr"])
-        if "scaling_lr" in custom_params and custom_params["scaling_lr"] is not None:
-            base_config["scaling_lr"] = float(custom_params["scaling_lr"])
-        if "rotation_lr" in custom_params and custom_params["rotation_lr"] is not None:
-            base_config["rotation_lr"] = float(custom_params["rotation_lr"])
-        if (
-            "percent_dense" in custom_params
-            and custom_params["percent_dense"] is not None
-        ):
-            base_config["percent_dense"] = float(custom_params["percent_dense"])
+        base_config.update(
+            {
+                key: cast(custom_params[key])
+                for key, cast in OPENSPLAT_CUSTOM_PARAM_TYPES
+                if custom_params.get(key) is not None
+            }
+        )
 
     return base_config
 
@@ -1556,13 +1533,7 @@ def get_colmap_config_for_pipeline(paths, config, project_id=None):
     Returns (num_images, colmap_config, colmap_exe, has_cuda)
     """
     images_path = paths["images_path"]
-    num_images = len(
-        [
-            f
-            for f in os.listdir(images_path)
-            if f.lower().endswith((".jpg", ".jpeg", ".png", ".bmp", ".tiff"))
-        ]
-    )
+    num_images = count_image_files(images_path)
 
     quality_mode = config.get("quality_mode", "balanced")
 
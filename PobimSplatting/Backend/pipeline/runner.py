@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import os
 import re
 import shutil
 import subprocess
@@ -16,7 +15,7 @@ from ..core import projects as project_store
 from ..core.projects import (
     append_log_line,
     emit_stage_progress,
-    save_projects_db,
+    request_projects_db_save,
     get_active_projects_snapshot,
     update_stage_detail,
     update_resource_coordination,
@@ -64,6 +63,7 @@ from .recovery_planners import (
 )
 from .runtime_support import (
     HLOC_AVAILABLE,
+    count_image_files,
     get_pycolmap_module,
     normalize_feature_method,
     normalize_matcher_type,
@@ -271,7 +271,10 @@ def _training_stage_helpers():
 
 
 def run_processing_pipeline_from_stage(project_id, paths, config, video_files, image_files, from_stage='ingest'):
-    """Run the processing pipeline from a specific stage."""
+    """Run the processing pipeline from a specific stage.
+
+    ``video_files`` and ``image_files`` may hold ``Path`` or ``str`` entries.
+    """
     try:
         config = attach_auto_tuning_to_config(config)
         _persist_auto_tuning_summary(project_id, config)
@@ -420,6 +423,7 @@ def run_processing_pipeline_from_stage(project_id, paths, config, video_files, i
                         'oversample_factor': config.get('oversample_factor', 10),
                         'replacement_search_radius': config.get('replacement_search_radius', 4),
                         'ffmpeg_cpu_workers': config.get('ffmpeg_cpu_workers', 8),
+                        'ffmpeg_threads': config.get('ffmpeg_threads', 0),
                         'source_video_path': str(video_path),
                         'auto_tuning_policy': config.get('_auto_tuning_policy'),
                     }
@@ -593,7 +597,7 @@ def run_processing_pipeline_from_stage(project_id, paths, config, video_files, i
                                 diagnostics.setdefault('videos', []).append(extraction_stats)
                                 project_entry.setdefault('config', {})['replacement_search_radius'] = extraction_stats.get('search_radius')
                                 project_entry['video_extraction_diagnostics'] = diagnostics
-                                save_projects_db()
+                                request_projects_db_save()
                         append_log_line(
                             project_id,
                             "🧠 Smart frame selection: "
@@ -766,11 +770,13 @@ def run_processing_pipeline_from_stage(project_id, paths, config, video_files, i
         logger.error(f"Processing failed for {project_id}: {e}")
         append_log_line(project_id, f"❌ Error: {str(e)}")
 
+        end_time = datetime.now().isoformat()
         with project_store.status_lock:
-            project_store.processing_status[project_id]['status'] = 'failed'
-            project_store.processing_status[project_id]['error'] = str(e)
-            project_store.processing_status[project_id]['end_time'] = datetime.now().isoformat()
-            save_projects_db()
+            project = project_store.processing_status[project_id]
+            project['status'] = 'failed'
+            project['error'] = str(e)
+            project['end_time'] = end_time
+        request_projects_db_save()
         _record_project_auto_tuning_evidence(project_id)
 
 
@@ -1113,10 +1119,7 @@ def run_colmap_pipeline(project_id, paths, config, processing_start_time, time_e
     """Run real COLMAP + OpenSplat pipeline from specified stage."""
     try:
         images_path = paths['images_path']
-        num_images = len([
-            f for f in os.listdir(images_path)
-            if f.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.tiff'))
-        ])
+        num_images = count_image_files(images_path)
 
         quality_mode = config.get('quality_mode', 'balanced')
         custom_params = None
@@ -1310,11 +1313,13 @@ def run_colmap_pipeline(project_id, paths, config, processing_start_time, time_e
         logger.error(f"COLMAP pipeline failed for {project_id}: {e}")
         append_log_line(project_id, f"❌ Pipeline Error: {str(e)}")
 
+        end_time = datetime.now().isoformat()
         with project_store.status_lock:
-            project_store.processing_status[project_id]['status'] = 'failed'
-            project_store.processing_status[project_id]['error'] = str(e)
-            project_store.processing_status[project_id]['end_time'] = datetime.now().isoformat()
-            save_projects_db()
+            project = project_store.processing_status[project_id]
+            project['status'] = 'failed'
+            project['error'] = str(e)
+            project['end_time'] = end_time
+        request_projects_db_save()
         _record_project_auto_tuning_evidence(project_id)
 
         raise
@@ -1332,5 +1337,5 @@ def run_opensplat_training(project_id, paths, config, processing_start_time, tim
     )
 
 
-def finalize_project(project_id):
-    return _finalize_project_impl(project_id)
+def finalize_project(project_id, result_ply=None):
+    return _finalize_project_impl(project_id, result_ply=result_ply)
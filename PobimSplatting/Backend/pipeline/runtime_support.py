@@ -552,6 +552,23 @@ def should_log_subprocess_line(line):
     return lowered.startswith(important_prefixes) or any(token in lowered for token in important_tokens)
 
 
+_COUNTED_IMAGE_EXTS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff')
+# Lower- and upper-case suffixes cover nearly every name without a per-entry
+# .lower(); mixed-case suffixes fall through to the lowered check.
+_COUNTED_IMAGE_EXTS_CI = _COUNTED_IMAGE_EXTS + tuple(ext.upper() for ext in _COUNTED_IMAGE_EXTS)
+
+
+def count_image_files(images_path):
+    """Count image files directly inside images_path without building a listing."""
+    with os.scandir(images_path) as entries:
+        return sum(
+            1
+            for entry in entries
+            if entry.name.endswith(_COUNTED_IMAGE_EXTS_CI)
+            or entry.name.lower().endswith(_COUNTED_IMAGE_EXTS)
+        )
+
+
 def should_emit_progress_milestone(progress_state, current, total, *, percent_step=10):
     if total <= 0 or current <= 0:
         return False, None
@@ -7,6 +7,7 @@ import re
 import shutil
 import sys
 import tempfile
+from functools import partial
 from pathlib import Path
 
 from ..core.commands import run_command_with_logs
@@ -52,6 +53,126 @@ SPARSE_RUNTIME_OVERRIDE_KEYS = {
 }
 
 
+_GLOMAP_STAGES = {
+    "preprocessing": {"progress": 5, "label": "🔧 Preprocessing"},
+    "view_graph_calibration": {
+        "progress": 10,
+        "label": "📊 View Graph Calibration",
+    },
+    "relative_pose": {"progress": 20, "label": "📐 Relative Pose Estimation"},
+    "rotation_averaging": {"progress": 35, "label": "🔄 Rotation Averaging"},
+    "track_establishment": {"progress": 50, "label": "🔗 Track Establishment"},
+    "global_positioning": {"progress": 65, "label": "🌍 Global Positioning"},
+    "bundle_adjustment": {"progress": 85, "label": "⚡ Bundle Adjustment"},
+    "retriangulation": {"progress": 92, "label": "📐 Retriangulation"},
+    "postprocessing": {"progress": 98, "label": "🏁 Postprocessing"},
+}
+_FASTMAP_STAGES = {
+    "focal_estimation": {"progress": 5, "label": "🔍 Focal Length Estimation"},
+    "fundamental": {"progress": 15, "label": "📐 Fundamental Matrix"},
+    "decompose": {"progress": 25, "label": "🧩 Essential Decomposition"},
+    "rotation": {"progress": 40, "label": "🔄 Global Rotation"},
+    "translation": {"progress": 55, "label": "📍 Global Translation"},
+    "tracks": {"progress": 65, "label": "🔗 Track Building"},
+    "epipolar": {"progress": 80, "label": "⚡ Epipolar Adjustment"},
+    "sparse": {"progress": 92, "label": "🏗️ Sparse Reconstruction"},
+    "output": {"progress": 98, "label": "💾 Writing Results"},
+}
+_GLOMAP_STAGE_LOG_LINES = {
+    stage_key: f"[GLOMAP] {stage_info['label']}"
+    for stage_key, stage_info in _GLOMAP_STAGES.items()
+}
+_FASTMAP_STAGE_LOG_LINES = {
+    stage_key: f"[FastMap] {stage_info['label']}"
+    for stage_key, stage_info in _FASTMAP_STAGES.items()
+}
+
+# Mapper stdout patterns, matched against the lower-cased line.
+_FASTMAP_STAGE_PATTERNS = tuple(
+    (stage_key, re.compile(pattern))
+    for stage_key, pattern in (
+        ("focal_estimation", r"(estimating focal|focal length)"),
+        ("fundamental", r"(fundamental matrix|estimate fundamental)"),
+        ("decompose", r"(decompos|essential matrix)"),
+        ("rotation", r"(global rotation|rotation averaging)"),
+        ("translation", r"(global translation|translation estimation)"),
+        ("tracks", r"(build.*track|track.*build|establishing track)"),
+        ("epipolar", r"(epipolar adjustment|epipolar optimization)"),
+        ("sparse", r"(sparse reconstruction|triangulat)"),
+        ("output", r"(write|writing|output|saving)"),
+    )
+)
+_GLOMAP_STAGE_PATTERNS = tuple(
+    (stage_key, re.compile(pattern))
+    for stage_key, pattern in (
+        ("preprocessing", r"running preprocessing"),
+        ("view_graph_calibration", r"running view graph calibration"),
+        (
+            "relative_pose",
+            r"(running relative pose estimation|estimating relative pose)",
+        ),
+        ("rotation_averaging", r"running rotation averaging"),
+        ("track_establishment", r"(establishing tracks|track estimation)"),
+        ("global_positioning", r"running global positioning"),
+        ("bundle_adjustment", r"running bundle adjustment"),
+        ("retriangulation", r"running retriangulation"),
+        ("postprocessing", r"running postprocessing"),
+    )
+)
+_GLOMAP_RELPOSE_RE = re.compile(r"estimating relative pose[:\s]*(?P<pct>\d+)%")
+_GLOMAP_TRACK_RE = re.compile(
+    r"establishing tracks\s*(?P<cur>\d+)\s*/\s*(?P<tot>\d+)"
+)
+_GLOMAP_PAIR_RE = re.compile(r"loading image pair\s*(?P<cur>\d+)\s*/\s*(?P<tot>\d+)")
+_GLOBAL_BA_ITERATION_RE = re.compile(
+    r"global bundle adjustment iteration\s*(?P<cur>\d+)\s*/\s*(?P<tot>\d+)"
+)
+_COLMAP_REGISTRATION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Registering image #\d+",
+        r"Registered image #\d+",
+        r"Processing image (?P<cur>\d+)/(?P<tot>\d+)",
+        r"Reconstruction: (?P<cur>\d+)/(?P<tot>\d+)",
+        r"Bundle adjustment: \d+ images",
+        r"Image #\d+",
+        r"\d+ images registered",
+        r"Registering\s+(?P<cur>\d+)\s*/\s*(?P<tot>\d+)",
+    )
+)
+
+
+class _SparseTracker:
+    """Per-run mapper progress state touched on every parsed stdout line."""
+
+    __slots__ = (
+        "registered",
+        "current_glomap_stage",
+        "last_progress",
+        "ba_iteration",
+        "ba_total",
+        "last_registration_milestone",
+        "last_ba_milestone",
+        "last_pose_update_registered",
+        "last_emitted",
+        "ba_runtime_phase_logged",
+        "last_ba_solver_label",
+    )
+
+    def __init__(self):
+        self.registered = 0
+        self.current_glomap_stage = None
+        self.last_progress = 0
+        self.ba_iteration = 0
+        self.ba_total = 3
+        self.last_registration_milestone = -1
+        self.last_ba_milestone = -1
+        self.last_pose_update_registered = 0
+        self.last_emitted = None
+        self.ba_runtime_phase_logged = False
+        self.last_ba_solver_label = None
+
+
 def _has_sparse_runtime_overrides(config) -> bool:
     return any(config.get(key) not in (None, "") for key in SPARSE_RUNTIME_OVERRIDE_KEYS)
 
@@ -98,6 +219,15 @@ def _choose_live_sparse_snapshot_frequency(num_images: int) -> int:
     return 1
 
 
+def _is_repeat_sparse_emit(sparse_tracker, stage_key, progress, current, total):
+    """Record the latest sparse progress emission and report exact repeats."""
+    emit_key = (stage_key, progress, current, total)
+    if sparse_tracker.last_emitted == emit_key:
+        return True
+    sparse_tracker.last_emitted = emit_key
+    return False
+
+
 def _log_colmap_ba_plan(project_id, ba_plan):
     if not ba_plan:
         return
@@ -130,16 +260,14 @@ def _maybe_log_colmap_ba_runtime_event(project_id, line, sparse_tracker, ba_plan
 
     if (
         mentions_ba
-        and not sparse_tracker.get("ba_runtime_phase_logged")
-        and not re.search(
-            r"global bundle adjustment iteration\s*\d+\s*/\s*\d+", line_lower
-        )
+        and not sparse_tracker.ba_runtime_phase_logged
+        and not _GLOBAL_BA_ITERATION_RE.search(line_lower)
     ):
         append_log_line(
             project_id,
             f"[COLMAP] Bundle adjustment phase started: {ba_plan.get('runtime_summary', ba_plan.get('summary', 'Bundle adjustment'))}",
         )
-        sparse_tracker["ba_runtime_phase_logged"] = True
+        sparse_tracker.ba_runtime_phase_logged = True
 
     solver_label = None
     if "sparse_schur" in line_lower and "cudss" in line_lower:
@@ -151,12 +279,12 @@ def _maybe_log_colmap_ba_runtime_event(project_id, line, sparse_tracker, ba_plan
     elif mentions_cpu_fallback:
         solver_label = "CPU bundle adjustment fallback"
 
-    if solver_label and sparse_tracker.get("last_ba_solver_label") != solver_label:
+    if solver_label and sparse_tracker.last_ba_solver_label != solver_label:
         append_log_line(project_id, f"[COLMAP] BA solver: {solver_label}")
-        sparse_tracker["last_ba_solver_label"] = solver_label
+        sparse_tracker.last_ba_solver_label = solver_label
 
     return (
-        sparse_tracker.get("ba_runtime_phase_logged", False) or solver_label is not None
+        sparse_tracker.ba_runtime_phase_logged or solver_label is not None
     )
 
 
@@ -223,6 +351,343 @@ def try_run_pycolmap_global_mapping(project_id, paths, config, colmap_cfg, num_i
         return False
 
 
+def _fastmap_line_handler(line, *, project_id, num_images, sparse_tracker):
+    if num_images == 0:
+        return
+    line_lower = line.lower()
+    for stage_key, pattern in _FASTMAP_STAGE_PATTERNS:
+        if pattern.search(line_lower):
+            stage_info = _FASTMAP_STAGES[stage_key]
+            progress = stage_info["progress"]
+            append_log_line(project_id, _FASTMAP_STAGE_LOG_LINES[stage_key])
+            details = {
+                "text": stage_info["label"],
+                "current_item": progress,
+                "total_items": 100,
+                "item_name": stage_key,
+                "fastmap_stage": stage_key,
+                "sfm_engine": "fastmap",
+            }
+            emit_stage_progress(
+                project_id, "sparse_reconstruction", progress, details
+            )
+            update_state(
+                project_id,
+                "sparse_reconstruction",
+                progress=progress,
+                details=details,
+            )
+            update_stage_detail(
+                project_id,
+                "sparse_reconstruction",
+                text=stage_info["label"],
+                subtext=f"FastMap - {num_images} images",
+            )
+            return
+
+
+def _handle_colmap_registration_line(line, *, project_id, num_images, sparse_tracker):
+    """Publish COLMAP registration progress; return True when the line matched."""
+    for pattern in _COLMAP_REGISTRATION_PATTERNS:
+        match = pattern.search(line)
+        if match:
+            break
+    else:
+        return False
+
+    total = num_images
+    # Patterns with a counter carry named groups; the rest just mark one
+    # more registered image.
+    if match.lastindex:
+        current = int(match["cur"])
+    else:
+        sparse_tracker.registered += 1
+        current = sparse_tracker.registered
+    if current > total:
+        current = total
+    percent = current * 100 // total
+    if _is_repeat_sparse_emit(
+        sparse_tracker, "registration", percent, current, total
+    ):
+        return True
+    details = {
+        "text": f"Images registered: {current}/{total}",
+        "current_item": current,
+        "total_items": total,
+        "item_name": f"Image {current}",
+        "sfm_engine": "colmap",
+    }
+    emit_stage_progress(
+        project_id, "sparse_reconstruction", percent, details
+    )
+    update_state(
+        project_id,
+        "sparse_reconstruction",
+        progress=min(percent, 99),
+        details=details,
+    )
+    update_stage_detail(
+        project_id,
+        "sparse_reconstruction",
+        text=f"Images registered: {current}/{total}",
+        subtext="COLMAP",
+    )
+    last_pose_update_registered = sparse_tracker.last_pose_update_registered
+    if (
+        current > last_pose_update_registered
+        and current - last_pose_update_registered >= LIVE_SPARSE_POSE_UPDATE_IMAGE_STEP
+    ):
+        sparse_tracker.last_pose_update_registered = current
+        emit_sparse_pose_update(
+            project_id,
+            {
+                "project_id": project_id,
+                "camera_count": current,
+                "total_images": total,
+                "capture_progress_percent": percent,
+                "snapshot_version": None,
+                "source_type": "registration",
+                "update_mode": "per_image",
+            },
+        )
+    registration_log_state = {"last_milestone": sparse_tracker.last_registration_milestone}
+    should_log, progress_percent = should_emit_progress_milestone(
+        registration_log_state, current, total
+    )
+    sparse_tracker.last_registration_milestone = registration_log_state[
+        "last_milestone"
+    ]
+    if should_log:
+        append_log_line(
+            project_id,
+            f"[COLMAP] Registration progress: {current}/{total} images ({progress_percent}%)",
+        )
+    return True
+
+
+def _glomap_line_handler(line, *, project_id, num_images, sparse_tracker):
+    if num_images == 0:
+        return
+    line_lower = line.lower()
+    for stage_key, pattern in _GLOMAP_STAGE_PATTERNS:
+        if pattern.search(line_lower):
+            previous_stage = sparse_tracker.current_glomap_stage
+            sparse_tracker.current_glomap_stage = stage_key
+            stage_info = _GLOMAP_STAGES[stage_key]
+            progress = stage_info["progress"]
+            if previous_stage != stage_key:
+                append_log_line(project_id, _GLOMAP_STAGE_LOG_LINES[stage_key])
+            if _is_repeat_sparse_emit(
+                sparse_tracker, stage_key, progress, progress, 100
+            ):
+                return
+            details = {
+                "text": stage_info["label"],
+                "current_item": progress,
+                "total_items": 100,
+                "item_name": stage_key,
+                "glomap_stage": stage_key,
+                "sfm_engine": "glomap",
+            }
+            emit_stage_progress(
+                project_id, "sparse_reconstruction", progress, details
+            )
+            update_state(
+                project_id,
+                "sparse_reconstruction",
+                progress=progress,
+                details=details,
+            )
+            update_stage_detail(
+                project_id,
+                "sparse_reconstruction",
+                text=stage_info["label"],
+                subtext=f"GLOMAP - {num_images} images",
+            )
+            sparse_tracker.last_progress = progress
+            return
+
+    relpose_match = _GLOMAP_RELPOSE_RE.search(line_lower)
+    if relpose_match:
+        rel_percent = int(relpose_match["pct"])
+        progress = 10 + int(rel_percent * 0.1)
+        if _is_repeat_sparse_emit(
+            sparse_tracker, "relative_pose", progress, rel_percent, 100
+        ):
+            return
+        details = {
+            "text": f"📐 Relative Pose: {rel_percent}%",
+            "current_item": rel_percent,
+            "total_items": 100,
+            "item_name": f"{rel_percent}%",
+            "glomap_stage": "relative_pose",
+            "sfm_engine": "glomap",
+        }
+        emit_stage_progress(
+            project_id, "sparse_reconstruction", progress, details
+        )
+        update_state(
+            project_id,
+            "sparse_reconstruction",
+            progress=progress,
+            details=details,
+        )
+        update_stage_detail(
+            project_id,
+            "sparse_reconstruction",
+            text=f"📐 Relative Pose Estimation: {rel_percent}%",
+            subtext=f"GLOMAP - {num_images} images",
+        )
+        return
+
+    track_match = _GLOMAP_TRACK_RE.search(line_lower)
+    if track_match:
+        current_track = int(track_match["cur"])
+        total_tracks = int(track_match["tot"])
+        track_percent = min(100, current_track * 100 // max(total_tracks, 1))
+        progress = 50 + int(track_percent * 0.15)
+        if _is_repeat_sparse_emit(
+            sparse_tracker,
+            "track_establishment",
+            progress,
+            current_track,
+            total_tracks,
+        ):
+            return
+        details = {
+            "text": f"🔗 Tracks: {current_track}/{total_tracks}",
+            "current_item": current_track,
+            "total_items": total_tracks,
+            "item_name": f"Track {current_track}",
+            "glomap_stage": "track_establishment",
+            "sfm_engine": "glomap",
+        }
+        emit_stage_progress(
+            project_id, "sparse_reconstruction", progress, details
+        )
+        update_state(
+            project_id,
+            "sparse_reconstruction",
+            progress=progress,
+            details=details,
+        )
+        update_stage_detail(
+            project_id,
+            "sparse_reconstruction",
+            text=f"🔗 Track Establishment: {current_track}/{total_tracks}",
+            subtext=f"GLOMAP - {track_percent}%",
+        )
+        return
+
+    ba_match = _GLOBAL_BA_ITERATION_RE.search(line_lower)
+    if ba_match:
+        ba_current = int(ba_match["cur"])
+        ba_total = int(ba_match["tot"])
+        sparse_tracker.ba_iteration = ba_current
+        sparse_tracker.ba_total = ba_total
+        ba_percent = ba_current * 100 // max(ba_total, 1)
+        progress = 65 + int(ba_percent * 0.27)
+        if _is_repeat_sparse_emit(
+            sparse_tracker, "bundle_adjustment", progress, ba_current, ba_total
+        ):
+            return
+        details = {
+            "text": f"⚡ Bundle Adjustment: {ba_current}/{ba_total}",
+            "current_item": ba_current,
+            "total_items": ba_total,
+            "item_name": f"Iteration {ba_current}",
+            "glomap_stage": "bundle_adjustment",
+            "sfm_engine": "glomap",
+        }
+        emit_stage_progress(
+            project_id, "sparse_reconstruction", progress, details
+        )
+        update_state(
+            project_id,
+            "sparse_reconstruction",
+            progress=progress,
+            details=details,
+        )
+        update_stage_detail(
+            project_id,
+            "sparse_reconstruction",
+            text=f"⚡ Bundle Adjustment: Iteration {ba_current}/{ba_total}",
+            subtext=f"GLOMAP - {ba_percent}%",
+        )
+        ba_log_state = {"last_milestone": sparse_tracker.last_ba_milestone}
+        should_log, _ = should_emit_progress_milestone(
+            ba_log_state, ba_current, ba_total, percent_step=25
+        )
+        sparse_tracker.last_ba_milestone = ba_log_state["last_milestone"]
+        if should_log:
+            append_log_line(
+                project_id,
+                f"[GLOMAP] Bundle Adjustment {ba_current}/{ba_total}",
+            )
+        return
+
+    pair_match = _GLOMAP_PAIR_RE.search(line_lower)
+    if pair_match:
+        current_pair = int(pair_match["cur"])
+        total_pairs = int(pair_match["tot"])
+        pair_percent = min(100, current_pair * 100 // max(total_pairs, 1))
+        progress = min(5, int(pair_percent * 0.05))
+        if current_pair % 500 == 0 or current_pair == total_pairs:
+            details = {
+                "text": f"🔧 Loading pairs: {current_pair}/{total_pairs}",
+                "current_item": current_pair,
+                "total_items": total_pairs,
+                "item_name": f"Pair {current_pair}",
+                "glomap_stage": "preprocessing",
+                "sfm_engine": "glomap",
+            }
+            emit_stage_progress(
+                project_id, "sparse_reconstruction", progress, details
+            )
+            update_stage_detail(
+                project_id,
+                "sparse_reconstruction",
+                text=f"🔧 Loading Image Pairs: {current_pair}/{total_pairs}",
+                subtext="GLOMAP - Preprocessing",
+            )
+        return
+
+    _handle_colmap_registration_line(
+        line,
+        project_id=project_id,
+        num_images=num_images,
+        sparse_tracker=sparse_tracker,
+    )
+
+
+def _colmap_line_handler(line, *, project_id, num_images, sparse_tracker, ba_plan):
+    if num_images == 0:
+        return
+    if _handle_colmap_registration_line(
+        line,
+        project_id=project_id,
+        num_images=num_images,
+        sparse_tracker=sparse_tracker,
+    ):
+        return
+
+    line_lower = line.lower()
+    if _maybe_log_colmap_ba_runtime_event(
+        project_id, line, sparse_tracker, ba_plan
+    ):
+        return
+
+    if "creating snapshot" in line_lower:
+        registered = max(sparse_tracker.registered, 0)
+        snapshot_percent = registered * 100 // max(num_images, 1)
+        append_log_line(
+            project_id,
+            f"[COLMAP] Live sparse snapshot exported "
+            f"({registered}/{num_images} images registered, {snapshot_percent}%)",
+        )
+        return
+
+
 def run_sparse_reconstruction_stage(
     project_id, paths, config, colmap_config=None, *, helpers
 ):
@@ -496,375 +961,23 @@ def run_sparse_reconstruction_stage(
             f"(detected={detected_cpu_threads})",
         )
 
-    glomap_stages = {
-        "preprocessing": {"progress": 5, "label": "🔧 Preprocessing"},
-        "view_graph_calibration": {
-            "progress": 10,
-            "label": "📊 View Graph Calibration",
-        },
-        "relative_pose": {"progress": 20, "label": "📐 Relative Pose Estimation"},
-        "rotation_averaging": {"progress": 35, "label": "🔄 Rotation Averaging"},
-        "track_establishment": {"progress": 50, "label": "🔗 Track Establishment"},
-        "global_positioning": {"progress": 65, "label": "🌍 Global Positioning"},
-        "bundle_adjustment": {"progress": 85, "label": "⚡ Bundle Adjustment"},
-        "retriangulation": {"progress": 92, "label": "📐 Retriangulation"},
-        "postprocessing": {"progress": 98, "label": "🏁 Postprocessing"},
-    }
-    fastmap_stages = {
-        "focal_estimation": {"progress": 5, "label": "🔍 Focal Length Estimation"},
-        "fundamental": {"progress": 15, "label": "📐 Fundamental Matrix"},
-        "decompose": {"progress": 25, "label": "🧩 Essential Decomposition"},
-        "rotation": {"progress": 40, "label": "🔄 Global Rotation"},
-        "translation": {"progress": 55, "label": "📍 Global Translation"},
-        "tracks": {"progress": 65, "label": "🔗 Track Building"},
-        "epipolar": {"progress": 80, "label": "⚡ Epipolar Adjustment"},
-        "sparse": {"progress": 92, "label": "🏗️ Sparse Reconstruction"},
-        "output": {"progress": 98, "label": "💾 Writing Results"},
-    }
-    sparse_tracker = {
-        "registered": 0,
-        "current_glomap_stage": None,
-        "last_progress": 0,
-        "ba_iteration": 0,
-        "ba_total": 3,
-        "last_registration_milestone": -1,
-        "last_ba_milestone": -1,
-        "last_pose_update_registered": 0,
-    }
-
-    def sparse_line_handler(line):
-        if num_images == 0:
-            return
-        line_lower = line.lower()
-        if use_fastmap:
-            for stage_key, pattern in [
-                ("focal_estimation", r"(estimating focal|focal length)"),
-                ("fundamental", r"(fundamental matrix|estimate fundamental)"),
-                ("decompose", r"(decompos|essential matrix)"),
-                ("rotation", r"(global rotation|rotation averaging)"),
-                ("translation", r"(global translation|translation estimation)"),
-                ("tracks", r"(build.*track|track.*build|establishing track)"),
-                ("epipolar", r"(epipolar adjustment|epipolar optimization)"),
-                ("sparse", r"(sparse reconstruction|triangulat)"),
-                ("output", r"(write|writing|output|saving)"),
-            ]:
-                if re.search(pattern, line_lower):
-                    stage_info = fastmap_stages[stage_key]
-                    progress = stage_info["progress"]
-                    append_log_line(project_id, f"[FastMap] {stage_info['label']}")
-                    details = {
-                        "text": stage_info["label"],
-                        "current_item": progress,
-                        "total_items": 100,
-                        "item_name": stage_key,
-                        "fastmap_stage": stage_key,
-                        "sfm_engine": "fastmap",
-                    }
-                    emit_stage_progress(
-                        project_id, "sparse_reconstruction", progress, details
-                    )
-                    update_state(
-                        project_id,
-                        "sparse_reconstruction",
-                        progress=progress,
-                        details=details,
-                    )
-                    update_stage_detail(
-                        project_id,
-                        "sparse_reconstruction",
-                        text=stage_info["label"],
-                        subtext=f"FastMap - {num_images} images",
-                    )
-                    return
-            return
-
-        if use_global_sfm:
-            for stage_key, pattern in [
-                ("preprocessing", r"running preprocessing"),
-                ("view_graph_calibration", r"running view graph calibration"),
-                (
-                    "relative_pose",
-                    r"(running relative pose estimation|estimating relative pose)",
-                ),
-                ("rotation_averaging", r"running rotation averaging"),
-                ("track_establishment", r"(establishing tracks|track estimation)"),
-                ("global_positioning", r"running global positioning"),
-                ("bundle_adjustment", r"running bundle adjustment"),
-                ("retriangulation", r"running retriangulation"),
-                ("postprocessing", r"running postprocessing"),
-            ]:
-                if re.search(pattern, line_lower):
-                    previous_stage = sparse_tracker.get("current_glomap_stage")
-                    sparse_tracker["current_glomap_stage"] = stage_key
-                    stage_info = glomap_stages[stage_key]
-                    progress = stage_info["progress"]
-                    if previous_stage != stage_key:
-                        append_log_line(project_id, f"[GLOMAP] {stage_info['label']}")
-                    details = {
-                        "text": stage_info["label"],
-                        "current_item": progress,
-                        "total_items": 100,
-                        "item_name": stage_key,
-                        "glomap_stage": stage_key,
-                        "sfm_engine": "glomap",
-                    }
-                    emit_stage_progress(
-                        project_id, "sparse_reconstruction", progress, details
-                    )
-                    update_state(
-                        project_id,
-                        "sparse_reconstruction",
-                        progress=progress,
-                        details=details,
-                    )
-                    update_stage_detail(
-                        project_id,
-                        "sparse_reconstruction",
-                        text=stage_info["label"],
-                        subtext=f"GLOMAP - {num_images} images",
-                    )
-                    sparse_tracker["last_progress"] = progress
-                    return
-
-            relpose_match = re.search(
-                r"estimating relative pose[:\s]*(\d+)%", line_lower
-            )
-            if relpose_match:
-                rel_percent = int(relpose_match.group(1))
-                progress = 10 + int(rel_percent * 0.1)
-                details = {
-                    "text": f"📐 Relative Pose: {rel_percent}%",
-                    "current_item": rel_percent,
-                    "total_items": 100,
-                    "item_name": f"{rel_percent}%",
-                    "glomap_stage": "relative_pose",
-                    "sfm_engine": "glomap",
-                }
-                emit_stage_progress(
-                    project_id, "sparse_reconstruction", progress, details
-                )
-                update_state(
-                    project_id,
-                    "sparse_reconstruction",
-                    progress=progress,
-                    details=details,
-                )
-                update_stage_detail(
-                    project_id,
-                    "sparse_reconstruction",
-                    text=f"📐 Relative Pose Estimation: {rel_percent}%",
-                    subtext=f"GLOMAP - {num_images} images",
-                )
-                return
-
-            track_match = re.search(
-                r"establishing tracks\s*(\d+)\s*/\s*(\d+)", line_lower
-            )
-            if track_match:
-                current_track = int(track_match.group(1))
-                total_tracks = int(track_match.group(2))
-                track_percent = min(
-                    100, int((current_track / max(total_tracks, 1)) * 100)
-                )
-                progress = 50 + int(track_percent * 0.15)
-                details = {
-                    "text": f"🔗 Tracks: {current_track}/{total_tracks}",
-                    "current_item": current_track,
-                    "total_items": total_tracks,
-                    "item_name": f"Track {current_track}",
-                    "glomap_stage": "track_establishment",
-                    "sfm_engine": "glomap",
-                }
-                emit_stage_progress(
-                    project_id, "sparse_reconstruction", progress, details
-                )
-                update_state(
-                    project_id,
-                    "sparse_reconstruction",
-                    progress=progress,
-                    details=details,
-                )
-                update_stage_detail(
-                    project_id,
-                    "sparse_reconstruction",
-                    text=f"🔗 Track Establishment: {current_track}/{total_tracks}",
-                    subtext=f"GLOMAP - {track_percent}%",
-                )
-                return
-
-            ba_match = re.search(
-                r"global bundle adjustment iteration\s*(\d+)\s*/\s*(\d+)", line_lower
-            )
-            if ba_match:
-                ba_current = int(ba_match.group(1))
-                ba_total = int(ba_match.group(2))
-                sparse_tracker["ba_iteration"] = ba_current
-                sparse_tracker["ba_total"] = ba_total
-                ba_percent = int((ba_current / max(ba_total, 1)) * 100)
-                progress = 65 + int(ba_percent * 0.27)
-                details = {
-                    "text": f"⚡ Bundle Adjustment: {ba_current}/{ba_total}",
-                    "current_item": ba_current,
-                    "total_items": ba_total,
-                    "item_name": f"Iteration {ba_current}",
-                    "glomap_stage": "bundle_adjustment",
-                    "sfm_engine": "glomap",
-                }
-                emit_stage_progress(
-                    project_id, "sparse_reconstruction", progress, details
-                )
-                update_state(
-                    project_id,
-                    "sparse_reconstruction",
-                    progress=progress,
-                    details=details,
-                )
-                update_stage_detail(
-                    project_id,
-                    "sparse_reconstruction",
-                    text=f"⚡ Bundle Adjustment: Iteration {ba_current}/{ba_total}",
-                    subtext=f"GLOMAP - {ba_percent}%",
-                )
-                ba_log_state = {
-                    "last_milestone": sparse_tracker.get("last_ba_milestone", -1)
-                }
-                should_log, _ = should_emit_progress_milestone(
-                    ba_log_state, ba_current, ba_total, percent_step=25
-                )
-                sparse_tracker["last_ba_milestone"] = ba_log_state["last_milestone"]
-                if should_log:
-                    append_log_line(
-                        project_id,
-                        f"[GLOMAP] Bundle Adjustment {ba_current}/{ba_total}",
-                    )
-                return
+    sparse_tracker = _SparseTracker()
 
-            pair_match = re.search(
-                r"loading image pair\s*(\d+)\s*/\s*(\d+)", line_lower
-            )
-            if pair_match:
-                current_pair = int(pair_match.group(1))
-                total_pairs = int(pair_match.group(2))
-                pair_percent = min(100, int((current_pair / max(total_pairs, 1)) * 100))
-                progress = min(5, int(pair_percent * 0.05))
-                if current_pair % 500 == 0 or current_pair == total_pairs:
-                    details = {
-                        "text": f"🔧 Loading pairs: {current_pair}/{total_pairs}",
-                        "current_item": current_pair,
-                        "total_items": total_pairs,
-                        "item_name": f"Pair {current_pair}",
-                        "glomap_stage": "preprocessing",
-                        "sfm_engine": "glomap",
-                    }
-                    emit_stage_progress(
-                        project_id, "sparse_reconstruction", progress, details
-                    )
-                    update_stage_detail(
-                        project_id,
-                        "sparse_reconstruction",
-                        text=f"🔧 Loading Image Pairs: {current_pair}/{total_pairs}",
-                        subtext="GLOMAP - Preprocessing",
-                    )
-                return
-
-        for pattern in [
-            r"Registering image #(\d+)",
-            r"Registered image #(\d+)",
-            r"Processing image (\d+)/(\d+)",
-            r"Reconstruction: (\d+)/(\d+)",
-            r"Bundle adjustment: (\d+) images",
-            r"Image #(\d+)",
-            r"(\d+) images registered",
-            r"Registering\s+(\d+)\s*/\s*(\d+)",
-        ]:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                if len(match.groups()) == 2:
-                    current = int(match.group(1))
-                    total = int(match.group(2))
-                    if total != num_images:
-                        total = num_images
-                    if current > total:
-                        current = total
-                else:
-                    sparse_tracker["registered"] += 1
-                    current = min(sparse_tracker["registered"], num_images)
-                    total = num_images
-                percent = int((current / total) * 100)
-                details = {
-                    "text": f"Images registered: {current}/{total}",
-                    "current_item": current,
-                    "total_items": total,
-                    "item_name": f"Image {current}",
-                    "sfm_engine": "colmap",
-                }
-                emit_stage_progress(
-                    project_id, "sparse_reconstruction", percent, details
-                )
-                update_state(
-                    project_id,
-                    "sparse_reconstruction",
-                    progress=min(percent, 99),
-                    details=details,
-                )
-                update_stage_detail(
-                    project_id,
-                    "sparse_reconstruction",
-                    text=f"Images registered: {current}/{total}",
-                    subtext="COLMAP",
-                )
-                last_pose_update_registered = int(
-                    sparse_tracker.get("last_pose_update_registered", 0)
-                )
-                if (
-                    current > last_pose_update_registered
-                    and current - last_pose_update_registered >= LIVE_SPARSE_POSE_UPDATE_IMAGE_STEP
-                ):
-                    sparse_tracker["last_pose_update_registered"] = current
-                    emit_sparse_pose_update(
-                        project_id,
-                        {
-                            "project_id": project_id,
-                            "camera_count": current,
-                            "total_images": total,
-                            "capture_progress_percent": percent,
-                            "snapshot_version": None,
-                            "source_type": "registration",
-                            "update_mode": "per_image",
-                        },
-                    )
-                registration_log_state = {
-                    "last_milestone": sparse_tracker.get(
-                        "last_registration_milestone", -1
-                    )
-                }
-                should_log, progress_percent = should_emit_progress_milestone(
-                    registration_log_state, current, total
-                )
-                sparse_tracker["last_registration_milestone"] = registration_log_state[
-                    "last_milestone"
-                ]
-                if should_log:
-                    append_log_line(
-                        project_id,
-                        f"[COLMAP] Registration progress: {current}/{total} images ({progress_percent}%)",
-                    )
-                return
-
-        if not use_global_sfm and _maybe_log_colmap_ba_runtime_event(
-            project_id, line, sparse_tracker, ba_plan
-        ):
-            return
-
-        if not use_global_sfm and "creating snapshot" in line_lower:
-            registered = max(int(sparse_tracker.get("registered", 0)), 0)
-            snapshot_percent = int((registered / max(num_images, 1)) * 100)
-            append_log_line(
-                project_id,
-                f"[COLMAP] Live sparse snapshot exported "
-                f"({registered}/{num_images} images registered, {snapshot_percent}%)",
-            )
-            return
+    # The mapper family is fixed for the whole run, so pick its parser once
+    # instead of re-checking the engine flags on every stdout line.
+    handler_kwargs = {
+        "project_id": project_id,
+        "num_images": num_images,
+        "sparse_tracker": sparse_tracker,
+    }
+    if use_fastmap:
+        sparse_line_handler = partial(_fastmap_line_handler, **handler_kwargs)
+    elif use_global_sfm:
+        sparse_line_handler = partial(_glomap_line_handler, **handler_kwargs)
+    else:
+        sparse_line_handler = partial(
+            _colmap_line_handler, ba_plan=ba_plan, **handler_kwargs
+        )
 
     pycolmap_completed = False
     if use_pycolmap_global:
@@ -905,7 +1018,7 @@ def run_sparse_reconstruction_stage(
 
     update_state(project_id, "sparse_reconstruction", status="completed", progress=100)
     registered = (
-        sparse_tracker["registered"] if sparse_tracker["registered"] else num_images
+        sparse_tracker.registered if sparse_tracker.registered else num_images
     )
     if use_fastmap:
         engine_name = "FastMap"
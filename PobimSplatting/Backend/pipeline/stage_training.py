@@ -6,6 +6,7 @@ import json
 import logging
 import os
 import re
+import stat
 import time
 from datetime import datetime
 from pathlib import Path
@@ -17,13 +18,17 @@ from ..core.projects import (
     append_log_line,
     emit_stage_progress,
     emit_training_live_preview,
-    save_projects_db,
+    request_projects_db_save,
     update_stage_detail,
     update_reconstruction_framework,
     update_state,
 )
 from ..utils.video_processor import VideoProcessor
-from .runtime_support import should_emit_progress_milestone, should_log_subprocess_line
+from .runtime_support import (
+    count_image_files,
+    should_emit_progress_milestone,
+    should_log_subprocess_line,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +36,277 @@ TRAINING_LIVE_RENDER_DIRNAME = "live_training_preview"
 TRAINING_LIVE_CONTROL_FILENAME = "live_training_preview_control.json"
 DEFAULT_TRAINING_LIVE_RENDER_PERCENT_STEP = 2
 ALLOWED_TRAINING_LIVE_RENDER_PERCENT_STEPS = {1, 2, 5}
+TRAINING_PROGRESS_EMIT_INTERVAL = 0.25
+
+# Iteration progress formats printed by OpenSplat and older trainer builds,
+# in priority order: when several match one line, the earliest pattern wins.
+_TRAINING_ITERATION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Iteration\s+(\d+)/(\d+)",
+        r"Step\s+(\d+)/(\d+)",
+        r"Epoch\s+(\d+)/(\d+)",
+        r"Progress:\s+(\d+)/(\d+)",
+        r"Training\s+(\d+)/(\d+)",
+        r"iter\s*:\s*(\d+)\s*/\s*(\d+)",
+        r"(\d+)\s*/\s*(\d+)\s*iterations?",
+        r"Iteration\s+(\d+)\s+\(.*?\)\s*/\s*(\d+)",
+        r"\[(\d+)/(\d+)\]",
+        r"it\s*(\d+)/(\d+)",
+        r"step\s*(\d+)\s*\/\s*(\d+)",
+    )
+)
+# All formats fused into one alternation so non-progress lines cost a single
+# scan. It only gates the ordered search: its leftmost match ignores priority.
+_TRAINING_ITERATION_RE = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in _TRAINING_ITERATION_PATTERNS),
+    re.IGNORECASE,
+)
+_FIRST_NUMBER_RE = re.compile(r"(\d+)")
+_SPLATS_COUNT_PATTERNS = (
+    re.compile(r"new count\s+(\d+)", re.IGNORECASE),
+    re.compile(r"remaining\s+(\d+)", re.IGNORECASE),
+    re.compile(r"Loaded\s+(\d+)\s+gaussians", re.IGNORECASE),
+)
+
+
+# Densification schedule passed to OpenSplat per quality mode. Modes that are
+# missing here run with the binary's own defaults.
+_BASE_OPENSPLAT_REFINEMENT = {
+    "refine_every": 75,
+    "warmup_length": 750,
+    "ssim_weight": 0.25,
+    "reset_alpha_every": None,
+}
+OPENSPLAT_REFINEMENT_DEFAULTS = {
+    "balanced": _BASE_OPENSPLAT_REFINEMENT,
+    "high": _BASE_OPENSPLAT_REFINEMENT,
+    "custom": _BASE_OPENSPLAT_REFINEMENT,
+    "ultra": {
+        "refine_every": 50,
+        "warmup_length": 1000,
+        "ssim_weight": 0.3,
+        "reset_alpha_every": 20,
+    },
+    "hard": {
+        "refine_every": 60,
+        "warmup_length": 900,
+        "ssim_weight": 0.28,
+        "reset_alpha_every": 24,
+    },
+}
+# (parameter key, CLI flag) in the order the flags are appended.
+OPENSPLAT_REFINEMENT_FLAGS = (
+    ("densify_grad_threshold", "--densify-grad-thresh"),
+    ("refine_every", "--refine-every"),
+    ("warmup_length", "--warmup-length"),
+    ("ssim_weight", "--ssim-weight"),
+    ("reset_alpha_every", "--reset-alpha-every"),
+)
+_CUSTOM_REFINEMENT_OVERRIDE_KEYS = (
+    "densify_grad_threshold",
+    "refine_every",
+    "warmup_length",
+    "ssim_weight",
+)
+
+
+def _build_opensplat_refinement_params(quality_mode, opensplat_config, config):
+    """Resolve densification CLI parameters, or None for modes without them."""
+    defaults = OPENSPLAT_REFINEMENT_DEFAULTS.get(quality_mode)
+    if defaults is None:
+        return None
+
+    params = dict(defaults)
+    params["densify_grad_threshold"] = opensplat_config.get("densify_grad_threshold")
+    if quality_mode == "custom":
+        params.update(
+            {
+                key: config[key]
+                for key in _CUSTOM_REFINEMENT_OVERRIDE_KEYS
+                if config.get(key) is not None
+            }
+        )
+    return params
+
+
+class _TrainingProgress:
+    """Latest iteration counters parsed from OpenSplat stdout and the last UI push."""
+
+    __slots__ = (
+        "current",
+        "total",
+        "emitted_percent",
+        "emitted_at",
+        "emitted_text",
+        "splats",
+    )
+
+    def __init__(self, total: int):
+        self.current = 0
+        self.total = total
+        self.emitted_percent = -1
+        self.emitted_at = 0.0
+        self.emitted_text = None
+        self.splats = {"current": 0, "max": 0}
+
+
+def _format_count(value):
+    try:
+        return f"{int(value):,}"
+    except (TypeError, ValueError):
+        return str(value)
+
+
+def make_training_progress_handler(project_id, iteration_total):
+    """Build the OpenSplat stdout handler and the progress state it updates."""
+    training_progress = _TrainingProgress(iteration_total)
+    training_progress_log = {"last_bucket": -1}
+    splats_state = training_progress.splats
+
+
+    def _update_splats_from_line(line):
+        for pattern in _SPLATS_COUNT_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                try:
+                    count = int(match.group(1))
+                except (TypeError, ValueError):
+                    return
+                splats_state["current"] = count
+                if count > splats_state["max"]:
+                    splats_state["max"] = count
+                return
+
+    def _splats_suffix():
+        max_count = splats_state["max"]
+        if max_count <= 0:
+            return ""
+        current = splats_state["current"] or max_count
+        return (
+            f" | Splats: {_format_count(current)} (max {_format_count(max_count)})"
+        )
+
+    def _publish_training_progress(current, total, percent, item_name):
+        # OpenSplat prints every iteration; the UI only needs a refresh when
+        # the integer percent moves or the last push is getting stale, and
+        # never when the percent and stage text are exactly what was sent.
+        text = f"Training iterations: {current}/{total}"
+        splats_subtext = None
+        if splats_state["max"] > 0:
+            splats_subtext = (
+                f"Splats: {_format_count(splats_state['current'] or splats_state['max'])} "
+                f"(max {_format_count(splats_state['max'])})"
+            )
+        if (
+            percent == training_progress.emitted_percent
+            and (text, splats_subtext) == training_progress.emitted_text
+        ):
+            return
+        now = time.monotonic()
+        if (
+            percent == training_progress.emitted_percent
+            and now - training_progress.emitted_at < TRAINING_PROGRESS_EMIT_INTERVAL
+        ):
+            return
+        training_progress.emitted_percent = percent
+        training_progress.emitted_at = now
+        training_progress.emitted_text = (text, splats_subtext)
+
+        details = {
+            "text": text,
+            "current_item": current,
+            "total_items": total,
+            "item_name": item_name,
+        }
+        if splats_state["max"] > 0:
+            details["max_splats"] = splats_state["max"]
+            details["current_splats"] = (
+                splats_state["current"] or splats_state["max"]
+            )
+        emit_stage_progress(project_id, "gaussian_splatting", percent, details)
+        update_state(
+            project_id,
+            "gaussian_splatting",
+            progress=min(percent, 99),
+            details=details,
+        )
+        update_stage_detail(
+            project_id,
+            "gaussian_splatting",
+            text=text,
+            subtext=splats_subtext,
+        )
+        should_log, progress_percent = should_emit_progress_milestone(
+            training_progress_log, current, total, percent_step=1
+        )
+        if should_log:
+            append_log_line(
+                project_id,
+                f"🏋️ Training progress: {current}/{total} iterations ({progress_percent}%){_splats_suffix()}",
+            )
+
+    def training_progress_line_handler(line):
+        _update_splats_from_line(line)
+        line_stripped = line.strip()
+        if line_stripped:
+            if line_stripped.startswith("LIVE_RENDER "):
+                try:
+                    render_data = json.loads(
+                        line_stripped.removeprefix("LIVE_RENDER ").strip()
+                    )
+                    live_payload = _build_training_live_payload(
+                        project_id, render_data
+                    )
+                    emit_training_live_preview(project_id, live_payload)
+                except Exception as exc:
+                    append_log_line(
+                        project_id,
+                        f"[live_render error] {exc}",
+                    )
+                return
+
+        # Every iteration format has a "/" between the counters; most
+        # trainer chatter does not, so skip the regex engine for it.
+        match = _match_training_iteration(line) if "/" in line else None
+        if match:
+            current = int(match.group(1))
+            total = int(match.group(2))
+            training_progress.current = current
+            training_progress.total = total
+            if total != iteration_total and iteration_total > 0:
+                total = iteration_total
+            if total > 0:
+                percent = int((min(current, total) / total) * 100)
+                _publish_training_progress(
+                    current, total, percent, f"Iteration {current}"
+                )
+            return
+        line_lower = line.lower()
+        if "iteration" in line_lower or "step" in line_lower:
+            number_match = _FIRST_NUMBER_RE.search(line)
+            if number_match:
+                current = int(number_match.group(1))
+                if iteration_total > 0 and current <= iteration_total:
+                    percent = int((current / iteration_total) * 100)
+                    training_progress.current = current
+                    training_progress.total = iteration_total
+                    _publish_training_progress(
+                        current, iteration_total, percent, f"Step {current}"
+                    )
+
+    return training_progress_line_handler, training_progress
+
+
+def _match_training_iteration(line: str) -> re.Match[str] | None:
+    """Match the highest-priority iteration format found in a trainer line."""
+    if not _TRAINING_ITERATION_RE.search(line):
+        return None
+    for pattern in _TRAINING_ITERATION_PATTERNS:
+        match = pattern.search(line)
+        if match:
+            return match
+    return None
 
 
 def _calculate_progress_percent(current: int, total: int) -> int:
@@ -117,8 +393,8 @@ def _build_training_live_payload(project_id: str, render_data: dict) -> dict:
 
 
 
-def finalize_project(project_id):
-    """Finalize project completion."""
+def finalize_project(project_id, result_ply=None):
+    """Finalize project completion, recording the trained PLY path if known."""
     try:
         update_state(project_id, "finalizing", status="running")
         update_stage_detail(
@@ -129,12 +405,14 @@ def finalize_project(project_id):
             project_id, "finalizing", text="Processing complete", subtext=None
         )
 
+        end_time = datetime.now().isoformat()
         with project_store.status_lock:
-            project_store.processing_status[project_id]["status"] = "completed"
-            project_store.processing_status[project_id]["end_time"] = (
-                datetime.now().isoformat()
-            )
-            save_projects_db()
+            project = project_store.processing_status[project_id]
+            project["status"] = "completed"
+            project["end_time"] = end_time
+            if result_ply is not None:
+                project["result_ply"] = str(result_ply)
+        request_projects_db_save()
 
         append_log_line(project_id, "🎉 PobimSplats processing completed successfully!")
     except Exception as exc:
@@ -156,13 +434,7 @@ def run_opensplat_training(
     """Run OpenSplat training and finalize the project."""
     try:
         images_path = paths["images_path"]
-        num_images = len(
-            [
-                f
-                for f in os.listdir(images_path)
-                if f.lower().endswith((".jpg", ".jpeg", ".png", ".bmp", ".tiff"))
-            ]
-        )
+        num_images = count_image_files(images_path)
 
         update_state(project_id, "gaussian_splatting", status="running")
         project_entry = project_store.processing_status.get(project_id, {})
@@ -246,24 +518,28 @@ def run_opensplat_training(
         )
 
         opensplat_binary = app_config.OPENSPLAT_BINARY_PATH
-        if opensplat_binary.is_dir():
+        try:
+            binary_mode = opensplat_binary.stat().st_mode
+        except OSError:
+            raise Exception(f"OpenSplat binary not found at {opensplat_binary}")
+        if stat.S_ISDIR(binary_mode):
             potential_binary = opensplat_binary / "opensplat"
-            if potential_binary.exists():
+            try:
+                binary_mode = potential_binary.stat().st_mode
                 opensplat_binary = potential_binary
-        if not opensplat_binary.exists():
-            raise Exception(f"OpenSplat binary not found at {opensplat_binary}")
+            except OSError:
+                pass
         opensplat_working_dir = (
-            opensplat_binary.parent if opensplat_binary.is_file() else opensplat_binary
+            opensplat_binary.parent if stat.S_ISREG(binary_mode) else opensplat_binary
         )
 
+        # Resolve the results directory once; every output path hangs off it.
+        results_dir = paths["results_path"].absolute()
         output_ply = (
-            paths["results_path"]
-            / f"{project_id}_{quality_mode}_{enhanced_iterations}iter.ply"
-        )
-        live_render_dir = paths["results_path"] / TRAINING_LIVE_RENDER_DIRNAME
-        live_render_control_path = (
-            paths["results_path"] / TRAINING_LIVE_CONTROL_FILENAME
+            results_dir / f"{project_id}_{quality_mode}_{enhanced_iterations}iter.ply"
         )
+        live_render_dir = results_dir / TRAINING_LIVE_RENDER_DIRNAME
+        live_render_control_path = results_dir / TRAINING_LIVE_CONTROL_FILENAME
         live_render_dir.mkdir(parents=True, exist_ok=True)
         _write_training_live_control(project_id, live_render_control_path)
         cmd = [
@@ -272,11 +548,11 @@ def run_opensplat_training(
             "-n",
             str(enhanced_iterations),
             "--output",
-            str(output_ply.absolute()),
+            str(output_ply),
             "--live-render-dir",
-            str(live_render_dir.absolute()),
+            str(live_render_dir),
             "--live-render-control",
-            str(live_render_control_path.absolute()),
+            str(live_render_control_path),
             "--live-render-every-percent",
             str(live_render_percent_step),
         ]
@@ -337,6 +613,7 @@ def run_opensplat_training(
                             "quality": 100,
                             "use_gpu": config.get("use_gpu_extraction", True),
                             "ffmpeg_cpu_workers": config.get("ffmpeg_cpu_workers", 8),
+                            "ffmpeg_threads": config.get("ffmpeg_threads", 0),
                             "replacement_search_radius": config.get(
                                 "replacement_search_radius", 4
                             ),
@@ -381,50 +658,28 @@ def run_opensplat_training(
                 project_id, "⚠️ Training images path not configured, using COLMAP images"
             )
 
-        if quality_mode in ["high", "ultra", "hard", "custom", "balanced"]:
-            densify_threshold = opensplat_config.get("densify_grad_threshold")
-            refine_every = 75
-            warmup = 750
-            ssim = 0.25
-
+        refinement_params = _build_opensplat_refinement_params(
+            quality_mode, opensplat_config, config
+        )
+        if refinement_params is not None:
             if quality_mode == "custom":
-                custom_densify = config.get("densify_grad_threshold")
-                custom_refine = config.get("refine_every")
-                custom_warmup = config.get("warmup_length")
-                custom_ssim = config.get("ssim_weight")
-                if custom_densify is not None:
-                    densify_threshold = custom_densify
-                if custom_refine is not None:
-                    refine_every = custom_refine
-                if custom_warmup is not None:
-                    warmup = custom_warmup
-                if custom_ssim is not None:
-                    ssim = custom_ssim
                 append_log_line(
                     project_id,
-                    f"🔧 Custom OpenSplat params: densify={densify_threshold}, refine={refine_every}, warmup={warmup}, ssim={ssim}",
+                    "🔧 Custom OpenSplat params: "
+                    f"densify={refinement_params['densify_grad_threshold']}, "
+                    f"refine={refinement_params['refine_every']}, "
+                    f"warmup={refinement_params['warmup_length']}, "
+                    f"ssim={refinement_params['ssim_weight']}",
                 )
-            elif quality_mode == "ultra":
-                refine_every = 50
-                warmup = 1000
-                ssim = 0.3
-            elif quality_mode == "hard":
-                refine_every = 60
-                warmup = 900
-                ssim = 0.28
-
-            if densify_threshold is not None:
-                cmd.extend(["--densify-grad-thresh", str(densify_threshold)])
-            cmd.extend(["--refine-every", str(refine_every)])
-            cmd.extend(["--warmup-length", str(warmup)])
-            cmd.extend(["--ssim-weight", str(ssim)])
-            if quality_mode == "ultra":
-                cmd.extend(["--reset-alpha-every", "20"])
-            elif quality_mode == "hard":
-                cmd.extend(["--reset-alpha-every", "24"])
+            for key, flag in OPENSPLAT_REFINEMENT_FLAGS:
+                value = refinement_params[key]
+                if value is not None:
+                    cmd.extend([flag, str(value)])
             append_log_line(
                 project_id,
-                f"⚡ Enhanced parameters: densify_threshold={densify_threshold}, refine_every={refine_every}",
+                "⚡ Enhanced parameters: "
+                f"densify_threshold={refinement_params['densify_grad_threshold']}, "
+                f"refine_every={refinement_params['refine_every']}",
             )
 
         if config.get("mixed_precision", False):
@@ -435,180 +690,10 @@ def run_opensplat_training(
             )
 
         iteration_total = enhanced_iterations
-        training_progress = {"current": 0, "total": iteration_total}
-        training_progress_log = {"last_bucket": -1}
-        splats_state = {"current": 0, "max": 0}
-
-        splats_patterns = (
-            re.compile(r"new count\s+(\d+)", re.IGNORECASE),
-            re.compile(r"remaining\s+(\d+)", re.IGNORECASE),
-            re.compile(r"Loaded\s+(\d+)\s+gaussians", re.IGNORECASE),
+        training_line_handler, training_progress = make_training_progress_handler(
+            project_id, iteration_total
         )
-
-        def _update_splats_from_line(line):
-            for pattern in splats_patterns:
-                match = pattern.search(line)
-                if match:
-                    try:
-                        count = int(match.group(1))
-                    except (TypeError, ValueError):
-                        return
-                    splats_state["current"] = count
-                    if count > splats_state["max"]:
-                        splats_state["max"] = count
-                    return
-
-        def _format_count(value):
-            try:
-                return f"{int(value):,}"
-            except (TypeError, ValueError):
-                return str(value)
-
-        def _splats_suffix():
-            max_count = splats_state["max"]
-            if max_count <= 0:
-                return ""
-            current = splats_state["current"] or max_count
-            return (
-                f" | Splats: {_format_count(current)} (max {_format_count(max_count)})"
-            )
-
-        def training_line_handler(line):
-            _update_splats_from_line(line)
-            line_stripped = line.strip()
-            if line_stripped:
-                if line_stripped.startswith("LIVE_RENDER "):
-                    try:
-                        render_data = json.loads(
-                            line_stripped.removeprefix("LIVE_RENDER ").strip()
-                        )
-                        live_payload = _build_training_live_payload(
-                            project_id, render_data
-                        )
-                        emit_training_live_preview(project_id, live_payload)
-                    except Exception as exc:
-                        append_log_line(
-                            project_id,
-                            f"[live_render error] {exc}",
-                        )
-                    return
-
-            patterns = [
-                r"Iteration\s+(\d+)/(\d+)",
-                r"Step\s+(\d+)/(\d+)",
-                r"Epoch\s+(\d+)/(\d+)",
-                r"Progress:\s+(\d+)/(\d+)",
-                r"Training\s+(\d+)/(\d+)",
-                r"iter\s*:\s*(\d+)\s*/\s*(\d+)",
-                r"(\d+)\s*/\s*(\d+)\s*iterations?",
-                r"Iteration\s+(\d+)\s+\(.*?\)\s*/\s*(\d+)",
-                r"\[(\d+)/(\d+)\]",
-                r"it\s*(\d+)/(\d+)",
-                r"step\s*(\d+)\s*\/\s*(\d+)",
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    current = int(match.group(1))
-                    total = int(match.group(2))
-                    training_progress["current"] = current
-                    training_progress["total"] = total
-                    if total != iteration_total and iteration_total > 0:
-                        total = iteration_total
-                    if total > 0:
-                        percent = int((min(current, total) / total) * 100)
-                        splats_subtext = None
-                        if splats_state["max"] > 0:
-                            splats_subtext = (
-                                f"Splats: {_format_count(splats_state['current'] or splats_state['max'])} "
-                                f"(max {_format_count(splats_state['max'])})"
-                            )
-                        details = {
-                            "text": f"Training iterations: {current}/{total}",
-                            "current_item": current,
-                            "total_items": total,
-                            "item_name": f"Iteration {current}",
-                        }
-                        if splats_state["max"] > 0:
-                            details["max_splats"] = splats_state["max"]
-                            details["current_splats"] = (
-                                splats_state["current"] or splats_state["max"]
-                            )
-                        emit_stage_progress(
-                            project_id, "gaussian_splatting", percent, details
-                        )
-                        update_state(
-                            project_id,
-                            "gaussian_splatting",
-                            progress=min(percent, 99),
-                            details=details,
-                        )
-                        update_stage_detail(
-                            project_id,
-                            "gaussian_splatting",
-                            text=f"Training iterations: {current}/{total}",
-                            subtext=splats_subtext,
-                        )
-                        should_log, progress_percent = should_emit_progress_milestone(
-                            training_progress_log, current, total, percent_step=1
-                        )
-                        if should_log:
-                            append_log_line(
-                                project_id,
-                                f"🏋️ Training progress: {current}/{total} iterations ({progress_percent}%){_splats_suffix()}",
-                            )
-                    return
-            if any(keyword in line.lower() for keyword in ["iteration", "step"]):
-                number_match = re.search(r"(\d+)", line)
-                if number_match:
-                    current = int(number_match.group(1))
-                    if iteration_total > 0 and current <= iteration_total:
-                        percent = int((current / iteration_total) * 100)
-                        training_progress["current"] = current
-                        training_progress["total"] = iteration_total
-                        splats_subtext = None
-                        if splats_state["max"] > 0:
-                            splats_subtext = (
-                                f"Splats: {_format_count(splats_state['current'] or splats_state['max'])} "
-                                f"(max {_format_count(splats_state['max'])})"
-                            )
-                        details = {
-                            "text": f"Training iterations: {current}/{iteration_total}",
-                            "current_item": current,
-                            "total_items": iteration_total,
-                            "item_name": f"Step {current}",
-                        }
-                        if splats_state["max"] > 0:
-                            details["max_splats"] = splats_state["max"]
-                            details["current_splats"] = (
-                                splats_state["current"] or splats_state["max"]
-                            )
-                        emit_stage_progress(
-                            project_id, "gaussian_splatting", percent, details
-                        )
-                        update_state(
-                            project_id,
-                            "gaussian_splatting",
-                            progress=min(percent, 99),
-                            details=details,
-                        )
-                        update_stage_detail(
-                            project_id,
-                            "gaussian_splatting",
-                            text=f"Training iterations: {current}/{iteration_total}",
-                            subtext=splats_subtext,
-                        )
-                        should_log, progress_percent = should_emit_progress_milestone(
-                            training_progress_log,
-                            current,
-                            iteration_total,
-                            percent_step=1,
-                        )
-                        if should_log:
-                            append_log_line(
-                                project_id,
-                                f"🏋️ Training progress: {current}/{iteration_total} iterations ({progress_percent}%){_splats_suffix()}",
-                            )
+        splats_state = training_progress.splats
 
         run_command_with_logs(
             project_id,
@@ -619,8 +704,8 @@ def run_opensplat_training(
         )
 
         update_state(project_id, "gaussian_splatting", status="completed", progress=100)
-        current = training_progress["current"] or iteration_total or 0
-        total = training_progress["total"] or iteration_total or current
+        current = training_progress.current or iteration_total or 0
+        total = training_progress.total or iteration_total or current
         final_subtext = "Training complete"
         if splats_state["max"] > 0:
             final_subtext = (
@@ -644,7 +729,7 @@ def run_opensplat_training(
             )
         else:
             append_log_line(project_id, "✅ PobimSplats Training completed")
-        finalize_project(project_id)
+        finalize_project(project_id, result_ply=output_ply)
     except Exception as exc:
         logger.error("OpenSplat training failed for %s: %s", project_id, exc)
         append_log_line(project_id, f"❌ Training Error: {str(exc)}")
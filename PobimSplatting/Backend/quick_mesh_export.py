@@ -6,17 +6,21 @@ Usage: python quick_mesh_export.py <project_id>
 This assumes you've already run dense reconstruction.
 If you haven't, use run_textured_mesh_direct.py instead.
 """
+import logging
 import sys
 import time
-import subprocess
 from pathlib import Path
 
 # Add Backend to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from core.config import RESULTS_FOLDER, UPLOAD_FOLDER
+from add_colors_to_mesh import transfer_colors_to_mesh
 
 def main():
+    # transfer_colors_to_mesh reports its progress through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     if len(sys.argv) < 2:
         print("❌ Usage: python quick_mesh_export.py <project_id>")
         print("\n💡 This script uses existing dense reconstruction and mesh files.")
@@ -66,29 +70,29 @@ def main():
     print("=" * 70)
     print()
     
-    # Run add_colors_to_mesh.py
+    results_path = RESULTS_FOLDER / project_id
+    glb_file = results_path / f"{project_id}_colored_mesh.glb"
+    obj_file = results_path / f"{project_id}_colored_mesh.obj"
+    ply_file = results_path / f"{project_id}_colored_mesh.ply"
+    results_path.mkdir(parents=True, exist_ok=True)
+
+    # Transfer colors in-process instead of spawning add_colors_to_mesh.py
     start_time = time.time()
     
     print("🔄 Transferring vertex colors...")
-    result = subprocess.run(
-        [sys.executable, "add_colors_to_mesh.py"],
-        cwd=Path(__file__).parent,
-        capture_output=False,
-        text=True
-    )
-    
-    if result.returncode != 0:
+    if not transfer_colors_to_mesh(mesh_file, fused_ply, ply_file):
         print(f"\n❌ Color transfer failed!")
         sys.exit(1)
+
+    try:
+        import trimesh
+
+        trimesh.load(str(ply_file)).export(str(glb_file))
+    except Exception as e:
+        print(f"\n⚠️  GLB export failed: {e}")
     
     elapsed = time.time() - start_time
     
-    # Check output files
-    results_path = RESULTS_FOLDER / project_id
-    glb_file = results_path / f"{project_id}_colored_mesh.glb"
-    obj_file = results_path / f"{project_id}_colored_mesh.obj"
-    ply_file = results_path / f"{project_id}_colored_mesh.ply"
-    
     print()
     print("=" * 70)
     print("  ✅ SUCCESS!")
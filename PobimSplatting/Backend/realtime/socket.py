@@ -5,12 +5,12 @@ Socket.IO initialisation and helpers.
 from __future__ import annotations
 
 import logging
+import threading
 from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
 
 from flask import request
 
-from ..core import projects as project_store
-from ..core.projects import get_recent_log_lines
+from ..core.projects import get_project_snapshot, get_recent_log_lines
 from ..core.projects import register_emitters
 
 logger = logging.getLogger(__name__)
@@ -32,6 +32,12 @@ except ImportError:  # pragma: no cover - optional dependency
 
 socketio: Optional["FlaskSocketIO"] = None
 
+STAGE_PROGRESS_FLUSH_INTERVAL = 0.05
+
+# Latest stage_progress payload per project room and stage; repeats collapse.
+_pending_stage_progress: Dict[str, Dict[str, Dict[str, Any]]] = {}
+_pending_stage_progress_lock = threading.Lock()
+
 
 def init_socketio(app) -> Optional["FlaskSocketIO"]:
     """
@@ -43,7 +49,13 @@ def init_socketio(app) -> Optional["FlaskSocketIO"]:
         register_emitters()
         return None
 
-    socketio = SocketIO(app, cors_allowed_origins="*", logger=True, async_mode="threading")
+    socketio = SocketIO(
+        app,
+        cors_allowed_origins="*",
+        logger=False,
+        engineio_logger=False,
+        async_mode="threading",
+    )
     register_emitters(
         emit_stage_progress=_emit_stage_progress,
         emit_log_message=_emit_log_message,
@@ -51,20 +63,30 @@ def init_socketio(app) -> Optional["FlaskSocketIO"]:
         emit_sparse_pose_update=_emit_sparse_pose_update,
     )
     _register_handlers()
+    socketio.start_background_task(_flush_stage_progress_loop)
     return socketio
 
 
+def _room_has_clients(project_id: str) -> bool:
+    """Return whether anyone joined the project room; True if it can't be told."""
+    try:
+        return bool(socketio.server.manager.rooms.get("/", {}).get(project_id))
+    except Exception:  # pragma: no cover - depends on python-socketio internals
+        return True
+
+
 def _emit_progress_update(project_id: str, event_type: str, data: Dict[str, Any]) -> None:
     """Emit a websocket event to clients subscribed to the project room."""
-    if not socketio:
+    if not socketio or not _room_has_clients(project_id):
         return
 
     try:
         socketio.emit(event_type, data, to=project_id)
-        if event_type == "training_live_preview":
-            logger.debug("Emitted %s to room %s", event_type, project_id)
-        else:
-            logger.debug("Emitted %s to room %s: %s", event_type, project_id, data)
+        if logger.isEnabledFor(logging.DEBUG):
+            if event_type == "training_live_preview":
+                logger.debug("Emitted %s to room %s", event_type, project_id)
+            else:
+                logger.debug("Emitted %s to room %s: %s", event_type, project_id, data)
     except Exception as exc:  # pragma: no cover - logging only
         logger.error("Failed to emit progress update: %s", exc)
 
@@ -76,7 +98,22 @@ def _emit_stage_progress(project_id: str, stage_key: str, progress: int, details
     }
     if details:
         payload["details"] = details
-    _emit_progress_update(project_id, "stage_progress", payload)
+    with _pending_stage_progress_lock:
+        _pending_stage_progress.setdefault(project_id, {})[stage_key] = payload
+
+
+def _flush_stage_progress_loop() -> None:
+    """Emit coalesced stage_progress payloads once per flush interval."""
+    while socketio:
+        socketio.sleep(STAGE_PROGRESS_FLUSH_INTERVAL)
+        with _pending_stage_progress_lock:
+            if not _pending_stage_progress:
+                continue
+            pending = list(_pending_stage_progress.items())
+            _pending_stage_progress.clear()
+        for project_id, stages in pending:
+            for payload in stages.values():
+                _emit_progress_update(project_id, "stage_progress", payload)
 
 
 def _emit_log_message(project_id: str, message: str, timestamp: str) -> None:
@@ -120,12 +157,11 @@ def _register_handlers() -> None:
     @socketio.on("join_project")
     def on_join_project(data):
         project_id = data.get("project_id")
-        if project_id and project_id in project_store.processing_status:
+        project_data = get_project_snapshot(project_id) if project_id else None
+        if project_data is not None:
             join_room_fn(project_id)
             logger.info("Client %s joined project %s", _request_sid(), project_id)
 
-            with project_store.status_lock:
-                project_data = project_store.processing_status[project_id].copy()
             recent_logs, log_count = get_recent_log_lines(project_id)
             project_data["recent_logs"] = recent_logs
             project_data["log_count"] = log_count
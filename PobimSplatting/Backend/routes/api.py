@@ -11,25 +11,33 @@ import shutil
 import subprocess
 import threading
 import tempfile
+import time
 import uuid
 from itertools import islice
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import quote
 
-from flask import Blueprint, jsonify, request, send_file
+from flask import Blueprint, Response, jsonify, request, send_file
 
 from ..core import config as app_config
 from ..core import projects as project_store
 from ..core.files import (
     allowed_file,
     get_file_type,
+    remove_tree_in_background,
+    save_upload,
     secure_unicode_filename,
     setup_project_directories,
 )
 from ..core.projects import (
+    add_project,
     append_log_line,
+    get_project_ids_by_recency,
+    get_project_snapshot,
     get_recent_log_lines,
     initialize_project_entry,
+    remove_project,
     save_projects_db,
     update_stage_detail,
     update_state,
@@ -58,25 +66,200 @@ video_processor = VideoProcessor()
 
 TRAINING_LIVE_RENDER_DIRNAME = "live_training_preview"
 TRAINING_LIVE_CONTROL_FILENAME = "live_training_preview_control.json"
+# Custom quality-mode fields accepted on upload, with the type each is cast to.
+CUSTOM_PARAM_SPEC = (
+    # OpenSplat training parameters
+    ("iterations", int),
+    ("densify_grad_threshold", float),
+    ("refine_every", int),
+    ("warmup_length", int),
+    ("ssim_weight", float),
+    # OpenSplat learning rates
+    ("learning_rate", float),
+    ("position_lr_init", float),
+    ("position_lr_final", float),
+    ("feature_lr", float),
+    ("opacity_lr", float),
+    ("scaling_lr", float),
+    ("rotation_lr", float),
+    ("percent_dense", float),
+    # COLMAP SIFT feature parameters
+    ("peak_threshold", float),
+    ("edge_threshold", float),
+    ("max_num_orientations", int),
+    # COLMAP feature extraction & matching
+    ("max_num_features", int),
+    ("max_num_matches", int),
+    ("sequential_overlap", int),
+    # COLMAP mapper (reconstruction)
+    ("min_num_matches", int),
+    ("max_num_models", int),
+    ("init_num_trials", int),
+    ("mapper_cpu_threads", int),
+    ("structure_less_registration_fallback", int),
+    ("abs_pose_max_error", float),
+    ("abs_pose_min_num_inliers", int),
+    ("abs_pose_min_inlier_ratio", float),
+    ("max_reg_trials", int),
+)
+
+# Config keys a retry request may override, in the order they are logged.
+RETRY_OVERRIDE_PARAMS = (
+    # OpenSplat training
+    "iterations",
+    "densify_grad_threshold",
+    "refine_every",
+    "warmup_length",
+    "ssim_weight",
+    "learning_rate",
+    "position_lr_init",
+    "position_lr_final",
+    "feature_lr",
+    "opacity_lr",
+    "scaling_lr",
+    "rotation_lr",
+    "percent_dense",
+    "crop_size",
+    # COLMAP feature extraction
+    "max_num_features",
+    "max_image_size",
+    "peak_threshold",
+    "edge_threshold",
+    # COLMAP feature matching
+    "matcher_type",
+    "max_num_matches",
+    "sequential_overlap",
+    # COLMAP sparse reconstruction
+    "min_num_matches",
+    "max_num_models",
+    "init_num_trials",
+    "mapper_cpu_threads",
+    "force_cpu_sparse_reconstruction",
+    "matcher_fallback_retry_type",
+    "sparse_retry_sfm_engine",
+    "cpu_sparse_registration_profile",
+    "structure_less_registration_fallback",
+    "abs_pose_max_error",
+    "abs_pose_min_num_inliers",
+    "abs_pose_min_inlier_ratio",
+    "max_reg_trials",
+    # Frame extraction and resolution
+    "extraction_mode",
+    "max_frames",
+    "target_fps",
+    "colmap_resolution",
+    "training_resolution",
+    "use_separate_training_images",
+    "colmap_sharpness_boost",
+    "smart_frame_selection",
+    "adaptive_frame_budget",
+    "oversample_factor",
+    "replacement_search_radius",
+    "ffmpeg_cpu_workers",
+    "ffmpeg_threads",
+    "adaptive_pair_scheduling",
+    "training_live_preview_interval_percent",
+)
+
+_THUMBNAIL_EXTENSION_PRIORITY = {
+    ext: index for index, ext in enumerate((".jpg", ".jpeg", ".png", ".JPG", ".JPEG", ".PNG"))
+}
 _CAMERA_POSE_MANIFEST_CACHE: dict[tuple[str, int], dict] = {}
 _CAMERA_POSE_MANIFEST_CACHE_MAX = 16
 
 
+# Path separators or a parent reference in a client-supplied file name.
+_UNSAFE_FILENAME_PATTERN = re.compile(r"[/\\]|\.\.")
+
+
+_pipeline_slots = threading.BoundedSemaphore(app_config.MAX_CONCURRENT_PIPELINES)
+
+
+def _run_pipeline_in_slot(project_id: str, token: str, target, args: tuple) -> None:
+    with _pipeline_slots:
+        # While this submission waited, the project may have been cancelled,
+        # deleted, or resubmitted with a newer token.
+        with project_store.status_lock:
+            project = project_store.processing_status.get(project_id)
+            if (
+                project is None
+                or project.get("pipeline_token") != token
+                or project.get("status") != "queued"
+            ):
+                logger.info("Skipping stale queued pipeline for project %s", project_id)
+                return
+            project["status"] = "processing"
+        target(*args)
+
+
+def _start_pipeline(project_id: str, target, args: tuple) -> None:
+    """Run a queued project's pipeline on a daemon thread once a slot is free."""
+    token = uuid.uuid4().hex
+    with project_store.status_lock:
+        project_store.processing_status[project_id]["pipeline_token"] = token
+    threading.Thread(
+        target=_run_pipeline_in_slot,
+        args=(project_id, token, target, args),
+        name=f"pipeline-{project_id[:8]}",
+        daemon=True,
+    ).start()
+
+
+_mesh_export_slots = threading.BoundedSemaphore(app_config.MAX_CONCURRENT_MESH_EXPORTS)
+_mesh_exports_lock = threading.Lock()
+_active_mesh_exports: set[str] = set()
+
+
+def _run_mesh_export_in_slot(project_id: str, args: tuple) -> None:
+    try:
+        with _mesh_export_slots:
+            _run_mesh_export_background(*args)
+    finally:
+        with _mesh_exports_lock:
+            _active_mesh_exports.discard(project_id)
+
+
+def _start_mesh_export(project_id: str, args: tuple) -> bool:
+    """Queue a textured mesh export; returns False if one is already pending for the project."""
+    with _mesh_exports_lock:
+        if project_id in _active_mesh_exports:
+            return False
+        _active_mesh_exports.add(project_id)
+    threading.Thread(
+        target=_run_mesh_export_in_slot,
+        args=(project_id, args),
+        name=f"mesh-export-{project_id[:8]}",
+        daemon=True,
+    ).start()
+    return True
+
+
 def _calculate_progress_percent(current: int, total: int) -> int:
     if total <= 0:
         return 0
     return max(0, min(100, int((min(current, total) / total) * 100)))
 
 
+_IMAGE_SUFFIXES = frozenset(ext.lower() for ext in app_config.IMAGE_EXTENSIONS)
+_VIDEO_SUFFIXES = frozenset(ext.lower() for ext in app_config.VIDEO_EXTENSIONS)
+
+
+def _list_files_with_suffixes(directory: Path, suffixes: frozenset[str]) -> list[str]:
+    """Return sorted paths of regular files in one scandir pass, matching suffix case-insensitively."""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                entry.path
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in suffixes and entry.is_file()
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 def _count_project_images(project_id: str) -> int:
     images_path = app_config.UPLOAD_FOLDER / project_id / "images"
-    if not images_path.exists():
-        return 0
-    return sum(
-        1
-        for child in images_path.iterdir()
-        if child.is_file() and child.suffix.lower() in app_config.IMAGE_EXTENSIONS
-    )
+    return len(_list_files_with_suffixes(images_path, _IMAGE_SUFFIXES))
 
 
 def _clear_directory_contents(path: Path) -> None:
@@ -100,6 +283,32 @@ def _preview_url_with_version(base_url: str, file_path: Path) -> str:
     return f"{base_url}?v={version}"
 
 
+def _list_frame_previews(directory: Path, url_prefix: str, frame_type: str) -> list[dict]:
+    """Describe extracted frame_*.jpg files from one directory scan, sorted by name."""
+    try:
+        with os.scandir(directory) as entries:
+            frames = sorted(
+                (
+                    entry
+                    for entry in entries
+                    if entry.name.startswith("frame_") and entry.name.endswith(".jpg")
+                ),
+                key=lambda entry: entry.name,
+            )
+    except FileNotFoundError:
+        return []
+
+    previews = []
+    for entry in frames:
+        url = f"{url_prefix}/{entry.name}"
+        try:
+            url = f"{url}?v={entry.stat().st_mtime_ns}"
+        except FileNotFoundError:
+            pass
+        previews.append({"name": entry.name, "url": url, "type": frame_type})
+    return previews
+
+
 def _send_uncached_preview(file_path: Path):
     response = send_file(
         file_path, mimetype="image/jpeg", as_attachment=False, max_age=0
@@ -122,8 +331,13 @@ def _send_uncached_binary(
     return response
 
 
+def _project_results_dir(project_id: str) -> Path:
+    """Return ``RESULTS_FOLDER / project_id``."""
+    return app_config.RESULTS_FOLDER / project_id
+
+
 def _get_training_live_preview_paths(project_id: str) -> tuple[Path, Path]:
-    results_dir = app_config.RESULTS_FOLDER / project_id
+    results_dir = _project_results_dir(project_id)
     return (
         results_dir / TRAINING_LIVE_RENDER_DIRNAME,
         results_dir / TRAINING_LIVE_CONTROL_FILENAME,
@@ -404,7 +618,7 @@ def _render_final_training_live_preview(
 
 
 def _latest_project_ply(project_id: str) -> Path | None:
-    results_dir = app_config.RESULTS_FOLDER / project_id
+    results_dir = _project_results_dir(project_id)
     if not results_dir.exists():
         return None
 
@@ -416,6 +630,90 @@ def _latest_project_ply(project_id: str) -> Path | None:
     return ply_files[0] if ply_files else None
 
 
+def _resolve_project_result_ply(project_id: str) -> Path | None:
+    """Return the trained PLY, preferring the path recorded at finalisation."""
+    recorded = project_store.processing_status.get(project_id, {}).get("result_ply")
+    if recorded and os.path.exists(recorded):
+        return Path(recorded)
+
+    # Legacy projects predate result_ply; probe the historical file names.
+    project_dir = _project_results_dir(project_id)
+    for candidate in (
+        project_dir / f"{project_id}_high_7000iter.ply",
+        project_dir / f"{project_id}_2000iter.ply",
+    ):
+        if candidate.exists():
+            return candidate
+    if project_dir.exists():
+        return next(project_dir.glob("*.ply"), None)
+    return None
+
+
+def _largest_ply_file(directory: Path) -> Path | None:
+    """Return the biggest ``*.ply`` in ``directory`` from one scandir pass."""
+    largest_path, largest_size = None, -1
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".ply") or entry.name.startswith("."):
+                continue
+            size = entry.stat().st_size
+            if size > largest_size:
+                largest_path, largest_size = entry.path, size
+    return Path(largest_path) if largest_path is not None else None
+
+
+def _send_result_file(
+    path: Path,
+    *,
+    as_attachment: bool,
+    download_name: str | None = None,
+    mimetype: str = "application/octet-stream",
+):
+    """Send a results file, delegating the transfer to nginx when USE_X_SENDFILE is on.
+
+    Raises FileNotFoundError when ``path`` does not exist.
+    """
+    if app_config.USE_X_SENDFILE:
+        try:
+            relative = path.resolve().relative_to(app_config.RESULTS_FOLDER.resolve())
+        except ValueError:
+            relative = None
+        if relative is not None:
+            if not path.is_file():
+                raise FileNotFoundError(path)
+            response = Response(b"", mimetype=mimetype)
+            response.headers["X-Accel-Redirect"] = (
+                f"{app_config.X_ACCEL_RESULTS_PREFIX}/{relative.as_posix()}"
+            )
+            filename = download_name or path.name
+            disposition = {"filename": filename}
+            try:
+                filename.encode("ascii")
+            except UnicodeEncodeError:
+                # Same RFC 2231 fallback send_file uses for non-ASCII names.
+                disposition = {
+                    "filename": filename.encode("ascii", "ignore").decode("ascii") or path.name,
+                    "filename*": f"UTF-8''{quote(filename, safe='')}",
+                }
+            response.headers.set(
+                "Content-Disposition",
+                "attachment" if as_attachment else "inline",
+                **disposition,
+            )
+            return response
+
+    # Conditional responses answer If-None-Match with 304 and Range with 206;
+    # under gunicorn the file itself goes out through wsgi.file_wrapper.
+    return send_file(
+        path,
+        mimetype=mimetype,
+        as_attachment=as_attachment,
+        download_name=download_name,
+        conditional=True,
+        etag=True,
+    )
+
+
 def _prepare_retry_artifacts(project_id: str, paths: dict, from_stage: str) -> None:
     cleanup_targets = []
 
@@ -1065,8 +1363,26 @@ def _load_project_camera_pose_manifest(project_id, *, prefer_live: bool = True)
                 pass
 
 
+HEALTH_BINARY_PROBE_TTL = 30.0
+_health_binary_probe = {"checked_at": None, "opensplat": False, "colmap": False}
+
+
+def _probe_tool_binaries() -> tuple[bool, bool]:
+    """Return (opensplat, colmap) presence, re-probing the disk/PATH at most every TTL."""
+    now = time.monotonic()
+    checked_at = _health_binary_probe["checked_at"]
+    if checked_at is None or now - checked_at >= HEALTH_BINARY_PROBE_TTL:
+        _health_binary_probe.update(
+            opensplat=app_config.OPENSPLAT_BINARY_PATH.exists(),
+            colmap=bool(shutil.which(get_colmap_executable())),
+            checked_at=now,
+        )
+    return _health_binary_probe["opensplat"], _health_binary_probe["colmap"]
+
+
 @api_bp.route("/health", methods=["GET"])
 def health_check():
+    opensplat_present, colmap_present = _probe_tool_binaries()
     pycolmap_module = get_pycolmap_module()
     pycolmap_version = getattr(pycolmap_module, "__version__", None) if pycolmap_module else None
     pycolmap_ready = pycolmap_supports_global_mapping()
@@ -1077,12 +1393,8 @@ def health_check():
             "timestamp": datetime.now().isoformat(),
             "services": {
                 "backend": "running",
-                "opensplat": "available"
-                if app_config.OPENSPLAT_BINARY_PATH.exists()
-                else "not_found",
-                "colmap": "available"
-                if shutil.which(get_colmap_executable())
-                else "not_found",
+                "opensplat": "available" if opensplat_present else "not_found",
+                "colmap": "available" if colmap_present else "not_found",
                 "pycolmap": "available" if pycolmap_module else "not_found",
                 "pycolmap_global_mapping": "ready" if pycolmap_ready else "not_ready",
             },
@@ -1163,6 +1475,7 @@ def upload_policy_preview():
         "oversample_factor": parse_int(payload.get("oversample_factor"), 10),
         "replacement_search_radius": parse_int(payload.get("replacement_search_radius"), 4),
         "ffmpeg_cpu_workers": parse_int(payload.get("ffmpeg_cpu_workers"), 8),
+        "ffmpeg_threads": parse_int(payload.get("ffmpeg_threads"), 0),
         "use_gpu_extraction": parse_bool(payload.get("use_gpu_extraction"), True),
         "colmap_resolution": payload.get("colmap_resolution", "2K"),
         "training_resolution": payload.get("training_resolution", "4K"),
@@ -1288,15 +1601,15 @@ def upload_files():
             if file_type == "video":
                 # Save video file
                 video_path = paths["project_path"] / filename
-                file.save(video_path)
-                video_files.append(str(video_path))
+                save_upload(file, video_path)
+                video_files.append(video_path)
                 saved_files.append(filename)
 
             elif file_type == "image":
                 # Save image file directly to images folder
                 image_path = paths["images_path"] / filename
-                file.save(image_path)
-                image_files.append(str(image_path))
+                save_upload(file, image_path)
+                image_files.append(image_path)
                 saved_files.append(filename)
 
     if not saved_files:
@@ -1346,6 +1659,7 @@ def upload_files():
         "oversample_factor": int(request.form.get("oversample_factor", 10)),
         "replacement_search_radius": int(request.form.get("replacement_search_radius", 4)),
         "ffmpeg_cpu_workers": int(request.form.get("ffmpeg_cpu_workers", 8)),
+        "ffmpeg_threads": int(request.form.get("ffmpeg_threads", 0)),
         # GPU acceleration for video frame extraction (5-10x faster)
         "use_gpu_extraction": request.form.get("use_gpu_extraction", "true").lower()
         == "true",
@@ -1385,82 +1699,10 @@ def upload_files():
 
     # Add custom parameters if in custom mode
     if quality_mode == "custom":
-        # OpenSplat Training Parameters
-        if request.form.get("iterations"):
-            config["iterations"] = int(request.form.get("iterations"))
-        if request.form.get("densify_grad_threshold"):
-            config["densify_grad_threshold"] = float(
-                request.form.get("densify_grad_threshold")
-            )
-        if request.form.get("refine_every"):
-            config["refine_every"] = int(request.form.get("refine_every"))
-        if request.form.get("warmup_length"):
-            config["warmup_length"] = int(request.form.get("warmup_length"))
-        if request.form.get("ssim_weight"):
-            config["ssim_weight"] = float(request.form.get("ssim_weight"))
-
-        # OpenSplat Learning Rates
-        if request.form.get("learning_rate"):
-            config["learning_rate"] = float(request.form.get("learning_rate"))
-        if request.form.get("position_lr_init"):
-            config["position_lr_init"] = float(request.form.get("position_lr_init"))
-        if request.form.get("position_lr_final"):
-            config["position_lr_final"] = float(request.form.get("position_lr_final"))
-        if request.form.get("feature_lr"):
-            config["feature_lr"] = float(request.form.get("feature_lr"))
-        if request.form.get("opacity_lr"):
-            config["opacity_lr"] = float(request.form.get("opacity_lr"))
-        if request.form.get("scaling_lr"):
-            config["scaling_lr"] = float(request.form.get("scaling_lr"))
-        if request.form.get("rotation_lr"):
-            config["rotation_lr"] = float(request.form.get("rotation_lr"))
-        if request.form.get("percent_dense"):
-            config["percent_dense"] = float(request.form.get("percent_dense"))
-
-        # COLMAP SIFT Feature Parameters
-        if request.form.get("peak_threshold"):
-            config["peak_threshold"] = float(request.form.get("peak_threshold"))
-        if request.form.get("edge_threshold"):
-            config["edge_threshold"] = float(request.form.get("edge_threshold"))
-        if request.form.get("max_num_orientations"):
-            config["max_num_orientations"] = int(
-                request.form.get("max_num_orientations")
-            )
-
-        # COLMAP Feature Extraction & Matching
-        if request.form.get("max_num_features"):
-            config["max_num_features"] = int(request.form.get("max_num_features"))
-        if request.form.get("max_num_matches"):
-            config["max_num_matches"] = int(request.form.get("max_num_matches"))
-        if request.form.get("sequential_overlap"):
-            config["sequential_overlap"] = int(request.form.get("sequential_overlap"))
-
-        # COLMAP Mapper (Reconstruction)
-        if request.form.get("min_num_matches"):
-            config["min_num_matches"] = int(request.form.get("min_num_matches"))
-        if request.form.get("max_num_models"):
-            config["max_num_models"] = int(request.form.get("max_num_models"))
-        if request.form.get("init_num_trials"):
-            config["init_num_trials"] = int(request.form.get("init_num_trials"))
-        if request.form.get("mapper_cpu_threads"):
-            config["mapper_cpu_threads"] = int(request.form.get("mapper_cpu_threads"))
-
-        if request.form.get("structure_less_registration_fallback"):
-            config["structure_less_registration_fallback"] = int(
-                request.form.get("structure_less_registration_fallback")
-            )
-        if request.form.get("abs_pose_max_error"):
-            config["abs_pose_max_error"] = float(request.form.get("abs_pose_max_error"))
-        if request.form.get("abs_pose_min_num_inliers"):
-            config["abs_pose_min_num_inliers"] = int(
-                request.form.get("abs_pose_min_num_inliers")
-            )
-        if request.form.get("abs_pose_min_inlier_ratio"):
-            config["abs_pose_min_inlier_ratio"] = float(
-                request.form.get("abs_pose_min_inlier_ratio")
-            )
-        if request.form.get("max_reg_trials"):
-            config["max_reg_trials"] = int(request.form.get("max_reg_trials"))
+        for param_key, cast in CUSTOM_PARAM_SPEC:
+            value = request.form.get(param_key)
+            if value:
+                config[param_key] = cast(value)
     else:
         # For non-custom modes, use default iterations from quality mode
         if request.form.get("iterations"):
@@ -1484,9 +1726,8 @@ def upload_files():
         input_type=input_type,
     )
 
-    with project_store.status_lock:
-        project_store.processing_status[project_id] = entry
-        save_projects_db()
+    add_project(project_id, entry)
+    save_projects_db()
 
     append_log_line(
         project_id, f"Project created: {input_type} input with {len(saved_files)} files"
@@ -1518,21 +1759,20 @@ def upload_files():
             )
 
     # Start background processing
-    thread = threading.Thread(
-        target=run_processing_pipeline,
-        args=(project_id, paths, config, video_files, image_files),
+    _start_pipeline(
+        project_id,
+        run_processing_pipeline,
+        (project_id, paths, config, video_files, image_files),
     )
-    thread.daemon = True
-    thread.start()
 
     return jsonify(
         {
             "success": True,
             "project_id": project_id,
             "filename": saved_files[0] if saved_files else "",
-            "path": video_files[0]
+            "path": str(video_files[0])
             if video_files
-            else (image_files[0] if image_files else ""),
+            else (str(image_files[0]) if image_files else ""),
             "input_type": input_type,
             "total_files": len(saved_files),
             "video_files": len(video_files),
@@ -1559,10 +1799,9 @@ def check_video_compatibility():
         # Save temporary file
         temp_filename = secure_unicode_filename(file.filename)
         temp_path = app_config.UPLOAD_FOLDER / f"temp_{uuid.uuid4()}_{temp_filename}"
-        file.save(temp_path)
+        save_upload(file, temp_path)
 
-        # Initialize video processor and check compatibility
-        video_processor = VideoProcessor()
+        # Validation and probing only read the shared processor's codec tables
         validation = video_processor.validate_video_compatibility(temp_path)
 
         # Get basic video info for display
@@ -1621,21 +1860,27 @@ def process_project(project_id):
     )
 
 
+# Bulky entry fields /status does not need: recent_logs replaces log_tail,
+# and the uploaded file list is only used by the pipeline.
+STATUS_OMITTED_FIELDS = frozenset({"files", "log_tail"})
+
+
 @api_bp.route("/status/<project_id>")
 def get_status(project_id):
     """Get project processing status."""
-    if project_id not in project_store.processing_status:
+    data = get_project_snapshot(project_id, exclude=STATUS_OMITTED_FIELDS)
+    if data is None:
         return jsonify({"error": "Project not found"}), 404
 
-    with project_store.status_lock:
-        data = project_store.processing_status[project_id].copy()
-
-        recent_logs, log_count = get_recent_log_lines(project_id)
-        data["recent_logs"] = recent_logs
-        data["log_count"] = log_count
-        data["log_visible_count"] = len(recent_logs)
-        data["log_truncated"] = log_count > len(recent_logs)
-        data["stage_details"] = data.get("stage_details", {})
+    # The log tail may fall back to reading the log file, so it runs after
+    # the snapshot with status_lock released.
+    recent_logs, log_count = get_recent_log_lines(project_id)
+    data["recent_logs"] = recent_logs
+    data["log_count"] = log_count
+    data["log_visible_count"] = len(recent_logs)
+    data["log_truncated"] = log_count > len(recent_logs)
+    data["stage_details"] = data.get("stage_details", {})
+    data["queued"] = data.get("status") == "queued"
 
     return jsonify(data)
 
@@ -1668,28 +1913,11 @@ def serve_ply(project_id):
     if project_id not in project_store.processing_status:
         return jsonify({"error": "Project not found"}), 404
 
-    # Try different PLY file naming patterns
-    ply_path = (
-        app_config.RESULTS_FOLDER / project_id / f"{project_id}_high_7000iter.ply"
-    )
-    if not ply_path.exists():
-        ply_path = app_config.RESULTS_FOLDER / project_id / f"{project_id}_2000iter.ply"
-
-    if not ply_path.exists():
-        # Try to find any PLY file in the directory
-        project_dir = app_config.RESULTS_FOLDER / project_id
-        if project_dir.exists():
-            ply_files = list(project_dir.glob("*.ply"))
-            if ply_files:
-                ply_path = ply_files[0]  # Use the first PLY file found
-            else:
-                return jsonify({"error": "PLY file not found"}), 404
-        else:
-            return jsonify({"error": "PLY file not found"}), 404
+    ply_path = _resolve_project_result_ply(project_id)
+    if ply_path is None:
+        return jsonify({"error": "PLY file not found"}), 404
 
-    response = send_file(
-        ply_path, mimetype="application/octet-stream", as_attachment=False
-    )
+    response = _send_result_file(ply_path, as_attachment=False)
 
     # Add CORS headers for SuperSplat viewer
     response.headers["Access-Control-Allow-Origin"] = "*"
@@ -1717,35 +1945,16 @@ def get_frame_previews(project_id):
     }
 
     # Get COLMAP frames
-    if images_path.exists():
-        frame_files = sorted(images_path.glob("frame_*.jpg"))
-        for frame_file in frame_files:
-            frame_info = {
-                "name": frame_file.name,
-                "url": _preview_url_with_version(
-                    f"/api/frame_preview/{project_id}/{frame_file.name}",
-                    frame_file,
-                ),
-                "type": "colmap",
-            }
-            result["colmap_frames"].append(frame_info)
-            result["frames"].append(frame_info)
+    result["colmap_frames"] = _list_frame_previews(
+        images_path, f"/api/frame_preview/{project_id}", "colmap"
+    )
+    result["frames"] = list(result["colmap_frames"])
 
     # Get high-res training frames (if separate extraction was used)
-    if training_images_path.exists():
-        training_files = sorted(training_images_path.glob("frame_*.jpg"))
-        if training_files:
-            result["has_separate_training"] = True
-            for frame_file in training_files:
-                frame_info = {
-                    "name": frame_file.name,
-                    "url": _preview_url_with_version(
-                        f"/api/training_frame_preview/{project_id}/{frame_file.name}",
-                        frame_file,
-                    ),
-                    "type": "training",
-                }
-                result["training_frames"].append(frame_info)
+    result["training_frames"] = _list_frame_previews(
+        training_images_path, f"/api/training_frame_preview/{project_id}", "training"
+    )
+    result["has_separate_training"] = bool(result["training_frames"])
 
     result["count"] = len(result["frames"])
     result["training_count"] = len(result["training_frames"])
@@ -1817,18 +2026,22 @@ def get_project_thumbnail(project_id):
     if not images_path.exists():
         return jsonify({"error": "No images found"}), 404
 
-    # Try to find the first image file
-    image_files = []
-    for ext in [".jpg", ".jpeg", ".png", ".JPG", ".JPEG", ".PNG"]:
-        image_files.extend(sorted(images_path.glob(f"*{ext}")))
+    # One directory pass; pick the same image the per-extension sorted globs
+    # would have returned first (extension priority, then name).
+    best = None
+    with os.scandir(images_path) as entries:
+        for entry in entries:
+            priority = _THUMBNAIL_EXTENSION_PRIORITY.get(os.path.splitext(entry.name)[1])
+            if priority is None or not entry.is_file():
+                continue
+            key = (priority, entry.name)
+            if best is None or key < best[0]:
+                best = (key, entry.path)
 
-    if not image_files:
+    if best is None:
         return jsonify({"error": "No images found"}), 404
 
-    # Return the first image
-    thumbnail_path = image_files[0]
-
-    return _send_uncached_preview(thumbnail_path)
+    return _send_uncached_preview(Path(best[1]))
 
 
 @api_bp.route("/download/<project_id>")
@@ -1839,24 +2052,9 @@ def download_ply(project_id):
 
     project = project_store.processing_status[project_id]
 
-    # Try different PLY file naming patterns
-    ply_path = (
-        app_config.RESULTS_FOLDER / project_id / f"{project_id}_high_7000iter.ply"
-    )
-    if not ply_path.exists():
-        ply_path = app_config.RESULTS_FOLDER / project_id / f"{project_id}_2000iter.ply"
-
-    if not ply_path.exists():
-        # Try to find any PLY file in the directory
-        project_dir = app_config.RESULTS_FOLDER / project_id
-        if project_dir.exists():
-            ply_files = list(project_dir.glob("*.ply"))
-            if ply_files:
-                ply_path = ply_files[0]  # Use the first PLY file found
-            else:
-                return jsonify({"error": "PLY file not found"}), 404
-        else:
-            return jsonify({"error": "PLY file not found"}), 404
+    ply_path = _resolve_project_result_ply(project_id)
+    if ply_path is None:
+        return jsonify({"error": "PLY file not found"}), 404
 
     # Create a safe filename
     project_name = project.get("metadata", {}).get(
@@ -1867,11 +2065,8 @@ def download_ply(project_id):
     ).rstrip()
     download_filename = f"{safe_filename}_{project_id[:8]}.ply"
 
-    return send_file(
-        ply_path,
-        mimetype="application/octet-stream",
-        as_attachment=True,
-        download_name=download_filename,
+    return _send_result_file(
+        ply_path, as_attachment=True, download_name=download_filename
     )
 
 
@@ -1886,7 +2081,7 @@ def list_ply_files(project_id):
         "name", f"PobimSplats_{project_id[:8]}"
     )
 
-    project_dir = app_config.RESULTS_FOLDER / project_id
+    project_dir = _project_results_dir(project_id)
     ply_files = []
 
     if project_dir.exists():
@@ -1953,10 +2148,10 @@ def download_specific_ply(project_id, filename):
     project = project_store.processing_status[project_id]
 
     # Security: prevent path traversal
-    if ".." in filename or "/" in filename or "\\" in filename:
+    if _UNSAFE_FILENAME_PATTERN.search(filename):
         return jsonify({"error": "Invalid filename"}), 400
 
-    ply_path = app_config.RESULTS_FOLDER / project_id / filename
+    ply_path = _project_results_dir(project_id) / filename
     if not ply_path.exists():
         return jsonify({"error": "PLY file not found"}), 404
 
@@ -1990,8 +2185,8 @@ def retry_project(project_id):
 
     project = project_store.processing_status[project_id]
 
-    # Check if project is already processing
-    if project["status"] == "processing":
+    # Check if project is already processing or waiting for a pipeline slot
+    if project["status"] in {"processing", "queued"}:
         return jsonify({"error": "Project is already processing"}), 400
 
     # Validate stage
@@ -2011,97 +2206,14 @@ def retry_project(project_id):
             append_log_line(project_id, "🔧 Updating configuration with new parameters")
             config["resource_override_source"] = "manual_retry"
 
-            # Update OpenSplat training parameters if provided
-            for param_key in [
-                "iterations",
-                "densify_grad_threshold",
-                "refine_every",
-                "warmup_length",
-                "ssim_weight",
-                "learning_rate",
-                "position_lr_init",
-                "position_lr_final",
-                "feature_lr",
-                "opacity_lr",
-                "scaling_lr",
-                "rotation_lr",
-                "percent_dense",
-                "crop_size",
-            ]:
-                if param_key in new_params and new_params[param_key] is not None:
-                    config[param_key] = new_params[param_key]
-                    append_log_line(
-                        project_id, f"  • {param_key}: {new_params[param_key]}"
-                    )
-
-            # Update COLMAP Feature Extraction parameters if provided
-            for param_key in [
-                "max_num_features",
-                "max_image_size",
-                "peak_threshold",
-                "edge_threshold",
-            ]:
-                if param_key in new_params and new_params[param_key] is not None:
-                    config[param_key] = new_params[param_key]
-                    append_log_line(
-                        project_id, f"  • {param_key}: {new_params[param_key]}"
-                    )
-
-            # Update COLMAP Feature Matching parameters if provided
-            for param_key in ["matcher_type", "max_num_matches", "sequential_overlap"]:
-                if param_key in new_params and new_params[param_key] is not None:
-                    config[param_key] = new_params[param_key]
-                    append_log_line(
-                        project_id, f"  • {param_key}: {new_params[param_key]}"
-                    )
-
-            # Update COLMAP Sparse Reconstruction parameters if provided
-            for param_key in [
-                "min_num_matches",
-                "max_num_models",
-                "init_num_trials",
-                "mapper_cpu_threads",
-                "force_cpu_sparse_reconstruction",
-                "matcher_fallback_retry_type",
-                "sparse_retry_sfm_engine",
-                "cpu_sparse_registration_profile",
-                "structure_less_registration_fallback",
-                "abs_pose_max_error",
-                "abs_pose_min_num_inliers",
-                "abs_pose_min_inlier_ratio",
-                "max_reg_trials",
-            ]:
-                if param_key in new_params and new_params[param_key] is not None:
-                    config[param_key] = new_params[param_key]
-                    append_log_line(
-                        project_id, f"  • {param_key}: {new_params[param_key]}"
-                    )
-
-            # Update resolution settings if provided
-            for param_key in [
-                "extraction_mode",
-                "max_frames",
-                "target_fps",
-                "colmap_resolution",
-                "training_resolution",
-                "use_separate_training_images",
-                "colmap_sharpness_boost",
-                "smart_frame_selection",
-                "adaptive_frame_budget",
-                "oversample_factor",
-                "replacement_search_radius",
-                "ffmpeg_cpu_workers",
-                "adaptive_pair_scheduling",
-                "training_live_preview_interval_percent",
-            ]:
+            for param_key in RETRY_OVERRIDE_PARAMS:
                 if param_key in new_params and new_params[param_key] is not None:
-                    config[param_key] = (
-                        _training_live_preview_interval_percent(new_params)
-                        if param_key == "training_live_preview_interval_percent"
-                        else normalize_colmap_sharpness_boost(new_params.get(param_key))
-                        if param_key == "colmap_sharpness_boost"
-                        else new_params[param_key]
-                    )
+                    if param_key == "training_live_preview_interval_percent":
+                        config[param_key] = _training_live_preview_interval_percent(new_params)
+                    elif param_key == "colmap_sharpness_boost":
+                        config[param_key] = normalize_colmap_sharpness_boost(new_params[param_key])
+                    else:
+                        config[param_key] = new_params[param_key]
                     append_log_line(
                         project_id, f"  • {param_key}: {config[param_key]}"
                     )
@@ -2116,27 +2228,18 @@ def retry_project(project_id):
             # Save updated config to project
             with project_store.status_lock:
                 project_store.processing_status[project_id]["config"] = config
-                save_projects_db()
+            save_projects_db()
         else:
             config["resource_override_source"] = "manual_retry"
 
-        # Determine video and image files
-        video_files = []
-        image_files = []
-
-        # Check for existing video files
+        # Determine video and image files, one directory scan each
         project_path = app_config.UPLOAD_FOLDER / project_id
-        for ext in app_config.VIDEO_EXTENSIONS:
-            video_files.extend([str(p) for p in project_path.glob(f"*{ext}")])
-
-        # Check for existing image files
-        images_path = paths["images_path"]
-        for ext in app_config.IMAGE_EXTENSIONS:
-            image_files.extend([str(p) for p in images_path.glob(f"*{ext}")])
+        video_files = _list_files_with_suffixes(project_path, _VIDEO_SUFFIXES)
+        image_files = _list_files_with_suffixes(paths["images_path"], _IMAGE_SUFFIXES)
 
         # Reset project status
         with project_store.status_lock:
-            project_store.processing_status[project_id]["status"] = "processing"
+            project_store.processing_status[project_id]["status"] = "queued"
             project_store.processing_status[project_id]["error"] = None
             project_store.processing_status[project_id]["end_time"] = None
 
@@ -2157,17 +2260,16 @@ def retry_project(project_id):
                     state["started_at"] = None
                     state["completed_at"] = None
 
-            save_projects_db()
+        save_projects_db()
 
         append_log_line(project_id, f"🔄 Retrying processing from stage: {from_stage}")
 
         # Start background processing from the specified stage
-        thread = threading.Thread(
-            target=run_processing_pipeline_from_stage,
-            args=(project_id, paths, config, video_files, image_files, from_stage),
+        _start_pipeline(
+            project_id,
+            run_processing_pipeline_from_stage,
+            (project_id, paths, config, video_files, image_files, from_stage),
         )
-        thread.daemon = True
-        thread.start()
 
         return jsonify(
             {
@@ -2185,10 +2287,16 @@ def retry_project(project_id):
 
 @api_bp.route("/projects")
 def list_projects():
-    """API endpoint to list all projects."""
+    """API endpoint to list projects, newest first (``?limit=`` caps the page)."""
+    limit = request.args.get("limit", type=int)
+    if limit is not None and limit < 0:
+        return jsonify({"error": "limit must be non-negative"}), 400
+
+    projects = []
     with project_store.status_lock:
-        projects = [
-            {
+        for pid in get_project_ids_by_recency(limit):
+            data = project_store.processing_status[pid]
+            projects.append({
                 "id": pid,
                 "metadata": data["metadata"],
                 "status": data["status"],
@@ -2204,11 +2312,8 @@ def list_projects():
                     or (data.get("resource_coordination") or {}).get("auto_tuning_summary")
                     or data.get("auto_tuning_summary")
                 ),
-            }
-            for pid, data in project_store.processing_status.items()
-        ]
+            })
 
-    projects.sort(key=lambda x: x["created_at"], reverse=True)
     return jsonify({"projects": projects})
 
 
@@ -2223,17 +2328,16 @@ def delete_project(project_id):
         project_paths = [
             app_config.UPLOAD_FOLDER / project_id,
             app_config.FRAMES_FOLDER / project_id,
-            app_config.RESULTS_FOLDER / project_id,
+            _project_results_dir(project_id),
         ]
 
+        # Renaming is instant; the recursive delete runs on a worker thread.
         for path in project_paths:
-            if path.exists():
-                shutil.rmtree(path)
+            remove_tree_in_background(path)
 
         # Remove from database
-        with project_store.status_lock:
-            del project_store.processing_status[project_id]
-            save_projects_db()
+        remove_project(project_id)
+        save_projects_db()
 
         return jsonify({"success": True})
 
@@ -2245,22 +2349,48 @@ def delete_project(project_id):
 @api_bp.route("/project/<project_id>/transformation", methods=["GET"])
 def get_transformation(project_id):
     """Get saved transformation data for a project."""
-    if project_id not in project_store.processing_status:
+    project = get_project_snapshot(project_id)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
 
-    with project_store.status_lock:
-        transformation = project_store.processing_status[project_id].get(
-            "transformation",
-            {
-                "position": {"x": 0, "y": 0, "z": 0},
-                "rotation": {"x": 0, "y": 0, "z": 0},
-                "scale": {"x": 1, "y": 1, "z": 1},
-            },
-        )
+    transformation = project.get(
+        "transformation",
+        {
+            "position": {"x": 0, "y": 0, "z": 0},
+            "rotation": {"x": 0, "y": 0, "z": 0},
+            "scale": {"x": 1, "y": 1, "z": 1},
+        },
+    )
 
     return jsonify({"transformation": transformation})
 
 
+# (field, required) pairs accepted in a saved viewer transformation.
+TRANSFORMATION_FIELDS = (("position", True), ("rotation", True), ("scale", False))
+TRANSFORMATION_AXES = ("x", "y", "z")
+
+
+def _parse_transformation(payload: dict) -> tuple[dict | None, str | None]:
+    """Return ``(transformation, None)`` with float x/y/z vectors, or ``(None, error)``."""
+    transformation = {}
+    for field, required in TRANSFORMATION_FIELDS:
+        vector = payload.get(field)
+        if vector is None:
+            if required:
+                return None, f"Missing {field} in transformation"
+            continue
+        try:
+            values = tuple(float(vector[axis]) for axis in TRANSFORMATION_AXES)
+        except (KeyError, TypeError, ValueError):
+            return None, f"Invalid {field} format"
+        if not all(map(math.isfinite, values)) or any(
+            isinstance(vector[axis], bool) for axis in TRANSFORMATION_AXES
+        ):
+            return None, f"Invalid {field} format"
+        transformation[field] = dict(zip(TRANSFORMATION_AXES, values))
+    return transformation, None
+
+
 @api_bp.route("/project/<project_id>/transformation", methods=["POST"])
 def save_transformation(project_id):
     """Save transformation data for a project."""
@@ -2268,26 +2398,20 @@ def save_transformation(project_id):
         return jsonify({"error": "Project not found"}), 404
 
     try:
-        data = request.get_json()
-        if not data or "transformation" not in data:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict) or not isinstance(data.get("transformation"), dict):
             return jsonify({"error": "Missing transformation data"}), 400
 
-        transformation = data["transformation"]
-
-        # Validate transformation structure
-        required_keys = ["position", "rotation"]
-        for key in required_keys:
-            if key not in transformation:
-                return jsonify({"error": f"Missing {key} in transformation"}), 400
-            if not all(axis in transformation[key] for axis in ["x", "y", "z"]):
-                return jsonify({"error": f"Invalid {key} format"}), 400
+        transformation, error = _parse_transformation(data["transformation"])
+        if error:
+            return jsonify({"error": error}), 400
 
         # Save transformation to project data
         with project_store.status_lock:
             project_store.processing_status[project_id]["transformation"] = (
                 transformation
             )
-            save_projects_db()
+        save_projects_db()
 
         return jsonify({"success": True, "transformation": transformation})
 
@@ -2300,16 +2424,16 @@ def save_transformation(project_id):
 def open_colmap_gui(project_id):
     """Get COLMAP GUI command for project inspection."""
     try:
-        # Get project paths (convert to absolute paths)
+        # Resolve the project root once; children are plain joins under it.
         project_path = (app_config.UPLOAD_FOLDER / project_id).resolve()
 
         # Check if project folder exists
-        if not project_path.exists():
+        if not project_path.is_dir():
             return jsonify({"error": "Project not found"}), 404
 
-        database_path = (project_path / "database.db").resolve()
-        images_path = (project_path / "images").resolve()
-        sparse_path = (project_path / "sparse").resolve()
+        database_path = project_path / "database.db"
+        images_path = project_path / "images"
+        sparse_path = project_path / "sparse"
 
         # Check if required files exist
         if not database_path.exists():
@@ -2322,12 +2446,9 @@ def open_colmap_gui(project_id):
         if not images_path.exists():
             return jsonify({"error": "Images folder not found"}), 404
 
-        # Select the best sparse model (with most registered images)
-        sparse_model_path = None
-        if sparse_path.exists():
-            sparse_model_path = select_best_sparse_model(sparse_path)
-            if sparse_model_path:
-                sparse_model_path = sparse_model_path.resolve()
+        # Select the best sparse model (with most registered images);
+        # it returns None when the sparse folder is missing.
+        sparse_model_path = select_best_sparse_model(sparse_path)
 
         # Get COLMAP executable
         colmap_exe = get_colmap_executable()
@@ -2338,7 +2459,7 @@ def open_colmap_gui(project_id):
         cmd_parts.extend(["--image_path", str(images_path)])
 
         # Add import path if sparse model exists
-        if sparse_model_path and sparse_model_path.exists():
+        if sparse_model_path:
             cmd_parts.extend(["--import_path", str(sparse_model_path)])
 
         # Format command as string
@@ -2677,6 +2798,10 @@ def get_training_live_preview_file(project_id, filename):
     return _send_uncached_preview(render_path)
 
 
+EXPORT_MESH_FORMATS = frozenset({"gltf", "glb", "dae"})
+EXPORT_MESH_METHODS = frozenset({"point_cloud", "poisson", "alpha_shapes"})
+
+
 @api_bp.route("/project/<project_id>/export_mesh", methods=["POST"])
 def export_mesh(project_id):
     """
@@ -2697,31 +2822,31 @@ def export_mesh(project_id):
         options = data.get("options", {})
 
         # Validate format
-        if output_format not in ["gltf", "glb", "dae"]:
+        if output_format not in EXPORT_MESH_FORMATS:
             return jsonify({"error": f"Unsupported format: {output_format}"}), 400
 
         # Validate method
-        if method not in ["point_cloud", "poisson", "alpha_shapes"]:
+        if method not in EXPORT_MESH_METHODS:
             return jsonify({"error": f"Unsupported method: {method}"}), 400
 
         # Find PLY file for this project
-        project_dir = app_config.RESULTS_FOLDER / project_id
-        if not project_dir.exists():
+        project_dir = _project_results_dir(project_id)
+        try:
+            ply_path = _largest_ply_file(project_dir)
+        except FileNotFoundError:
             return jsonify({"error": "Project results not found"}), 404
-
-        ply_files = list(project_dir.glob("*.ply"))
-        if not ply_files:
+        if ply_path is None:
             return jsonify({"error": "No PLY file found for this project"}), 404
 
-        # Use the first (or largest) PLY file
-        ply_path = max(ply_files, key=lambda p: p.stat().st_size)
-
         # Create output path
         output_filename = f"{project_id}_export.{output_format}"
         output_path = project_dir / output_filename
 
         # Convert using MeshConverter
-        converter = MeshConverter()
+        converter = MeshConverter(
+            cache_dir=project_dir / app_config.MESH_CACHE_DIRNAME,
+            cache_max_bytes=app_config.MESH_CACHE_MAX_BYTES,
+        )
         logger.info(
             f"Converting {ply_path.name} to {output_format} using {method} method"
         )
@@ -2754,13 +2879,17 @@ def export_mesh(project_id):
         )
 
     except Exception as e:
-        logger.error(f"Failed to export mesh for project {project_id}: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Failed to export mesh for project {project_id}: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+MESH_MIME_TYPES = {
+    ".gltf": "model/gltf+json",
+    ".glb": "model/gltf-binary",
+    ".dae": "model/vnd.collada+xml",
+}
+
+
 @api_bp.route("/project/<project_id>/download_mesh/<filename>")
 def download_mesh(project_id, filename):
     """Download exported mesh file."""
@@ -2769,33 +2898,34 @@ def download_mesh(project_id, filename):
 
     try:
         # Validate filename to prevent directory traversal
-        if ".." in filename or "/" in filename:
+        if _UNSAFE_FILENAME_PATTERN.search(filename):
             return jsonify({"error": "Invalid filename"}), 400
 
-        # Check if file exists
-        file_path = app_config.RESULTS_FOLDER / project_id / filename
-        if not file_path.exists():
-            return jsonify({"error": "File not found"}), 404
+        file_path = _project_results_dir(project_id) / filename
 
         # Determine MIME type
-        mime_types = {
-            ".gltf": "model/gltf+json",
-            ".glb": "model/gltf-binary",
-            ".dae": "model/vnd.collada+xml",
-        }
-        suffix = file_path.suffix.lower()
-        mime_type = mime_types.get(suffix, "application/octet-stream")
+        suffix = os.path.splitext(filename)[1].lower()
+        mime_type = MESH_MIME_TYPES.get(suffix, "application/octet-stream")
 
-        # Send file
-        return send_file(
-            file_path, mimetype=mime_type, as_attachment=True, download_name=filename
-        )
+        # Send file; the sender's own stat doubles as the existence check.
+        # max_age stays at revalidate-always because re-exports overwrite
+        # <project>_export.<format> in place.
+        try:
+            return _send_result_file(
+                file_path, as_attachment=True, download_name=filename, mimetype=mime_type
+            )
+        except FileNotFoundError:
+            return jsonify({"error": "File not found"}), 404
 
     except Exception as e:
         logger.error(f"Failed to download mesh for project {project_id}: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+# Mesh export suffix -> format name reported by list_available_exports.
+MESH_EXPORT_FORMATS = {".gltf": "gltf", ".glb": "glb", ".dae": "dae"}
+
+
 @api_bp.route("/project/<project_id>/available_exports")
 def list_available_exports(project_id):
     """List all available exported mesh files for a project."""
@@ -2803,24 +2933,31 @@ def list_available_exports(project_id):
         return jsonify({"error": "Project not found"}), 404
 
     try:
-        project_dir = app_config.RESULTS_FOLDER / project_id
-        if not project_dir.exists():
-            return jsonify({"exports": []})
+        project_dir = _project_results_dir(project_id)
 
-        # Find all exported mesh files
+        # Find all exported mesh files in a single directory pass
         export_files = []
-        for ext in [".gltf", ".glb", ".dae"]:
-            for file_path in project_dir.glob(f"*{ext}"):
-                export_files.append(
-                    {
-                        "filename": file_path.name,
-                        "format": ext.replace(".", ""),
-                        "size": file_path.stat().st_size,
-                        "size_mb": round(file_path.stat().st_size / (1024 * 1024), 2),
-                        "created_at": file_path.stat().st_mtime,
-                        "download_url": f"/api/project/{project_id}/download_mesh/{file_path.name}",
-                    }
-                )
+        try:
+            with os.scandir(project_dir) as entries:
+                for entry in entries:
+                    export_format = MESH_EXPORT_FORMATS.get(os.path.splitext(entry.name)[1])
+                    if export_format is None or entry.name.startswith("."):
+                        continue
+                    if not entry.is_file():
+                        continue
+                    stat_result = entry.stat()
+                    export_files.append(
+                        {
+                            "filename": entry.name,
+                            "format": export_format,
+                            "size": stat_result.st_size,
+                            "size_mb": round(stat_result.st_size / (1024 * 1024), 2),
+                            "created_at": stat_result.st_mtime,
+                            "download_url": f"/api/project/{project_id}/download_mesh/{entry.name}",
+                        }
+                    )
+        except FileNotFoundError:
+            return jsonify({"exports": []})
 
         # Sort by creation time (newest first)
         export_files.sort(key=lambda x: x["created_at"], reverse=True)
@@ -2832,6 +2969,25 @@ def list_available_exports(project_id):
         return jsonify({"error": str(e)}), 500
 
 
+def _find_sparse_model_dir(project_path: Path) -> Path | None:
+    """Return sparse/0, else the first model folder under sparse/, else None."""
+    sparse_parent = project_path / "sparse"
+    first_model = None
+    try:
+        with os.scandir(sparse_parent) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if entry.name == "0":
+                    # The primary model wins outright; no need to read further.
+                    return sparse_parent / "0"
+                if first_model is None or entry.name < first_model:
+                    first_model = entry.name
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return sparse_parent / first_model if first_model is not None else None
+
+
 def _run_mesh_export_background(project_id, method, quality, output_format):
     """Background worker for mesh export."""
     try:
@@ -2841,26 +2997,13 @@ def _run_mesh_export_background(project_id, method, quality, output_format):
 
         # Find project paths
         project_path = app_config.UPLOAD_FOLDER / project_id
-        sparse_path = project_path / "sparse" / "0"
-
-        if not sparse_path.exists():
-            # Try to find any sparse model
-            sparse_parent = project_path / "sparse"
-            if sparse_parent.exists():
-                sparse_models = [p for p in sparse_parent.iterdir() if p.is_dir()]
-                if sparse_models:
-                    sparse_path = sparse_models[0]
-                else:
-                    logger.error(
-                        f"[Mesh Export] No sparse reconstruction found for {project_id}"
-                    )
-                    return
-            else:
-                logger.error(f"[Mesh Export] No sparse folder found for {project_id}")
-                return
+        sparse_path = _find_sparse_model_dir(project_path)
+        if sparse_path is None:
+            logger.error(f"[Mesh Export] No sparse reconstruction found for {project_id}")
+            return
 
         # Create output path
-        results_dir = app_config.RESULTS_FOLDER / project_id
+        results_dir = _project_results_dir(project_id)
         results_dir.mkdir(exist_ok=True, parents=True)
 
         output_filename = f"{project_id}_textured_mesh_{method}.{output_format}"
@@ -2896,12 +3039,15 @@ def _run_mesh_export_background(project_id, method, quality, output_format):
             logger.error(f"[Mesh Export] ❌ Failed to create mesh for {project_id}")
 
     except Exception as e:
-        logger.error(
+        logger.exception(
             f"[Mesh Export] Exception in background export for {project_id}: {e}"
         )
-        import traceback
 
-        traceback.print_exc()
+
+TEXTURED_MESH_METHODS = frozenset({"poisson", "delaunay"})
+TEXTURED_MESH_QUALITIES = frozenset({"low", "medium", "high"})
+TEXTURED_MESH_FORMATS = frozenset({"ply", "obj", "glb", "dae"})
+TEXTURED_MESH_READY_STATUSES = frozenset({"completed", "error"})
 
 
 @api_bp.route("/project/<project_id>/create_textured_mesh", methods=["POST"])
@@ -2918,7 +3064,8 @@ def create_textured_mesh(project_id):
         quality: Reconstruction quality ('low', 'medium', 'high')
         format: Output format ('ply', 'obj', 'glb', 'dae')
     """
-    if project_id not in project_store.processing_status:
+    project = project_store.processing_status.get(project_id)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
 
     try:
@@ -2928,49 +3075,47 @@ def create_textured_mesh(project_id):
         output_format = data.get("format", "glb").lower()
 
         # Validate parameters
-        if method not in ["poisson", "delaunay"]:
+        if method not in TEXTURED_MESH_METHODS:
             return jsonify(
                 {"error": f'Invalid method: {method}. Use "poisson" or "delaunay"'}
             ), 400
 
-        if quality not in ["low", "medium", "high"]:
+        if quality not in TEXTURED_MESH_QUALITIES:
             return jsonify(
                 {"error": f'Invalid quality: {quality}. Use "low", "medium", or "high"'}
             ), 400
 
-        if output_format not in ["ply", "obj", "glb", "dae"]:
+        if output_format not in TEXTURED_MESH_FORMATS:
             return jsonify({"error": f"Invalid format: {output_format}"}), 400
 
         # Check if project has completed sparse reconstruction
-        project = project_store.processing_status[project_id]
-        if project["status"] not in ["completed", "error"]:
+        if project["status"] not in TEXTURED_MESH_READY_STATUSES:
             return jsonify(
                 {"error": "Project must complete sparse reconstruction first"}
             ), 400
 
         # Check if sparse reconstruction exists
         project_path = app_config.UPLOAD_FOLDER / project_id
-        sparse_path = project_path / "sparse" / "0"
-
-        if not sparse_path.exists():
-            sparse_parent = project_path / "sparse"
-            if not sparse_parent.exists() or not any(sparse_parent.iterdir()):
-                return jsonify(
-                    {
-                        "error": "No sparse reconstruction found",
-                        "hint": "Project must complete COLMAP sparse reconstruction first",
-                    }
-                ), 404
+        if _find_sparse_model_dir(project_path) is None:
+            return jsonify(
+                {
+                    "error": "No sparse reconstruction found",
+                    "hint": "Project must complete COLMAP sparse reconstruction first",
+                }
+            ), 404
 
         # Start background export
         output_filename = f"{project_id}_textured_mesh_{method}.{output_format}"
 
-        thread = threading.Thread(
-            target=_run_mesh_export_background,
-            args=(project_id, method, quality, output_format),
-            daemon=True,
-        )
-        thread.start()
+        if not _start_mesh_export(
+            project_id, (project_id, method, quality, output_format)
+        ):
+            return jsonify(
+                {
+                    "error": "A mesh export is already queued or running for this project",
+                    "check_url": f"/api/project/{project_id}/available_exports",
+                }
+            ), 409
 
         logger.info(
             f"Started mesh export in background for {project_id}: {output_filename}"
@@ -2991,10 +3136,7 @@ def create_textured_mesh(project_id):
         )
 
     except Exception as e:
-        logger.error(f"Failed to start mesh export for project {project_id}: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Failed to start mesh export for project {project_id}: {e}")
         return jsonify(
             {
                 "error": str(e),
@@ -3011,13 +3153,12 @@ def cancel_project_processing(project_id):
     This will terminate the currently running process (COLMAP or OpenSplat training).
     The project status will be updated to 'cancelled'.
     """
-    if project_id not in project_store.processing_status:
+    project = project_store.processing_status.get(project_id)
+    if project is None:
         return jsonify({"error": "Project not found"}), 404
 
-    project = project_store.processing_status[project_id]
-
-    # Check if project is currently processing
-    if project["status"] != "processing":
+    # Check if project is currently processing or waiting for a pipeline slot
+    if project["status"] not in {"processing", "queued"}:
         return jsonify(
             {
                 "error": f"Project is not currently processing (status: {project['status']})",
@@ -3033,6 +3174,7 @@ def cancel_project_processing(project_id):
         success = cancel_processing(project_id)
 
         if success:
+            # A queued pipeline thread sees the cancelled status and skips the run
             return jsonify(
                 {
                     "success": True,
@@ -3051,10 +3193,7 @@ def cancel_project_processing(project_id):
             ), 404
 
     except Exception as e:
-        logger.error(f"Failed to cancel processing for project {project_id}: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Failed to cancel processing for project {project_id}: {e}")
         return jsonify({"error": f"Failed to cancel processing: {str(e)}"}), 500
 
 
@@ -3130,10 +3269,7 @@ def generate_marker_sheet_endpoint():
             )
 
     except Exception as e:
-        logger.error(f"Failed to generate marker sheet: {e}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception(f"Failed to generate marker sheet: {e}")
         return jsonify({"error": str(e)}), 500
 
 
@@ -4,7 +4,7 @@ Routes serving HTML pages and static fallbacks.
 
 from __future__ import annotations
 
-import json
+import copy
 import logging
 from typing import Callable, Optional
 
@@ -64,21 +64,26 @@ def projects_page():
     """Projects listing page."""
 
     def legacy_renderer():
+        # Only take the ordered (id, entry) pairs under the lock; the view
+        # dicts are built after releasing it.
         with project_store.status_lock:
-            projects = [
-                {
-                    "id": pid,
-                    "metadata": data["metadata"],
-                    "status": data["status"],
-                    "progress": data.get("progress", 0),
-                    "input_type": data.get("input_type", "images"),
-                    "file_count": data.get("file_count", 0),
-                    "created_at": data.get("start_time"),
-                }
-                for pid, data in project_store.processing_status.items()
+            snapshot = [
+                (pid, project_store.processing_status[pid])
+                for pid in project_store.get_project_ids_by_recency()
             ]
 
-        projects.sort(key=lambda item: item["created_at"], reverse=True)
+        projects = [
+            {
+                "id": pid,
+                "metadata": data["metadata"],
+                "status": data["status"],
+                "progress": data.get("progress", 0),
+                "input_type": data.get("input_type", "images"),
+                "file_count": data.get("file_count", 0),
+                "created_at": data.get("start_time"),
+            }
+            for pid, data in snapshot
+        ]
         return render_template("projects.html", projects=projects)
 
     return serve_frontend_page("projects.html", fallback=legacy_renderer)
@@ -108,9 +113,10 @@ def favicon_asset():
 @frontend_bp.route("/processing/<project_id>")
 def processing_page(project_id: str):
     """Dedicated processing progress view."""
+    # Deep-copy under the lock so the template never sees nested state the
+    # pipeline is mutating; the snapshot already turns the log tail into a list.
     with project_store.status_lock:
-        project = project_store.processing_status.get(project_id)
-        project_data = json.loads(json.dumps(project, default=str)) if project else None
+        project_data = copy.deepcopy(project_store.get_project_snapshot(project_id))
 
     if not project_data:
         return (
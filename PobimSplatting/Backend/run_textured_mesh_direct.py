@@ -4,6 +4,7 @@ Run textured mesh generation DIRECTLY (no interactive prompts)
 For project f487f0a3-7c6d-4524-9f7e-6c23e249142b
 """
 
+import os
 import sys
 import time
 from pathlib import Path
@@ -48,7 +49,8 @@ def main():
 
     # Count images
     images_path = project_path / "images"
-    num_images = len(list(images_path.glob("*.jpg")))
+    with os.scandir(images_path) as entries:
+        num_images = sum(1 for entry in entries if entry.name.endswith(".jpg"))
     print(f"📸 Images: {num_images}\n")
 
     # Create mesher
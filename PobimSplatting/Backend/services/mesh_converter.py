@@ -8,26 +8,309 @@ Provides multiple conversion strategies for different use cases.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import shutil
+import struct
 import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 
 import numpy as np
-from plyfile import PlyData
+from numpy.lib import recfunctions
+from plyfile import PlyData, PlyElement
 
 logger = logging.getLogger(__name__)
 
 ConversionMethod = Literal["point_cloud", "poisson", "alpha_shapes"]
-ExportFormat = Literal["gltf", "glb", "dae"]
+ExportFormat = Literal["gltf", "glb", "dae", "ply"]
+
+SH_C0 = 0.28209479177387814  # 1 / (2 * sqrt(pi))
+NORMAL_SAMPLE_SIZE = 4096
+# GLTF exports may write sidecar buffers, so only single-file outputs are cached.
+CACHEABLE_SUFFIXES = frozenset({'.glb', '.dae'})
+HASH_READ_CHUNK_SIZE = 1 << 20
+CACHE_MAX_BYTES = 1 << 30
+
+
+def _vertex_columns(vertex, names: tuple[str, ...]) -> np.ndarray:
+    """Gather named PLY vertex properties into one C-contiguous float32 (N, len(names)) array."""
+    return np.ascontiguousarray(
+        recfunctions.structured_to_unstructured(vertex.data[list(names)], dtype=np.float32)
+    )
+
+
+def _colors_to_uint8(colors: np.ndarray) -> np.ndarray:
+    """Quantize [0, 1] float colors to uint8 in one pass, without a float temporary."""
+    colors_u8 = np.empty(colors.shape, dtype=np.uint8)
+    np.multiply(colors, 255, out=colors_u8, casting='unsafe')
+    return colors_u8
+
+
+def _convex_hull_arrays(vertices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the convex hull with qhull directly.
+
+    Returns the source indices of the hull vertices and outward-wound triangle
+    faces indexing into that subset.
+    """
+    from scipy.spatial import ConvexHull
+
+    hull = ConvexHull(vertices)
+    hull_vertex_ids = hull.vertices
+    index_map = np.full(len(vertices), -1, dtype=np.int64)
+    index_map[hull_vertex_ids] = np.arange(len(hull_vertex_ids))
+    hull_vertices = vertices[hull_vertex_ids]
+    faces = index_map[hull.simplices]
+
+    # qhull doesn't orient simplices consistently; flip any whose winding
+    # disagrees with the outward facet normal.
+    corners = hull_vertices[faces]
+    winding = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    flipped = np.einsum('ij,ij->i', winding, hull.equations[:, :3]) < 0
+    faces[flipped] = faces[flipped][:, ::-1]
+    return hull_vertex_ids, faces
+
+
+def _voxel_downsample_indices(vertices: np.ndarray, voxel_size: float) -> np.ndarray:
+    """Return sorted indices keeping the first point in each occupied voxel."""
+    origin = vertices.min(axis=0)
+    cells = np.floor((vertices - origin) / voxel_size).astype(np.int64)
+    dims = cells.max(axis=0) + 1
+    keys = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+    _, first_indices = np.unique(keys, return_index=True)
+    first_indices.sort()
+    return first_indices
+
+
+def _write_point_cloud_ply(
+    output_path: Path,
+    vertices: np.ndarray,
+    colors: Optional[np.ndarray]
+) -> None:
+    """Write XYZ (+ uint8 RGB) straight to a binary PLY, dropping SH and normal fields."""
+    fields = [('x', 'f4'), ('y', 'f4'), ('z', 'f4')]
+    if colors is not None:
+        fields += [('red', 'u1'), ('green', 'u1'), ('blue', 'u1')]
+
+    cloud = np.empty(len(vertices), dtype=fields)
+    for axis, name in enumerate(('x', 'y', 'z')):
+        cloud[name] = vertices[:, axis]
+    if colors is not None:
+        colors_u8 = _colors_to_uint8(colors)
+        for channel, name in enumerate(('red', 'green', 'blue')):
+            cloud[name] = colors_u8[:, channel]
+
+    PlyData([PlyElement.describe(cloud, 'vertex')]).write(str(output_path))
+
+
+@lru_cache(maxsize=32)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    """SHA-256 of a file, rehashed only when its mtime or size changes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_READ_CHUNK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _load_gaussian_splat_ply(path: str) -> dict:
+    """Parse a splat PLY into read-only vertex, color and normal arrays."""
+    # Binary PLYs without list properties are memory-mapped
+    # (copy-on-write), so vertex fields are views into the file.
+    plydata = PlyData.read(path, mmap='c')
+    vertex = plydata['vertex']
+
+    # Extract XYZ coordinates
+    vertices = _vertex_columns(vertex, ('x', 'y', 'z'))
+
+    # Extract colors (from spherical harmonics DC component if available)
+    colors = None
+    if all(prop in vertex for prop in ['f_dc_0', 'f_dc_1', 'f_dc_2']):
+        # Convert spherical harmonics DC component to RGB
+        # DC component is in range [-1, 1], need to convert to [0, 255]
+        colors = _vertex_columns(vertex, ('f_dc_0', 'f_dc_1', 'f_dc_2'))
+
+        # Convert from SH to RGB (simplified conversion), in place
+        np.multiply(colors, 1.0 / SH_C0, out=colors)
+        np.add(colors, 0.5, out=colors)
+        np.clip(colors, 0, 1, out=colors)
+    elif all(prop in vertex for prop in ['red', 'green', 'blue']):
+        # Standard RGB colors, scaled in place like the SH branch
+        colors = _vertex_columns(vertex, ('red', 'green', 'blue'))
+        np.multiply(colors, 1.0 / 255.0, out=colors)
+
+    # Extract normals if available. Splat trainers write nx/ny/nz as
+    # zero placeholders, so only keep them when a sample is non-zero.
+    normals = None
+    if all(prop in vertex for prop in ['nx', 'ny', 'nz']) and any(
+        vertex[prop][:NORMAL_SAMPLE_SIZE].any() for prop in ('nx', 'ny', 'nz')
+    ):
+        normals = _vertex_columns(vertex, ('nx', 'ny', 'nz'))
+
+    # The converter shares parsed arrays between conversions, so keep them read-only
+    for array in (vertices, colors, normals):
+        if array is not None:
+            array.setflags(write=False)
+
+    return {
+        'vertices': vertices,
+        'colors': colors,
+        'normals': normals,
+        'vertex_count': len(vertices)
+    }
+
+
+def _write_point_cloud_glb(
+    output_path: Path,
+    vertices: np.ndarray,
+    colors: Optional[np.ndarray]
+) -> None:
+    """Write a POINTS-mode GLB straight from the position and color arrays."""
+    positions = np.ascontiguousarray(vertices, dtype=np.float32)
+    buffer_views = [{'buffer': 0, 'byteOffset': 0, 'byteLength': positions.nbytes, 'target': 34962}]
+    accessors = [{
+        'bufferView': 0,
+        'componentType': 5126,  # FLOAT
+        'count': len(positions),
+        'type': 'VEC3',
+        'min': positions.min(axis=0).tolist() if len(positions) else [0.0, 0.0, 0.0],
+        'max': positions.max(axis=0).tolist() if len(positions) else [0.0, 0.0, 0.0],
+    }]
+    attributes = {'POSITION': 0}
+    chunks = [positions]
+
+    if colors is not None:
+        # Vertex attributes must be 4-byte aligned, so colors go out as RGBA.
+        rgba = np.full((len(colors), 4), 255, dtype=np.uint8)
+        rgba[:, :3] = _colors_to_uint8(colors)
+        buffer_views.append({
+            'buffer': 0,
+            'byteOffset': positions.nbytes,
+            'byteLength': rgba.nbytes,
+            'target': 34962,
+        })
+        accessors.append({
+            'bufferView': 1,
+            'componentType': 5121,  # UNSIGNED_BYTE
+            'normalized': True,
+            'count': len(rgba),
+            'type': 'VEC4',
+        })
+        attributes['COLOR_0'] = 1
+        chunks.append(rgba)
+
+    bin_length = sum(chunk.nbytes for chunk in chunks)
+    gltf = {
+        'asset': {'version': '2.0', 'generator': 'PobimSplatting'},
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': [{'mesh': 0}],
+        'meshes': [{'primitives': [{'attributes': attributes, 'mode': 0}]}],  # POINTS
+        'buffers': [{'byteLength': bin_length}],
+        'bufferViews': buffer_views,
+        'accessors': accessors,
+    }
+    json_chunk = json.dumps(gltf, separators=(',', ':')).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    bin_padding = b'\x00' * (-bin_length % 4)
+    total_length = 12 + 8 + len(json_chunk) + 8 + bin_length + len(bin_padding)
+
+    with open(output_path, 'wb') as f:
+        f.write(struct.pack('<4sII', b'glTF', 2, total_length))
+        f.write(struct.pack('<I4s', len(json_chunk), b'JSON'))
+        f.write(json_chunk)
+        f.write(struct.pack('<I4s', bin_length + len(bin_padding), b'BIN\x00'))
+        for chunk in chunks:
+            f.write(chunk.data)
+        f.write(bin_padding)
 
 
 class MeshConverter:
     """Converts Gaussian Splat PLY files to mesh formats."""
 
-    def __init__(self):
-        """Initialize the mesh converter."""
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        cache_max_bytes: int = CACHE_MAX_BYTES
+    ):
+        """
+        Initialize the mesh converter.
+
+        Args:
+            cache_dir: Optional directory for reusing results keyed by input content
+            cache_max_bytes: Size above which the least recently used entries are pruned
+        """
         self.logger = logger
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_max_bytes = cache_max_bytes
+        # Last parsed splat, keyed on (path, mtime, size). It lives as long as
+        # this converter, so one export run parses each PLY once.
+        self._splat_lock = threading.Lock()
+        self._splat_key: Optional[tuple[str, int, int]] = None
+        self._splat_data: Optional[dict] = None
+
+    def _cached_result_path(
+        self,
+        input_path: Path,
+        output_path: Path,
+        method: str,
+        options: dict
+    ) -> Optional[Path]:
+        """Return the cache entry for this conversion, or None if caching is off."""
+        suffix = output_path.suffix.lower()
+        if self.cache_dir is None or suffix not in CACHEABLE_SUFFIXES:
+            return None
+
+        stat = input_path.stat()
+        content_digest = _file_digest(str(input_path), stat.st_mtime_ns, stat.st_size)
+        params = json.dumps({'method': method, 'options': options}, sort_keys=True, default=str)
+        key = hashlib.sha256(f"{content_digest}:{params}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}{suffix}"
+
+    def _store_cached_result(self, output_path: Path, cache_path: Path) -> None:
+        """Copy a finished conversion into the cache without exposing partial files."""
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=f".{cache_path.name}.", dir=cache_path.parent)
+            with os.fdopen(fd, 'wb') as tmp, open(output_path, 'rb') as src:
+                shutil.copyfileobj(src, tmp)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except OSError as e:
+            self.logger.warning(f"Could not cache mesh result {output_path}: {e}")
+        finally:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+        self._prune_cache(cache_path.parent)
+
+    def _prune_cache(self, cache_dir: Path) -> None:
+        """Delete least recently used cache entries until the cache fits its size cap."""
+        try:
+            with os.scandir(cache_dir) as it:
+                entries = [
+                    (entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                    for entry in it
+                    if entry.is_file() and not entry.name.startswith('.')
+                ]
+        except OSError as e:
+            self.logger.warning(f"Could not scan mesh cache {cache_dir}: {e}")
+            return
+
+        # Hits refresh an entry's mtime, so newest-first is most recently used first.
+        total = 0
+        for _, size, path in sorted(entries, reverse=True):
+            total += size
+            if total > self.cache_max_bytes:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
 
     def read_gaussian_splat_ply(self, ply_path: Path) -> dict:
         """
@@ -40,45 +323,15 @@ class MeshConverter:
             Dictionary containing vertices, colors, and other properties
         """
         try:
-            plydata = PlyData.read(str(ply_path))
-            vertex = plydata['vertex']
-
-            # Extract XYZ coordinates
-            vertices = np.vstack([vertex['x'], vertex['y'], vertex['z']]).T
-
-            # Extract colors (from spherical harmonics DC component if available)
-            colors = None
-            if all(prop in vertex for prop in ['f_dc_0', 'f_dc_1', 'f_dc_2']):
-                # Convert spherical harmonics DC component to RGB
-                # DC component is in range [-1, 1], need to convert to [0, 255]
-                sh_dc = np.vstack([
-                    vertex['f_dc_0'],
-                    vertex['f_dc_1'],
-                    vertex['f_dc_2']
-                ]).T
-
-                # Convert from SH to RGB (simplified conversion)
-                C0 = 0.28209479177387814  # 1 / (2 * sqrt(pi))
-                colors = (sh_dc / C0 + 0.5).clip(0, 1)
-            elif all(prop in vertex for prop in ['red', 'green', 'blue']):
-                # Standard RGB colors
-                colors = np.vstack([
-                    vertex['red'],
-                    vertex['green'],
-                    vertex['blue']
-                ]).T / 255.0
-
-            # Extract normals if available
-            normals = None
-            if all(prop in vertex for prop in ['nx', 'ny', 'nz']):
-                normals = np.vstack([vertex['nx'], vertex['ny'], vertex['nz']]).T
-
-            return {
-                'vertices': vertices,
-                'colors': colors,
-                'normals': normals,
-                'vertex_count': len(vertices)
-            }
+            stat = ply_path.stat()
+            key = (str(ply_path), stat.st_mtime_ns, stat.st_size)
+            with self._splat_lock:
+                if self._splat_key != key:
+                    # Drop the previous splat first so two are never held at once
+                    self._splat_key = self._splat_data = None
+                    self._splat_data = _load_gaussian_splat_ply(key[0])
+                    self._splat_key = key
+                return dict(self._splat_data)
 
         except Exception as e:
             self.logger.error(f"Failed to read PLY file {ply_path}: {e}")
@@ -95,7 +348,7 @@ class MeshConverter:
 
         Args:
             ply_path: Input PLY file path
-            output_path: Output GLTF/GLB file path
+            output_path: Output GLTF/GLB/PLY file path
             point_size: Size of points in the point cloud
 
         Returns:
@@ -107,6 +360,19 @@ class MeshConverter:
             vertices = data['vertices']
             colors = data.get('colors')
 
+            # PLY output skips trimesh and writes the kept columns directly
+            if output_path.suffix.lower() == '.ply':
+                _write_point_cloud_ply(output_path, vertices, colors)
+                self.logger.info(f"Successfully exported point cloud to {output_path}")
+                return True
+
+            # GLB is written directly from the arrays; trimesh's exporter
+            # builds and re-copies every accessor in Python first
+            if output_path.suffix.lower() == '.glb':
+                _write_point_cloud_glb(output_path, vertices, colors)
+                self.logger.info(f"Successfully exported point cloud to {output_path}")
+                return True
+
             # Import trimesh for mesh operations
             import trimesh
 
@@ -115,7 +381,7 @@ class MeshConverter:
                 # Create colored point cloud
                 point_cloud = trimesh.points.PointCloud(
                     vertices=vertices,
-                    colors=(colors * 255).astype(np.uint8)
+                    colors=_colors_to_uint8(colors)
                 )
             else:
                 point_cloud = trimesh.points.PointCloud(vertices=vertices)
@@ -161,29 +427,34 @@ class MeshConverter:
             # Read PLY data
             data = self.read_gaussian_splat_ply(ply_path)
 
-            # Create temporary PLY with normals for Poisson
-            with tempfile.NamedTemporaryFile(suffix='.ply', delete=False) as tmp:
-                tmp_ply_path = Path(tmp.name)
-
-            # If no normals, estimate them
-            if data.get('normals') is None:
-                import trimesh
-                pcd = trimesh.points.PointCloud(vertices=data['vertices'])
-                # Estimate normals using trimesh (simple approach)
-                # For better results, use Open3D or similar
-                normals = np.zeros_like(data['vertices'])
-                normals[:, 2] = 1  # Default to pointing up
-            else:
-                normals = data['normals']
-
             # Create MeshSet
             ms = pymeshlab.MeshSet()
 
-            # Load the original PLY
-            ms.load_new_mesh(str(ply_path))
-
-            # Compute normals if needed
-            ms.compute_normal_for_point_clouds(k=10, smoothiter=5)
+            # Splats over-cover surfaces, so thin the cloud to one point per
+            # cell of the Poisson octree's finest level before handing it over
+            # (instead of re-reading the whole PLY through PyMeshLab). The
+            # octree spans the largest extent grown by `scale`.
+            vertices = data['vertices']
+            leaf_size = float(np.ptp(vertices, axis=0).max()) * scale / (1 << depth)
+            if leaf_size > 0:
+                keep = _voxel_downsample_indices(vertices, leaf_size)
+            else:
+                keep = np.arange(len(vertices))
+            self.logger.info(f"Poisson input downsampled from {len(vertices)} to {len(keep)} points")
+
+            mesh_arrays = {'vertex_matrix': vertices[keep].astype(np.float64)}
+            if data.get('normals') is not None:
+                mesh_arrays['v_normals_matrix'] = data['normals'][keep].astype(np.float64)
+            if data.get('colors') is not None:
+                # PyMeshLab expects RGBA in [0, 1]
+                vertex_colors = np.ones((len(keep), 4), dtype=np.float64)
+                vertex_colors[:, :3] = data['colors'][keep]
+                mesh_arrays['v_color_matrix'] = vertex_colors
+            ms.add_mesh(pymeshlab.Mesh(**mesh_arrays))
+
+            # Compute normals if needed (zero-filled splat normals are dropped on read)
+            if data.get('normals') is None:
+                ms.compute_normal_for_point_clouds(k=10, smoothiter=5)
 
             # Apply Poisson Surface Reconstruction
             ms.generate_surface_reconstruction_screened_poisson(
@@ -208,23 +479,23 @@ class MeshConverter:
                 )
 
             # Export to desired format
-            # PyMeshLab doesn't support GLB/GLTF directly, so export to OBJ first then convert
+            # PyMeshLab doesn't support GLB/GLTF directly, so hand the mesh
+            # arrays to trimesh in memory instead of round-tripping through OBJ
             export_format = output_path.suffix.lower().replace('.', '')
 
             if export_format in ['glb', 'gltf']:
-                # Export to OBJ first
-                with tempfile.NamedTemporaryFile(suffix='.obj', delete=False) as tmp_obj:
-                    tmp_obj_path = Path(tmp_obj.name)
-
-                ms.save_current_mesh(str(tmp_obj_path))
-
-                # Convert OBJ to GLTF/GLB using trimesh
                 import trimesh
-                mesh = trimesh.load(str(tmp_obj_path))
+                result_mesh = ms.current_mesh()
+                vertex_colors = None
+                if result_mesh.has_vertex_color():
+                    vertex_colors = _colors_to_uint8(result_mesh.vertex_color_matrix())
+                mesh = trimesh.Trimesh(
+                    vertices=result_mesh.vertex_matrix(),
+                    faces=result_mesh.face_matrix(),
+                    vertex_colors=vertex_colors,
+                    process=False
+                )
                 mesh.export(str(output_path), file_type=export_format)
-
-                # Clean up temp file
-                tmp_obj_path.unlink()
             else:
                 # Direct export for supported formats (PLY, OBJ, DAE, etc.)
                 ms.save_current_mesh(str(output_path))
@@ -269,15 +540,17 @@ class MeshConverter:
             # For a full alpha shapes implementation, use scipy.spatial or CGAL
             self.logger.info("Creating convex hull approximation...")
 
-            hull = trimesh.convex.convex_hull(vertices)
+            hull_vertex_ids, hull_faces = _convex_hull_arrays(vertices)
+            hull = trimesh.Trimesh(
+                vertices=vertices[hull_vertex_ids],
+                faces=hull_faces,
+                process=False
+            )
 
-            # Apply vertex colors if available
+            # Apply vertex colors if available; hull vertices are source points,
+            # so their colors are looked up directly
             if colors is not None:
-                # Map original colors to hull vertices (nearest neighbor)
-                from scipy.spatial import cKDTree
-                tree = cKDTree(vertices)
-                distances, indices = tree.query(hull.vertices)
-                hull.visual.vertex_colors = (colors[indices] * 255).astype(np.uint8)
+                hull.visual.vertex_colors = _colors_to_uint8(colors[hull_vertex_ids])
 
             # Export
             export_format = output_path.suffix.lower().replace('.', '')
@@ -300,6 +573,7 @@ class MeshConverter:
         input_path: Path,
         output_path: Path,
         method: ConversionMethod = "point_cloud",
+        force: bool = False,
         **kwargs
     ) -> bool:
         """
@@ -309,6 +583,7 @@ class MeshConverter:
             input_path: Input PLY file
             output_path: Output file (GLTF/GLB/DAE)
             method: Conversion method to use
+            force: Re-run the conversion even if a cached result exists
             **kwargs: Additional parameters for specific methods
 
         Returns:
@@ -322,22 +597,33 @@ class MeshConverter:
         # Create output directory if needed
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        cache_path = self._cached_result_path(input_path, output_path, method, kwargs)
+        if cache_path is not None and not force:
+            try:
+                shutil.copyfile(cache_path, output_path)
+                os.utime(cache_path)
+            except FileNotFoundError:
+                pass  # Not cached yet, or pruned meanwhile
+            else:
+                self.logger.info(f"Reused cached {method} result for {input_path.name}")
+                return True
+
         # Select conversion method
         if method == "point_cloud":
-            return self.convert_to_point_cloud_gltf(
+            success = self.convert_to_point_cloud_gltf(
                 input_path,
                 output_path,
                 point_size=kwargs.get('point_size', 0.01)
             )
         elif method == "poisson":
-            return self.convert_to_poisson_mesh(
+            success = self.convert_to_poisson_mesh(
                 input_path,
                 output_path,
                 depth=kwargs.get('depth', 9),
                 scale=kwargs.get('scale', 1.1)
             )
         elif method == "alpha_shapes":
-            return self.convert_to_alpha_shapes_mesh(
+            success = self.convert_to_alpha_shapes_mesh(
                 input_path,
                 output_path,
                 alpha=kwargs.get('alpha', 0.1)
@@ -346,6 +632,10 @@ class MeshConverter:
             self.logger.error(f"Unknown conversion method: {method}")
             return False
 
+        if success and cache_path is not None and output_path.is_file():
+            self._store_cached_result(output_path, cache_path)
+        return success
+
 
 # Convenience functions
 def convert_ply_to_gltf(
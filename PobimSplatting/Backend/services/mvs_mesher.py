@@ -9,8 +9,10 @@ and meshing with texture mapping - similar to OpenDroneMap.
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 import tempfile
+from collections import deque
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -20,6 +22,20 @@ logger = logging.getLogger(__name__)
 
 MeshingMethod = Literal["poisson", "delaunay"]
 
+# Number of trailing output lines kept for error messages from child processes.
+ERROR_TAIL_LINES = 200
+
+
+def _sparse_model_signature(sparse_model_path: Path) -> str:
+    """Summarize the sparse model files so dense results can detect a re-run."""
+    with os.scandir(sparse_model_path) as entries:
+        stats = sorted(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in entries
+            if entry.is_file()
+        )
+    return repr(stats)
+
 
 class MVSMesher:
     """Creates textured mesh from COLMAP reconstruction."""
@@ -35,7 +51,6 @@ class MVSMesher:
         self.logger = logger
         
         # Setup environment for GPU-enabled COLMAP
-        import os
         self.env = os.environ.copy()
         
         # Add CUDA libraries
@@ -62,6 +77,69 @@ class MVSMesher:
         self.logger.info(f"Initialized MVSMesher with COLMAP: {colmap_executable}")
         self.logger.info(f"LD_LIBRARY_PATH: {ld_library_path}")
 
+    def _run_logged(
+        self,
+        cmd: list[str],
+        env: Optional[dict] = None
+    ) -> tuple[int, str]:
+        """
+        Run a command, streaming its merged stdout/stderr to the logger.
+
+        Only the last ERROR_TAIL_LINES lines are kept in memory so chatty
+        COLMAP runs don't buffer their whole progress output.
+
+        Returns:
+            (return code, tail of the output)
+        """
+        tail: deque[str] = deque(maxlen=ERROR_TAIL_LINES)
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=env
+        )
+        assert process.stdout is not None
+        with process.stdout:
+            for raw_line in process.stdout:
+                line = raw_line.decode('utf-8', 'replace').rstrip()
+                self.logger.debug(line)
+                tail.append(line)
+        return process.wait(), "\n".join(tail)
+
+    def _run_dense_stage(
+        self,
+        dense_path: Path,
+        stage: str,
+        cmd: list[str],
+        result_path: Path,
+        model_signature: str,
+        description: str,
+        reuse: bool
+    ) -> bool:
+        """
+        Run one dense reconstruction stage unless a matching earlier run finished.
+
+        Returns:
+            True if the stage was skipped, so the next stage may be reused too
+        """
+        stamp_path = dense_path / f".{stage}.done"
+        signature = "\n".join([model_signature, *cmd])
+        if reuse and result_path.exists():
+            try:
+                if stamp_path.read_text(encoding="utf-8") == signature:
+                    self.logger.info(f"{description}: reusing previous results in {dense_path}")
+                    return True
+            except OSError:
+                pass
+
+        stamp_path.unlink(missing_ok=True)
+        returncode, output = self._run_logged(cmd, env=self.env)
+        if returncode != 0:
+            self.logger.error(f"{description} failed: {output}")
+            raise RuntimeError(f"{description} failed: {output}")
+        stamp_path.write_text(signature, encoding="utf-8")
+        return False
+
     def run_dense_reconstruction(
         self,
         project_path: Path,
@@ -107,10 +185,18 @@ class MVSMesher:
                 "--max_image_size", str(settings["max_image_size"])
             ]
 
-            result = subprocess.run(undistort_cmd, capture_output=True, text=True, env=self.env)
-            if result.returncode != 0:
-                self.logger.error(f"Image undistortion failed: {result.stderr}")
-                raise RuntimeError(f"Image undistortion failed: {result.stderr}")
+            # Stages whose inputs and settings are unchanged since their last
+            # successful run are skipped; once one stage reruns, all later ones do.
+            model_signature = _sparse_model_signature(sparse_model_path)
+            reuse = self._run_dense_stage(
+                dense_path,
+                "undistort",
+                undistort_cmd,
+                dense_path / "images",
+                model_signature,
+                "Image undistortion",
+                True,
+            )
 
             # Step 2: Patch match stereo (dense reconstruction)
             self.logger.info("Running patch match stereo (this may take a while)...")
@@ -127,10 +213,15 @@ class MVSMesher:
             # Note: num_threads is ignored when using GPU
             # GPU processing is much faster (10-50x) than CPU
 
-            result = subprocess.run(stereo_cmd, capture_output=True, text=True, env=self.env)
-            if result.returncode != 0:
-                self.logger.error(f"Patch match stereo failed: {result.stderr}")
-                raise RuntimeError(f"Patch match stereo failed: {result.stderr}")
+            reuse = self._run_dense_stage(
+                dense_path,
+                "patch_match",
+                stereo_cmd,
+                dense_path / "stereo" / "depth_maps",
+                model_signature,
+                "Patch match stereo",
+                reuse,
+            )
 
             # Step 3: Stereo fusion (merge depth maps into point cloud)
             self.logger.info("Fusing stereo depth maps...")
@@ -142,10 +233,15 @@ class MVSMesher:
                 "--output_path", str(dense_path / "fused.ply")
             ]
 
-            result = subprocess.run(fusion_cmd, capture_output=True, text=True, env=self.env)
-            if result.returncode != 0:
-                self.logger.error(f"Stereo fusion failed: {result.stderr}")
-                raise RuntimeError(f"Stereo fusion failed: {result.stderr}")
+            self._run_dense_stage(
+                dense_path,
+                "fusion",
+                fusion_cmd,
+                dense_path / "fused.ply",
+                model_signature,
+                "Stereo fusion",
+                reuse,
+            )
 
             self.logger.info(f"Dense reconstruction completed: {dense_path}")
             return dense_path
@@ -180,9 +276,9 @@ class MVSMesher:
                 "--PoissonMeshing.trim", str(trim_value)
             ]
 
-            result = subprocess.run(poisson_cmd, capture_output=True, text=True, env=self.env)
-            if result.returncode != 0:
-                self.logger.error(f"Poisson meshing failed: {result.stderr}")
+            returncode, output = self._run_logged(poisson_cmd, env=self.env)
+            if returncode != 0:
+                self.logger.error(f"Poisson meshing failed: {output}")
                 return False
 
             self.logger.info(f"Poisson mesh created: {output_path}")
@@ -216,9 +312,9 @@ class MVSMesher:
                 "--input_type", "dense"
             ]
 
-            result = subprocess.run(delaunay_cmd, capture_output=True, text=True, env=self.env)
-            if result.returncode != 0:
-                self.logger.error(f"Delaunay meshing failed: {result.stderr}")
+            returncode, output = self._run_logged(delaunay_cmd, env=self.env)
+            if returncode != 0:
+                self.logger.error(f"Delaunay meshing failed: {output}")
                 return False
 
             self.logger.info(f"Delaunay mesh created: {output_path}")
@@ -270,16 +366,11 @@ class MVSMesher:
                     # If it's a mesh (not point cloud), use mesh normal computation
                     ms.compute_normal_per_vertex()
 
-            # Parameterization (UV mapping)
-            self.logger.info("Creating UV parameterization...")
-            try:
-                ms.compute_texcoord_parametrization_triangle_trivial_per_wedge()
-            except:
-                self.logger.warning("UV parameterization failed, skipping...")
-
             # Since we don't have camera parameters readily available for PyMeshLab,
             # we'll use vertex color from the dense point cloud
             # For proper texture mapping, we'd need to use a tool that understands COLMAP's camera params
+            # No UV parameterization is computed: without a texture image to
+            # bake, per-wedge UVs only bloat the exported OBJ.
 
             # For now, export with vertex colors
             self.logger.info(f"Exporting textured mesh to {output_path}...")
@@ -345,36 +436,20 @@ class MVSMesher:
             # Step 3: Add vertex colors from dense point cloud
             self.logger.info("Step 3/3: Adding vertex colors to mesh...")
             
-            # Import and use the add_colors_to_mesh script
-            import sys
-            from pathlib import Path as PathLib
-            add_colors_script = PathLib(__file__).parent.parent / "add_colors_to_mesh.py"
-            
-            if not add_colors_script.exists():
-                self.logger.error(f"add_colors_to_mesh.py not found at {add_colors_script}")
-                return False
-            
-            # Run the color transfer script
-            import subprocess
+            # Transfer colors in-process; spawning the script cost a fresh
+            # interpreter and re-imports of numpy/scipy/trimesh per export.
+            try:
+                from add_colors_to_mesh import transfer_colors_to_mesh
+            except ImportError:  # pragma: no cover - package import fallback
+                from ..add_colors_to_mesh import transfer_colors_to_mesh
+
             dense_ply = dense_path / "fused.ply"
-            
-            cmd = [
-                sys.executable,
-                str(add_colors_script),
-                str(temp_mesh),          # input mesh
-                str(dense_ply),          # dense point cloud with colors
-                str(output_path),        # output with desired format
-                "--format", export_format
-            ]
-            
-            self.logger.info(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode != 0:
-                self.logger.error(f"Color transfer failed: {result.stderr}")
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if not transfer_colors_to_mesh(temp_mesh, dense_ply, output_path):
+                # The cause and traceback are logged by add_colors_to_mesh
+                self.logger.error(f"Color transfer from {dense_ply} onto {temp_mesh} failed")
                 return False
             
-            self.logger.info(result.stdout)
             self.logger.info(f"✅ Textured mesh created successfully: {output_path}")
             return True
 
@@ -3,17 +3,62 @@ Smart Time Estimation Service for PobimSplats
 Calculates accurate processing time based on hardware and dataset
 """
 
+import math
+import re
 import time
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 import subprocess
 
+try:
+    import pynvml
+except ImportError:  # pragma: no cover - optional dependency
+    pynvml = None
+
 try:
     from pipeline.resource_contract import HEAVY_STAGE_KEYS
 except ImportError:  # pragma: no cover - package import fallback
     from ..pipeline.resource_contract import HEAVY_STAGE_KEYS
 
-@dataclass
+NVIDIA_PCI_VENDOR_ID = '0x10de'
+PCI_DEVICES_DIR = Path('/sys/bus/pci/devices')
+# WSL2 exposes the GPU through /dev/dxg rather than the PCI bus
+NVIDIA_DEVICE_NODES = (Path('/dev/nvidiactl'), Path('/dev/dxg'))
+
+
+def _has_nvidia_pci_device() -> Optional[bool]:
+    """Check sysfs for an NVIDIA PCI device; None when sysfs isn't available (non-Linux)."""
+    if any(node.exists() for node in NVIDIA_DEVICE_NODES):
+        return True
+    if not PCI_DEVICES_DIR.is_dir():
+        return None
+    for vendor_file in PCI_DEVICES_DIR.glob('*/vendor'):
+        try:
+            if vendor_file.read_text().strip().lower() == NVIDIA_PCI_VENDOR_ID:
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def _nvml_gpu_name() -> Optional[str]:
+    """Read GPU 0's name in-process through NVML; None when NVML isn't usable."""
+    if pynvml is None:
+        return None
+    try:
+        pynvml.nvmlInit()
+    except pynvml.NVMLError:
+        return None
+    try:
+        name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(0))
+    except pynvml.NVMLError:
+        return None
+    finally:
+        pynvml.nvmlShutdown()
+    return name.decode() if isinstance(name, bytes) else name
+
+@dataclass(slots=True)
 class TimeEstimate:
     """Time estimation data structure"""
     total_seconds: float
@@ -58,6 +103,7 @@ class SmartTimeEstimator:
             'RTX 3080': {'colmap_factor': 0.9, 'opensplat_factor': 0.8},
             'RTX 3090': {'colmap_factor': 0.7, 'opensplat_factor': 0.7},
         }
+        self._gpu_pattern = re.compile('|'.join(re.escape(name) for name in self.gpu_benchmarks))
 
         # Base time estimates (seconds) for RTX 4060 with 50 images, balanced quality
         self.base_estimates = {
@@ -77,24 +123,42 @@ class SmartTimeEstimator:
             'ultra': 4.5
         }
 
+        # OpenSplat training multipliers (iterations relative to balanced's 2000)
+        self.opensplat_quality_factors = {
+            'fast': 0.25,  # 500 iterations
+            'balanced': 1.0,
+            'high': 3.5,  # 7000 iterations
+            'ultra': 6.0  # 15000 iterations
+        }
+
+        # GPU model is static for the life of the process; detected lazily once
+        self._gpu_model: Optional[str] = None
+
     def _get_auto_tuning_snapshot(self, config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         policy = dict((config or {}).get('_auto_tuning_policy') or {})
         return dict(policy.get('active_snapshot') or {})
 
-    def detect_gpu(self) -> str:
-        """Detect GPU model from nvidia-smi"""
-        try:
-            result = subprocess.run(['nvidia-smi', '--query-gpu=name', '--format=csv,noheader,nounits'],
-                                 capture_output=True, text=True)
-            gpu_name = result.stdout.strip()
-
-            # Match to known benchmarks
-            for known_gpu in self.gpu_benchmarks:
-                if known_gpu in gpu_name:
-                    return known_gpu
+    def detect_gpu(self, force: bool = False) -> str:
+        """Detect GPU model from nvidia-smi (cached after the first call unless forced)"""
+        if self._gpu_model is None or force:
+            self._gpu_model = self._query_gpu_model()
+        return self._gpu_model
 
-            # Default to RTX 4060 if unknown
+    def _query_gpu_model(self) -> str:
+        # No NVIDIA device on the PCI bus: skip the nvidia-smi fork entirely
+        if _has_nvidia_pci_device() is False:
             return 'RTX 4060'
+        try:
+            # NVML is an in-process call; fall back to forking nvidia-smi
+            gpu_name = _nvml_gpu_name()
+            if gpu_name is None:
+                result = subprocess.run(['nvidia-smi', '--query-gpu=name', '--format=csv,noheader,nounits'],
+                                     capture_output=True, text=True)
+                gpu_name = result.stdout.strip()
+
+            # Match to known benchmarks, defaulting to RTX 4060 if unknown
+            match = self._gpu_pattern.search(gpu_name)
+            return match.group(0) if match else 'RTX 4060'
         except:
             return 'RTX 4060'
 
@@ -131,7 +195,6 @@ class SmartTimeEstimator:
             image_factor = 2.5 + (num_images - 200) / 300 * 1.0  # 2.5 to 3.5
         else:
             # Logarithmic scaling for very large datasets
-            import math
             image_factor = 3.5 + math.log10(num_images / 500) * 2
 
         stage_estimates = {}
@@ -141,15 +204,9 @@ class SmartTimeEstimator:
             stage_estimates['video_extraction'] = self.base_estimates['video_extraction'] * num_videos
 
         # COLMAP stages
-        stage_estimates['feature_extraction'] = (
-            self.base_estimates['feature_extraction'] *
-            image_factor * gpu_factors['colmap_factor'] * quality_factor
-        )
-
-        stage_estimates['feature_matching'] = (
-            self.base_estimates['feature_matching'] *
-            image_factor * gpu_factors['colmap_factor'] * quality_factor
-        )
+        colmap_scale = image_factor * gpu_factors['colmap_factor'] * quality_factor
+        stage_estimates['feature_extraction'] = self.base_estimates['feature_extraction'] * colmap_scale
+        stage_estimates['feature_matching'] = self.base_estimates['feature_matching'] * colmap_scale
 
         stage_estimates['sparse_reconstruction'] = (
             self.base_estimates['sparse_reconstruction'] *
@@ -159,16 +216,10 @@ class SmartTimeEstimator:
         stage_estimates['model_conversion'] = self.base_estimates['model_conversion']
 
         # OpenSplat training (most affected by quality)
-        opensplat_base = self.base_estimates['gaussian_splatting']
-        if quality_mode == 'ultra':
-            opensplat_base *= 6  # 15000 vs 2000 iterations
-        elif quality_mode == 'high':
-            opensplat_base *= 3.5  # 7000 vs 2000 iterations
-        elif quality_mode == 'fast':
-            opensplat_base *= 0.25  # 500 vs 2000 iterations
-
         stage_estimates['gaussian_splatting'] = (
-            opensplat_base * gpu_factors['opensplat_factor']
+            self.base_estimates['gaussian_splatting'] *
+            self.opensplat_quality_factors.get(quality_mode, 1.0) *
+            gpu_factors['opensplat_factor']
         )
 
         total_seconds = sum(stage_estimates.values())
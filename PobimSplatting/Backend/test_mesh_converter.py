@@ -17,14 +17,13 @@ def test_conversion():
 
     # Find a sample PLY file
     results_folder = backend_path / "results"
-    ply_files = list(results_folder.rglob("*.ply"))
+    # Stop at the first PLY instead of walking the whole results tree
+    test_ply = next(results_folder.rglob("*.ply"), None)
 
-    if not ply_files:
+    if test_ply is None:
         print("❌ No PLY files found in results folder")
         return False
 
-    # Use the first PLY file
-    test_ply = ply_files[0]
     print(f"📦 Testing with: {test_ply.name}")
     print(f"   Size: {test_ply.stat().st_size / (1024*1024):.2f} MB")
 
@@ -34,59 +33,31 @@ def test_conversion():
 
     converter = MeshConverter()
 
-    # Test 1: Point Cloud to GLB
-    print("\n🧪 Test 1: Point Cloud → GLB")
-    output_glb = test_output_dir / "test_pointcloud.glb"
-    success = converter.convert(
-        test_ply,
-        output_glb,
-        method="point_cloud"
-    )
-    if success and output_glb.exists():
-        print(f"   ✅ Success! Output: {output_glb.stat().st_size / (1024*1024):.2f} MB")
-    else:
-        print("   ❌ Failed")
-
-    # Test 2: Point Cloud to GLTF
-    print("\n🧪 Test 2: Point Cloud → GLTF")
-    output_gltf = test_output_dir / "test_pointcloud.gltf"
-    success = converter.convert(
-        test_ply,
-        output_gltf,
-        method="point_cloud"
-    )
-    if success and output_gltf.exists():
-        print(f"   ✅ Success! Output: {output_gltf.stat().st_size / (1024):.2f} KB")
-    else:
-        print("   ❌ Failed")
-
-    # Test 3: Alpha Shapes to GLB
-    print("\n🧪 Test 3: Alpha Shapes (Convex Hull) → GLB")
-    output_alpha = test_output_dir / "test_alpha.glb"
-    success = converter.convert(
-        test_ply,
-        output_alpha,
-        method="alpha_shapes"
-    )
-    if success and output_alpha.exists():
-        print(f"   ✅ Success! Output: {output_alpha.stat().st_size / (1024*1024):.2f} MB")
-    else:
-        print("   ❌ Failed")
-
-    # Test 4: Poisson to GLB (may take longer)
-    print("\n🧪 Test 4: Poisson Surface Reconstruction → GLB")
-    print("   (This may take a while...)")
-    output_poisson = test_output_dir / "test_poisson.glb"
-    success = converter.convert(
-        test_ply,
-        output_poisson,
-        method="poisson",
-        depth=8  # Lower depth for faster testing
-    )
-    if success and output_poisson.exists():
-        print(f"   ✅ Success! Output: {output_poisson.stat().st_size / (1024*1024):.2f} MB")
-    else:
-        print("   ❌ Failed (this is expected if PyMeshLab has issues)")
+    # (title, output file, method, options, size unit, failure note)
+    tests = [
+        ("Test 1: Point Cloud → GLB", test_output_dir / "test_pointcloud.glb",
+         "point_cloud", {}, "MB", ""),
+        ("Test 2: Point Cloud → GLTF", test_output_dir / "test_pointcloud.gltf",
+         "point_cloud", {}, "KB", ""),
+        ("Test 3: Alpha Shapes (Convex Hull) → GLB", test_output_dir / "test_alpha.glb",
+         "alpha_shapes", {}, "MB", ""),
+        # Lower depth for faster testing
+        ("Test 4: Poisson Surface Reconstruction → GLB", test_output_dir / "test_poisson.glb",
+         "poisson", {"depth": 8}, "MB", " (this is expected if PyMeshLab has issues)"),
+    ]
+
+    # Run one at a time: concurrent conversions would each parse the PLY,
+    # and PyMeshLab is not known to be safe alongside trimesh/qhull threads.
+    for title, output_path, method, options, unit, failure_note in tests:
+        print(f"\n🧪 {title}")
+        if method == "poisson":
+            print("   (This may take a while...)")
+        success = converter.convert(test_ply, output_path, method=method, **options)
+        if success and output_path.exists():
+            divisor = 1024 * 1024 if unit == "MB" else 1024
+            print(f"   ✅ Success! Output: {output_path.stat().st_size / divisor:.2f} {unit}")
+        else:
+            print(f"   ❌ Failed{failure_note}")
 
     print(f"\n📁 Test outputs saved to: {test_output_dir}")
     print("\n✨ Testing complete!")
@@ -187,7 +187,7 @@ class PipelineStageSmokeTests(unittest.TestCase):
                 return None
             return _inner
 
-        with mock.patch.object(runner.os, 'listdir', return_value=['a.jpg', 'b.jpg']), mock.patch.object(
+        with mock.patch.object(runner, 'count_image_files', return_value=2), mock.patch.object(
             runner,
             'get_colmap_config',
             return_value={'matcher_type': 'sequential'},
@@ -304,7 +304,7 @@ class PipelineStageSmokeTests(unittest.TestCase):
             'runtime_summary': 'GPU dense BA (DENSE_SCHUR)',
             'detail': 'Dense GPU BA is active for this mapper run.',
         }
-        sparse_tracker = {}
+        sparse_tracker = stage_sparse._SparseTracker()
 
         with mock.patch.object(stage_sparse, 'append_log_line') as append_log_line:
             handled = stage_sparse._maybe_log_colmap_ba_runtime_event(
@@ -656,5 +656,67 @@ class PipelineStageSmokeTests(unittest.TestCase):
         )
 
 
+    def test_opensplat_refinement_params_follow_quality_mode(self):
+        self.assertIsNone(
+            stage_training._build_opensplat_refinement_params('fast', {}, {})
+        )
+
+        ultra = stage_training._build_opensplat_refinement_params(
+            'ultra', {'densify_grad_threshold': 0.0001}, {}
+        )
+        self.assertEqual(ultra['densify_grad_threshold'], 0.0001)
+        self.assertEqual(ultra['refine_every'], 50)
+        self.assertEqual(ultra['reset_alpha_every'], 20)
+
+        custom = stage_training._build_opensplat_refinement_params(
+            'custom',
+            {'densify_grad_threshold': 0.00015},
+            {'refine_every': 40, 'warmup_length': None, 'ssim_weight': 0.4},
+        )
+        self.assertEqual(custom['densify_grad_threshold'], 0.00015)
+        self.assertEqual(custom['refine_every'], 40)
+        self.assertEqual(custom['warmup_length'], 750)
+        self.assertEqual(custom['ssim_weight'], 0.4)
+        self.assertIsNone(custom['reset_alpha_every'])
+
+    def test_training_progress_handler_skips_repeated_iterations(self):
+        with mock.patch.object(stage_training, 'emit_stage_progress') as emit_progress, mock.patch.object(
+            stage_training,
+            'update_state',
+        ), mock.patch.object(
+            stage_training,
+            'update_stage_detail',
+        ), mock.patch.object(
+            stage_training,
+            'append_log_line',
+        ):
+            handler, progress = stage_training.make_training_progress_handler('project', 100)
+            handler('Added new count 5000')
+            handler('Step 10/100')
+            handler('Step 10/100')
+            handler('Iteration 50 finished')
+
+        self.assertEqual([c.args[2] for c in emit_progress.call_args_list], [10, 50])
+        self.assertEqual(progress.current, 50)
+        self.assertEqual(progress.splats, {'current': 5000, 'max': 5000})
+
+    def test_training_progress_handler_prefers_earlier_iteration_format(self):
+        with mock.patch.object(stage_training, 'emit_stage_progress') as emit_progress, mock.patch.object(
+            stage_training,
+            'update_state',
+        ), mock.patch.object(
+            stage_training,
+            'update_stage_detail',
+        ), mock.patch.object(
+            stage_training,
+            'append_log_line',
+        ):
+            handler, progress = stage_training.make_training_progress_handler('project', 100)
+            # "Epoch 1/3" comes first in the line but Step outranks Epoch.
+            handler('Epoch 1/3 loss=0.12 Step 20/100')
+
+        self.assertEqual([c.args[2] for c in emit_progress.call_args_list], [20])
+        self.assertEqual((progress.current, progress.total), (20, 100))
+
 if __name__ == '__main__':
     unittest.main()
@@ -263,6 +263,21 @@ def ffmpeg_supports_fps_mode() -> bool:
     return _FFMPEG_FPS_MODE_SUPPORTED
 
 
+FFMPEG_MAX_THREADS_PER_WORKER = 8
+
+
+def get_ffmpeg_thread_count(extraction_config: Dict[str, Any], workers: int = 1) -> int:
+    """Return the -threads value for one ffmpeg process (0 lets ffmpeg decide)."""
+    requested = int(extraction_config.get('ffmpeg_threads') or 0)
+    if requested > 0:
+        return requested
+    if workers <= 1:
+        return 0
+    # Split the cores between chunk workers; decode gains taper off past ~8.
+    cpu_count = os.cpu_count() or 4
+    return max(1, min(FFMPEG_MAX_THREADS_PER_WORKER, cpu_count // workers))
+
+
 def get_ffmpeg_vfr_args() -> List[str]:
     """Return frame sync args supported by the installed ffmpeg."""
     if ffmpeg_supports_fps_mode():
@@ -622,7 +637,7 @@ class VideoProcessor:
             'ffmpeg', '-y',
             '-hide_banner',
             '-loglevel', 'error',
-            '-threads', '0',
+            '-threads', str(get_ffmpeg_thread_count(extraction_config)),
             '-i', str(video_path),
         ]
 
@@ -748,6 +763,8 @@ class VideoProcessor:
         if target_width != width or target_height != height:
             scale_filter = f"scale={target_width}:{target_height}"
 
+        ffmpeg_threads = str(get_ffmpeg_thread_count(extraction_config, workers=chunk_count))
+
         logger.info(f"Launching {chunk_count} parallel ffmpeg worker(s) for CPU extraction")
 
         def run_chunk(chunk_index: int):
@@ -765,7 +782,7 @@ class VideoProcessor:
                 'ffmpeg', '-y',
                 '-hide_banner',
                 '-loglevel', 'error',
-                '-threads', '0',
+                '-threads', ffmpeg_threads,
                 '-ss', f"{start_time:.6f}",
                 '-t', f"{chunk_duration:.6f}",
                 '-i', str(video_path),
@@ -2287,8 +2304,7 @@ class VideoProcessor:
         if smart_selection:
             candidate_count = min(total_frames, max_frames * oversample_factor)
         if total_frames > candidate_count:
-            select_interval = max(1, int(total_frames / candidate_count))
-            sampling_filter = f"select='not(mod(n\\,{select_interval}))'"
+            sampling_filter = self._build_even_select_filter(total_frames, candidate_count)
         else:
             sampling_filter = None
         return {
@@ -2305,6 +2321,19 @@ class VideoProcessor:
             'adaptive_frame_budget': adaptive_budget,
         }
 
+    @staticmethod
+    def _build_even_select_filter(total_frames: int, count: int) -> str:
+        """Return an ffmpeg select filter keeping exactly ``count`` evenly spaced frames.
+
+        Frame n is kept when some k has round(k * spacing) == n, i.e. the same
+        positions as np.linspace(0, total_frames - 1, count), so the single
+        ffmpeg pass never encodes frames that are only deleted afterwards.
+        """
+        if count <= 1:
+            return "select='eq(n\\,0)'"
+        spacing = (total_frames - 1) / (count - 1)
+        return f"select='lt(ceil((n-0.5)/{spacing!r})\\,(n+0.5)/{spacing!r})'"
+
     def _estimate_candidate_source_indices(
         self,
         total_frames: int,